@@ -7,9 +7,15 @@ from pyinaturalist.client import iNatClient
 from pyinaturalist.constants import *
 from pyinaturalist.formatters import enable_logging, format_table, pprint, pprint_tree
 from pyinaturalist.models import *
-from pyinaturalist.paginator import Paginator, IDPaginator, WrapperPaginator
+from pyinaturalist.paginator import Paginator, IDPaginator, WrapperPaginator, iter_all
 from pyinaturalist.request_params import get_interval_ranges
-from pyinaturalist.session import ClientSession, FileLockSQLiteBucket, clear_cache
+from pyinaturalist.sync import ObservationStore, SyncResult
+from pyinaturalist.session import (
+    AsyncClientSession,
+    ClientSession,
+    FileLockSQLiteBucket,
+    clear_cache,
+)
 from pyinaturalist.v0 import *
 from pyinaturalist.v1 import *
 
@@ -0,0 +1,692 @@
+"""Cache backends and storage classes used by :py:class:`.ClientSession`.
+
+Cached responses are kept in two tiers:
+
+* A bounded in-memory LRU cache of deserialized responses, limited by number of responses and total
+  response size
+* A persistent backend, which is only read on a miss in the memory tier. This may be any of the
+  backends in :py:data:`CACHE_BACKENDS`, or any other requests-cache backend.
+
+Both tiers use the same cache keys and expiration settings (see :py:data:`.CACHE_EXPIRATION`). All
+writes and deletes go through both tiers, so the memory tier never contains a response that was
+replaced or removed from the persistent backend by the same session.
+
+Responses in the persistent backend may optionally be compressed with zstd or gzip (see
+:py:func:`.compressed_serializer`).
+"""
+
+import gzip
+import pickle
+from collections import OrderedDict
+from copy import copy
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+from threading import Event, RLock, Thread, local
+from time import perf_counter, time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from requests.structures import CaseInsensitiveDict
+from requests_cache import BaseCache, CachedHTTPResponse, CachedResponse, init_backend
+from requests_cache.backends.base import BaseStorage
+from requests_cache.serializers import CattrStage, SerializerPipeline, Stage
+
+from pyinaturalist.constants import (
+    CACHE_DIR,
+    CACHE_FILE,
+    CACHE_NAMESPACE,
+    CACHE_PRUNE_INTERVAL,
+    CACHE_VACUUM_PAGES,
+    COMPRESSION_DICT_SIZE,
+    MEMORY_CACHE_MAX_BYTES,
+    MEMORY_CACHE_MAX_ENTRIES,
+    FileOrPath,
+)
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None  # type: ignore
+
+# Persistent cache backends that can be selected by name
+CACHE_BACKENDS = ['sqlite', 'sqlite_wal', 'filesystem', 'memory', 'redis']
+CacheBackend = Union[str, BaseCache]
+# Orders in which CachePruner evicts responses: least recently used, or soonest to expire
+EVICTION_POLICIES = ['lru', 'expires']
+# Compression formats for cached responses, with the magic bytes used to identify them
+COMPRESSION_FORMATS = {'zstd': b'\x28\xb5\x2f\xfd', 'gzip': b'\x1f\x8b'}
+CompressionDict = Union[bytes, str, Path]
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class CacheStats:
+    """Hit and miss counts for each cache tier, and compression stats for the persistent cache
+
+    Args:
+        memory_hits: Number of responses found in the in-memory cache
+        memory_misses: Number of responses not found in the in-memory cache
+        backend_hits: Number of responses found in the persistent cache backend (after a memory miss)
+        backend_misses: Number of responses not found in either cache tier
+        memory_entries: Current number of responses in the in-memory cache
+        memory_bytes: Current total size of response content in the in-memory cache
+        memory_evictions: Number of responses removed from the in-memory cache to stay within limits
+        uncompressed_bytes: Total size of serialized responses written, before compression
+        compressed_bytes: Total size of serialized responses written, after compression
+        decompressions: Number of compressed responses read
+        decompress_seconds: Total time spent decompressing responses
+        expired_removed: Number of expired responses removed by :py:class:`.CachePruner`
+        evictions: Number of unexpired responses removed by :py:class:`.CachePruner` to stay within
+            the max cache size
+        backend_bytes: Total size of responses in the persistent cache, as of the last prune
+    """
+
+    memory_hits: int = 0
+    memory_misses: int = 0
+    backend_hits: int = 0
+    backend_misses: int = 0
+    memory_entries: int = 0
+    memory_bytes: int = 0
+    memory_evictions: int = 0
+    uncompressed_bytes: int = 0
+    compressed_bytes: int = 0
+    decompressions: int = 0
+    decompress_seconds: float = 0.0
+    expired_removed: int = 0
+    evictions: int = 0
+    backend_bytes: int = 0
+
+    @property
+    def hits(self) -> int:
+        """Total number of responses found in either tier"""
+        return self.memory_hits + self.backend_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups that were found in either tier"""
+        lookups = self.memory_hits + self.memory_misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def compression_ratio(self) -> float:
+        """Ratio of uncompressed to compressed size of responses written"""
+        return self.uncompressed_bytes / self.compressed_bytes if self.compressed_bytes else 0.0
+
+    @property
+    def avg_decompress_ms(self) -> float:
+        """Average time spent decompressing a response, in milliseconds"""
+        return self.decompress_seconds * 1000 / self.decompressions if self.decompressions else 0.0
+
+
+class StorageWrapper(BaseStorage):
+    """Base class for response storage that wraps another storage backend, and passes through any
+    methods and attributes that aren't overridden (like ``SQLiteDict.db_path``)
+
+    Args:
+        backend: Response storage to wrap
+    """
+
+    def __init__(self, backend: BaseStorage):
+        # Note: BaseStorage.__init__() is skipped, since serialization is handled by the backend
+        self.backend = backend
+        self.serializer = backend.serializer
+
+    def __getitem__(self, key: str) -> CachedResponse:
+        return self.backend[key]
+
+    def __setitem__(self, key: str, value: CachedResponse):
+        self.backend[key] = value
+
+    def __delitem__(self, key: str):
+        del self.backend[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.backend)
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+    def __contains__(self, key) -> bool:
+        return key in self.backend
+
+    def __getattr__(self, name: str):
+        if name == 'backend':
+            raise AttributeError(name)
+        return getattr(self.backend, name)
+
+    # Bulk reads go directly to the backend, so they don't affect any per-response state in wrappers
+    # (like LRU order or hit counts)
+    def items(self):
+        return self.backend.items()
+
+    def values(self):
+        return self.backend.values()
+
+    def bulk_delete(self, keys: Iterable[str]):
+        self.backend.bulk_delete(keys)
+
+    def clear(self):
+        self.backend.clear()
+
+    def close(self):
+        self.backend.close()
+
+    def serialize(self, value):
+        return self.backend.serialize(value)
+
+    def deserialize(self, key, value):
+        return self.backend.deserialize(key, value)
+
+    def __str__(self):
+        return f'<{self.__class__.__name__}(backend={self.backend})>'
+
+
+class MemoryTierStorage(StorageWrapper):
+    """Response storage with an in-memory LRU cache in front of another storage backend. This
+    wraps the ``responses`` storage of a requests-cache backend, so it can be used with any backend.
+
+    Responses returned from the memory tier are copies, so changes to a returned response (for
+    example, replacing its ``json()`` method after decoding) don't affect the cached response.
+
+    Args:
+        backend: Persistent storage for cached responses
+        max_entries: Maximum number of responses to keep in memory
+        max_bytes: Maximum total size of response content to keep in memory
+        stats: Stats object to update, if shared with other cache components
+    """
+
+    def __init__(
+        self,
+        backend: BaseStorage,
+        max_entries: int = MEMORY_CACHE_MAX_ENTRIES,
+        max_bytes: int = MEMORY_CACHE_MAX_BYTES,
+        stats: Optional[CacheStats] = None,
+    ):
+        super().__init__(backend)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = stats or CacheStats()
+        self._lock = RLock()
+        self._responses: OrderedDict[str, Tuple[CachedResponse, int]] = OrderedDict()
+
+    def __getitem__(self, key: str) -> CachedResponse:
+        with self._lock:
+            item = self._responses.get(key)
+            if item is not None:
+                self._responses.move_to_end(key)
+                self.stats.memory_hits += 1
+                return _copy_response(item[0])
+            self.stats.memory_misses += 1
+
+        # Note: the backend may return None if a response couldn't be deserialized
+        response = self.backend.get(key)
+        with self._lock:
+            if response is None:
+                self.stats.backend_misses += 1
+                raise KeyError(key)
+            self.stats.backend_hits += 1
+        self._add(key, response)
+        return _copy_response(response)
+
+    def __setitem__(self, key: str, value: CachedResponse):
+        self.backend[key] = value
+        self._add(key, value)
+
+    def __delitem__(self, key: str):
+        self._discard(key)
+        del self.backend[key]
+
+    def __contains__(self, key) -> bool:
+        return key in self._responses or key in self.backend
+
+    def bulk_delete(self, keys: Iterable[str]):
+        keys = list(keys)
+        for key in keys:
+            self._discard(key)
+        self.backend.bulk_delete(keys)
+
+    def clear(self):
+        self.clear_memory()
+        self.backend.clear()
+
+    def clear_memory(self):
+        """Remove all responses from the in-memory cache only"""
+        with self._lock:
+            self._responses.clear()
+            self.stats.memory_entries = self.stats.memory_bytes = 0
+
+    def close(self):
+        self.clear_memory()
+        self.backend.close()
+
+    def _add(self, key: str, response: CachedResponse):
+        """Add or replace a response in the memory tier, and evict least recently used responses to
+        stay within size limits
+        """
+        size = len(response._content or b'')
+        if self.max_entries <= 0 or size > self.max_bytes:
+            self._discard(key)
+            return
+
+        with self._lock:
+            self._discard(key)
+            self._responses[key] = (response, size)
+            self.stats.memory_entries += 1
+            self.stats.memory_bytes += size
+            while (
+                self.stats.memory_entries > self.max_entries
+                or self.stats.memory_bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._responses.popitem(last=False)
+                self.stats.memory_entries -= 1
+                self.stats.memory_bytes -= evicted_size
+                self.stats.memory_evictions += 1
+
+    def _discard(self, key: str):
+        with self._lock:
+            item = self._responses.pop(key, None)
+            if item is not None:
+                self.stats.memory_entries -= 1
+                self.stats.memory_bytes -= item[1]
+
+
+class AccessLogStorage(StorageWrapper):
+    """Response storage that records when each response was last read or written, for least
+    recently used eviction by :py:class:`.CachePruner`. Access times are kept in memory until they
+    are flushed to the database.
+    """
+
+    def __init__(self, backend: BaseStorage):
+        super().__init__(backend)
+        self.accessed: Dict[str, float] = {}
+        self._lock = RLock()
+
+    def __getitem__(self, key: str) -> CachedResponse:
+        response = self.backend[key]
+        with self._lock:
+            self.accessed[key] = time()
+        return response
+
+    def __setitem__(self, key: str, value: CachedResponse):
+        self.backend[key] = value
+        with self._lock:
+            self.accessed[key] = time()
+
+    def pop_accessed(self) -> Dict[str, float]:
+        """Get and reset access times recorded since the last call"""
+        with self._lock:
+            accessed, self.accessed = self.accessed, {}
+        return accessed
+
+
+class CachePruner:
+    """Keeps a SQLite cache from growing without bound. Each time it runs, it:
+
+    * Removes expired responses
+    * If the cache is still over ``max_size``, removes the least recently used or soonest to expire
+      responses until it's under the limit
+    * Releases up to ``vacuum_pages`` pages of unused space in the database file (using
+      `incremental vacuum <https://www.sqlite.org/pragma.html#pragma_incremental_vacuum>`_), so disk
+      usage goes down gradually, without long pauses for a full ``VACUUM``
+
+    This can be run manually with :py:meth:`prune`, or periodically in a background thread with
+    :py:meth:`start`. The first run converts the database to incremental vacuum mode, if needed,
+    which requires a one-time full ``VACUUM``.
+
+    For least recently used eviction, the cache's response storage must be wrapped in an
+    :py:class:`.AccessLogStorage`. Access times are saved to the database on each run, and responses
+    without any recorded access (for example, from before pruning was enabled) are evicted first.
+
+    Args:
+        cache: SQLite cache backend to prune
+        max_size: Max total size of cached responses, in bytes. If not set, only expired responses
+            are removed.
+        eviction: Which responses to remove first when over ``max_size``: ``lru`` for least
+            recently used, or ``expires`` for soonest to expire
+        interval: Seconds between each run in the background thread
+        vacuum_pages: Max number of unused database pages to release per run
+        stats: Stats object to update with the number of responses removed and total cache size
+    """
+
+    def __init__(
+        self,
+        cache: BaseCache,
+        max_size: Optional[int] = None,
+        eviction: str = 'lru',
+        interval: float = CACHE_PRUNE_INTERVAL,
+        vacuum_pages: int = CACHE_VACUUM_PAGES,
+        stats: Optional[CacheStats] = None,
+    ):
+        if not hasattr(cache.responses, 'table_name'):
+            raise ValueError('Cache pruning is only supported for SQLite cache backends')
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f'Invalid eviction policy: {eviction}. Options: {EVICTION_POLICIES}')
+
+        self.cache = cache
+        self.max_size = max_size
+        self.eviction = eviction
+        self.interval = interval
+        self.vacuum_pages = vacuum_pages
+        self.stats = stats or CacheStats()
+        self._initialized = False
+        self._stop = Event()
+        self._thread: Optional[Thread] = None
+
+    @property
+    def responses(self) -> Any:
+        """SQLite response storage, possibly wrapped by other storage classes"""
+        return self.cache.responses
+
+    @property
+    def table_name(self) -> str:
+        return self.responses.table_name
+
+    @property
+    def access_table_name(self) -> str:
+        return f'{self.table_name}_accessed'
+
+    def start(self):
+        """Start pruning the cache periodically in a background thread"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background thread, if running"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def prune(self) -> int:
+        """Remove expired responses and evict responses over the max cache size, if any
+
+        Returns:
+            Number of responses removed
+        """
+        self._init_db()
+        self._save_access_times()
+
+        with self.responses.connection() as con:
+            expired_keys = [
+                row[0]
+                for row in con.execute(
+                    f'SELECT key FROM {self.table_name} WHERE expires <= ?', (round(time()),)
+                )
+            ]
+        self._delete(expired_keys)
+        self.stats.expired_removed += len(expired_keys)
+
+        evict_keys = self._get_keys_to_evict()
+        self._delete(evict_keys)
+        self.stats.evictions += len(evict_keys)
+
+        with self.responses.connection(commit=True) as con:
+            con.execute(
+                f'DELETE FROM {self.access_table_name} '
+                f'WHERE key NOT IN (SELECT key FROM {self.table_name})'
+            )
+            # Note: executescript() is needed to run all steps of incremental_vacuum
+            con.executescript(f'PRAGMA incremental_vacuum({self.vacuum_pages});')
+
+        n_removed = len(expired_keys) + len(evict_keys)
+        logger.debug(
+            f'Removed {len(expired_keys)} expired and {len(evict_keys)} evicted responses from cache'
+        )
+        return n_removed
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.prune()
+            except Exception:
+                logger.exception('Failed to prune cache')
+            self._stop.wait(self.interval)
+
+    def _init_db(self):
+        """Create a table for access times, and switch to incremental vacuum mode if needed"""
+        if self._initialized:
+            return
+        with self.responses.connection(commit=True) as con:
+            con.execute(
+                f'CREATE TABLE IF NOT EXISTS {self.access_table_name} '
+                '(key TEXT PRIMARY KEY, accessed REAL)'
+            )
+        with self.responses.connection(commit=True) as con:
+            if con.execute('PRAGMA auto_vacuum').fetchone()[0] != 2:
+                logger.info('Converting cache to incremental vacuum mode')
+                con.execute('PRAGMA auto_vacuum = INCREMENTAL')
+                con.execute('VACUUM')
+        self._initialized = True
+
+    def _save_access_times(self):
+        if not isinstance(self.responses, AccessLogStorage):
+            return
+        accessed = self.responses.pop_accessed()
+        with self.responses.connection(commit=True) as con:
+            con.executemany(
+                f'INSERT OR REPLACE INTO {self.access_table_name} (key, accessed) VALUES (?, ?)',
+                accessed.items(),
+            )
+
+    def _get_keys_to_evict(self) -> List[str]:
+        """Get keys of responses to remove to get under the max cache size, in eviction order"""
+        with self.responses.connection() as con:
+            total_size = con.execute(
+                f'SELECT COALESCE(SUM(LENGTH(value)), 0) FROM {self.table_name}'
+            ).fetchone()[0]
+            self.stats.backend_bytes = total_size
+            if not self.max_size or total_size <= self.max_size:
+                return []
+
+            if self.eviction == 'lru':
+                query = (
+                    f'SELECT r.key, LENGTH(r.value) FROM {self.table_name} r '
+                    f'LEFT JOIN {self.access_table_name} a ON r.key = a.key '
+                    'ORDER BY COALESCE(a.accessed, 0)'
+                )
+            else:
+                query = (
+                    f'SELECT key, LENGTH(value) FROM {self.table_name} '
+                    'ORDER BY expires IS NULL, expires'
+                )
+
+            keys = []
+            for key, size in con.execute(query):
+                if total_size <= self.max_size:
+                    break
+                keys.append(key)
+                total_size -= size
+
+        self.stats.backend_bytes = total_size
+        return keys
+
+    def _delete(self, keys: List[str]):
+        """Delete responses through the cache's response storage, so any in-memory copies are also
+        removed
+        """
+        if keys:
+            self.cache.delete(*keys, vacuum=False)  # type: ignore
+
+
+def _copy_response(response: CachedResponse) -> CachedResponse:
+    """Make a shallow copy of a cached response, with its own headers and raw response stream"""
+    response_copy = copy(response)
+    response_copy.headers = CaseInsensitiveDict(response.headers)
+    response_copy.raw = CachedHTTPResponse.from_cached_response(response_copy)
+    return response_copy
+
+
+class CompressionStage(Stage):
+    """Serializer stage that compresses serialized responses. Uncompressed responses (for example,
+    from a cache created before compression was enabled) are passed through as-is when reading.
+
+    Args:
+        compression: Compression format to use: ``zstd`` (requires ``zstandard``) or ``gzip``
+        level: Compression level; defaults to 3 for zstd, and 6 for gzip
+        dictionary: Optional zstd dictionary (see :py:func:`.train_compression_dict`), as bytes or a
+            file path. Responses must be read with the same dictionary they were written with.
+        stats: Stats object to update with compression ratio and decompression time
+    """
+
+    def __init__(
+        self,
+        compression: str = 'zstd',
+        level: Optional[int] = None,
+        dictionary: Optional[CompressionDict] = None,
+        stats: Optional[CacheStats] = None,
+    ):
+        if compression not in COMPRESSION_FORMATS:
+            raise ValueError(
+                f'Invalid compression format: {compression}. Options: {list(COMPRESSION_FORMATS)}'
+            )
+        if compression == 'zstd' and zstandard is None:
+            raise ImportError(
+                'zstd compression requires zstandard. To install: pip install zstandard'
+            )
+        if dictionary is not None and compression != 'zstd':
+            raise ValueError('Compression dictionaries are only supported for zstd')
+        if isinstance(dictionary, (str, Path)):
+            dictionary = Path(dictionary).expanduser().read_bytes()
+
+        self.compression = compression
+        self.level = level or (3 if compression == 'zstd' else 6)
+        self.dictionary = dictionary
+        self.stats = stats or CacheStats()
+        self._lock = RLock()
+        # zstandard compressor objects can't be used by multiple threads at once
+        self._local = local()
+        super().__init__(dumps=self.compress, loads=self.decompress)
+
+    def compress(self, value: bytes) -> bytes:
+        if self.compression == 'zstd':
+            compressed = self._zstd_compressor().compress(value)
+        else:
+            compressed = gzip.compress(value, compresslevel=self.level, mtime=0)
+        with self._lock:
+            self.stats.uncompressed_bytes += len(value)
+            self.stats.compressed_bytes += len(compressed)
+        return compressed
+
+    def decompress(self, value: bytes) -> bytes:
+        start = perf_counter()
+        if value.startswith(COMPRESSION_FORMATS['zstd']):
+            decompressed = self._zstd_decompressor().decompress(value)
+        elif value.startswith(COMPRESSION_FORMATS['gzip']):
+            decompressed = gzip.decompress(value)
+        else:
+            return value
+
+        with self._lock:
+            self.stats.decompressions += 1
+            self.stats.decompress_seconds += perf_counter() - start
+        return decompressed
+
+    def _zstd_compressor(self):
+        if not hasattr(self._local, 'compressor'):
+            self._local.compressor = zstandard.ZstdCompressor(
+                level=self.level, dict_data=self._zstd_dict()
+            )
+        return self._local.compressor
+
+    def _zstd_decompressor(self):
+        if not hasattr(self._local, 'decompressor'):
+            self._local.decompressor = zstandard.ZstdDecompressor(dict_data=self._zstd_dict())
+        return self._local.decompressor
+
+    def _zstd_dict(self):
+        return zstandard.ZstdCompressionDict(self.dictionary) if self.dictionary else None
+
+
+def compressed_serializer(
+    compression: str = 'zstd',
+    level: Optional[int] = None,
+    dictionary: Optional[CompressionDict] = None,
+    stats: Optional[CacheStats] = None,
+) -> SerializerPipeline:
+    """Get a serializer for cached responses that pickles and then compresses them. This can be
+    used with any binary cache backend (SQLite, filesystem, or Redis).
+
+    Args:
+        compression: Compression format to use: ``zstd`` (requires ``zstandard``) or ``gzip``
+        level: Compression level; defaults to 3 for zstd, and 6 for gzip
+        dictionary: Optional zstd dictionary, as bytes or a file path
+        stats: Stats object to update with compression ratio and decompression time
+    """
+    return SerializerPipeline(
+        [CattrStage(), Stage(pickle), CompressionStage(compression, level, dictionary, stats)],
+        name=f'pickle_{compression}',
+        is_binary=True,
+    )
+
+
+def train_compression_dict(
+    responses: Iterable[CachedResponse], dict_size: int = COMPRESSION_DICT_SIZE
+) -> bytes:
+    """Train a zstd dictionary from cached responses. Since API responses of the same type share
+    most of their keys and structure, this can significantly improve compression of small responses.
+
+    A few hundred responses of the types you request most often is usually enough. Responses
+    compressed with a dictionary can only be read using the same dictionary, so save it to a file
+    to reuse it.
+
+    Example:
+
+        >>> from pathlib import Path
+        >>> from pyinaturalist import ClientSession
+        >>> from pyinaturalist.cache import train_compression_dict
+        >>>
+        >>> session = ClientSession()
+        >>> Path('inat.dict').write_bytes(train_compression_dict(session.cache.filter()))
+        >>> session = ClientSession(cache_compression='zstd', compression_dict='inat.dict')
+
+    Args:
+        responses: Cached responses to use as training samples
+        dict_size: Max size of the dictionary, in bytes
+    """
+    if zstandard is None:
+        raise ImportError('zstd compression requires zstandard. To install: pip install zstandard')
+    serializer = SerializerPipeline([CattrStage(), Stage(pickle)], is_binary=True)
+    samples = [serializer.dumps(response) for response in responses]
+    return zstandard.train_dictionary(dict_size, samples).as_bytes()  # type: ignore
+
+
+def init_cache_backend(
+    backend: CacheBackend = 'sqlite', cache_file: Optional[FileOrPath] = None, **kwargs
+) -> BaseCache:
+    """Initialize a persistent cache backend by name. Options are:
+
+    * ``sqlite``: A local SQLite database (default)
+    * ``sqlite_wal``: A local SQLite database in
+      `write-ahead log <https://www.sqlite.org/wal.html>`_ mode, which allows reads during writes,
+      and is faster with multiple threads or processes writing to the same cache
+    * ``filesystem``: One file per response in a local directory
+    * ``memory``: A non-persistent in-memory cache
+    * ``redis``: A Redis (or Redis-compatible) server, which can be shared by multiple hosts.
+      Requires ``redis-py``.
+
+    Args:
+        backend: Backend name, or a requests-cache backend instance to use as-is
+        cache_file: SQLite database path (for ``sqlite`` backends) or directory (for ``filesystem``
+            backend); defaults to the system default cache directory
+        kwargs: Additional backend-specific keyword arguments. See
+            `requests-cache: Backends <https://requests-cache.readthedocs.io/en/stable/user_guide/backends.html>`_
+            for details. For example, use ``connection`` to pass a ``redis.Redis`` client, or
+            ``host`` and ``port`` for a Redis server address.
+    """
+    if isinstance(backend, BaseCache):
+        return backend
+    if backend not in CACHE_BACKENDS:
+        raise ValueError(f'Invalid cache backend: {backend}. Options: {CACHE_BACKENDS}')
+
+    cache_name: FileOrPath = cache_file or CACHE_FILE
+    if backend == 'sqlite_wal':
+        backend = 'sqlite'
+        kwargs['wal'] = True
+    elif backend == 'filesystem':
+        cache_name = cache_file or CACHE_DIR
+    elif backend == 'redis':
+        cache_name = kwargs.pop('namespace', CACHE_NAMESPACE)
+    return init_backend(cache_name, backend, **kwargs)  # type: ignore
@@ -4,7 +4,7 @@
 from asyncio import AbstractEventLoop
 from inspect import ismethod
 from logging import getLogger
-from typing import Any, Callable, Dict, Optional, Type
+from typing import Any, Callable, Dict, Optional, Type, Union
 
 from pyinaturalist.auth import get_access_token
 from pyinaturalist.constants import RequestParams
@@ -17,10 +17,10 @@ from pyinaturalist.controllers import (
     TaxonController,
     UserController,
 )
-from pyinaturalist.models import T
+from pyinaturalist.models import IdentityMap, T
 from pyinaturalist.paginator import Paginator
 from pyinaturalist.request_params import get_valid_kwargs, strip_empty_values
-from pyinaturalist.session import ClientSession
+from pyinaturalist.session import AsyncClientSession, ClientSession
 
 logger = getLogger(__name__)
 
@@ -51,8 +51,13 @@ class iNatClient:
             tokens as needed. Using a keyring instead is recommended, though.
         default_params: Default request parameters to pass to any applicable API requests
         dry_run: Just log all requests instead of sending real requests
+        identity_map: Share a single instance of each nested :py:class:`.Taxon` and
+            :py:class:`.User` object across paginated results, by ID. Either ``True`` to use a new
+            :py:class:`.IdentityMap` for each paginator, or an existing one to share across all
+            paginators from this client.
         loop: An event loop to run any executors used for async iteration
-        session: Session object to use instead of creating a new one
+        session: Session object to use instead of creating a new one. Use an
+            :py:class:`.AsyncClientSession` to send non-blocking requests from an asyncio event loop.
         kwargs: Keyword arguments for :py:class:`.ClientSession`
     """
 
@@ -61,6 +66,7 @@ class iNatClient:
         creds: Optional[Dict[str, str]] = None,
         default_params: Optional[Dict[str, Any]] = None,
         dry_run: bool = False,
+        identity_map: Union[bool, IdentityMap] = False,
         loop: Optional[AbstractEventLoop] = None,
         session: Optional[ClientSession] = None,
         **kwargs,
@@ -68,6 +74,7 @@ class iNatClient:
         self.creds = creds or {}
         self.default_params = default_params or {}
         self.dry_run = dry_run
+        self.identity_map = identity_map
         self.loop = loop
         self.session = session or ClientSession(**kwargs)
 
@@ -97,6 +104,11 @@ class iNatClient:
             self
         )  #: Interface for :py:class:`user requests <.UserController>`
 
+    @property
+    def is_async(self) -> bool:
+        """Indicates that the client's session can send native async requests"""
+        return isinstance(self.session, AsyncClientSession)
+
     def add_defaults(
         self, request_function, kwargs: Optional[RequestParams] = None, auth: bool = False
     ) -> RequestParams:
@@ -137,7 +149,14 @@ class iNatClient:
             params: Original request parameters
         """
         kwargs = self.add_defaults(request_function, kwargs, auth)
-        return cls(request_function, model, loop=self.loop, **kwargs)
+        if self.is_async:
+            kwargs.setdefault(
+                'async_request_function',
+                self.session.wrap_async(request_function),  # type: ignore
+            )
+        return cls(
+            request_function, model, loop=self.loop, identity_map=self.identity_map, **kwargs
+        )
 
     def request(self, request_function: Callable, *args, auth: bool = False, **kwargs):
         """Send a request, with client settings applied.
@@ -66,6 +66,13 @@ CACHE_EXPIRATION = {
     '*': timedelta(minutes=30),
 }
 CACHE_FILE = join(DATA_DIR, 'api_requests.db')
+CACHE_DIR = join(DATA_DIR, 'api_requests')
+CACHE_NAMESPACE = 'pyinaturalist'
+MEMORY_CACHE_MAX_ENTRIES = 500
+MEMORY_CACHE_MAX_BYTES = 50 * 1024**2
+COMPRESSION_DICT_SIZE = 110 * 1024
+CACHE_PRUNE_INTERVAL = 600
+CACHE_VACUUM_PAGES = 2000
 RATELIMIT_FILE = join(DATA_DIR, 'api_ratelimit.db')
 
 # Response formats supported by v0 GET /observations endpoint
@@ -297,6 +304,49 @@ MULTIPLE_CHOICE_PARAMS = {
     'type': PROJECT_TYPES,
 }
 
+# Request parameters from all API versions that accept boolean values
+BOOLEAN_PARAMS = [
+    'acc',
+    'all_names',
+    'captive',
+    'current',
+    'current_taxon',
+    'endemic',
+    'featured',
+    'geo',
+    'has_params',
+    'has_posts',
+    'id_please',
+    'identified',
+    'introduced',
+    'is_active',
+    'is_change',
+    'mappable',
+    'native',
+    'noteworthy',
+    'observation_taxon_active',
+    'only_id',
+    'out_of_range',
+    'own_observation',
+    'pcid',
+    'photos',
+    'popular',
+    'prefers_banner_contain',
+    'prefers_hide_title',
+    'prefers_hide_umbrella_map_flags',
+    'prefers_rule_native',
+    'prefers_rule_photos',
+    'prefers_rule_sounds',
+    'prefers_user_trust',
+    'reviewed',
+    'rule_details',
+    'sounds',
+    'taxon_active',
+    'taxon_is_active',
+    'threatened',
+    'verifiable',
+]
+
 # Request parameters from all API versions that accept date or datetime strings
 DATETIME_PARAMS = [
     'created_after',
@@ -339,6 +389,7 @@ IntOrStr = Union[int, str]
 JsonResponse = Dict[str, Any]
 ListResponse = List[Dict[str, Any]]
 ObsFieldValues = Union[Dict, List[Dict]]
+PathOrStr = Union[Path, str]
 RequestParams = Dict[str, Any]
 ResponseResult = Dict[str, Any]
 ResponseOrResults = Union[JsonResponse, Iterable[ResponseResult]]
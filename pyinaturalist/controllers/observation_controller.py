@@ -8,6 +8,8 @@ from pyinaturalist.constants import (
     MultiFile,
     MultiInt,
     MultiIntOrStr,
+    PathOrStr,
+    ResponseResult,
 )
 from pyinaturalist.controllers import BaseController
 from pyinaturalist.converters import ensure_list
@@ -26,6 +28,7 @@ from pyinaturalist.models import (
 )
 from pyinaturalist.paginator import IDPaginator, IDRangePaginator, Paginator
 from pyinaturalist.request_params import validate_multiple_choice_param
+from pyinaturalist.sync import OBSERVATION_STORE_FILE, ObservationStore, SyncResult
 from pyinaturalist.v1 import (
     create_observation,
     delete_observation,
@@ -37,6 +40,7 @@ from pyinaturalist.v1 import (
     get_observation_species_counts,
     get_observation_taxon_summary,
     get_observation_taxonomy,
+    get_observations,
     update_observation,
     upload,
 )
@@ -79,17 +83,16 @@ class ObservationController(BaseController):
                 'GET', f'{API_V1}/observations', ids=_observation_ids, **params
             ).json()
 
-        params = self.client.add_defaults(get_observations_by_id, params)
-
-        return IDPaginator(
+        return self.client.paginate(
             get_observations_by_id,
             Observation,
+            cls=IDPaginator,
             ids=ensure_list(observation_ids),
             ids_per_request=IDS_PER_REQUEST,
             **params,
         )
 
-    @copy_doc_signature(*docs._get_observations, docs._only_id)
+    @copy_doc_signature(*docs._get_observations, docs._only_id, docs._shards)
     def search(self, **params) -> Paginator[Observation]:
         """Search observations
 
@@ -129,22 +132,43 @@ class ObservationController(BaseController):
 
             >>> obs = client.observations.search(observation_fields={'Species count': 2}).all()
 
+            Fetch a very large number of observations over 4 concurrent ranges of IDs:
+
+            >>> obs = client.observations.search(place_id=7953, shards=4).all()
+
         """
 
         def get_observations(**params):
             return self.client.session.get(f'{API_V1}/observations', **params).json()
 
         params = validate_multiple_choice_param(params, 'order_by', V1_OBS_ORDER_BY_PROPERTIES)
-        params = self.client.add_defaults(get_observations, params)
-
-        return ObservationPaginator(
+        return self.client.paginate(
             get_observations,
             Observation,
-            loop=self.client.loop,
+            cls=ObservationPaginator,
             annotation_callback=self.client.annotations.lookup,
             **params,
         )
 
+    def sync(self, store: Union[ObservationStore, PathOrStr, None] = None, **params) -> SyncResult:
+        """Update a local database with all observations that have been created or updated since
+        the last sync with the same search parameters. See :py:class:`.ObservationStore` for details.
+
+        Example:
+
+            >>> result = client.observations.sync('~/data/observations.db', place_id=6803)
+            >>> print(f'{result.inserted} new, {result.updated} updated')
+
+        Args:
+            store: Local observation database, or a path to one
+            params: Observation search parameters; accepts the same parameters as :py:meth:`.search`.
+                If ``updated_since`` is given, it's used instead of the time of the last sync.
+        """
+        if not isinstance(store, ObservationStore):
+            store = ObservationStore(store or OBSERVATION_STORE_FILE)
+        params = self.client.add_defaults(get_observations, params)
+        return store.sync(**params)
+
     # TODO: Does this need a model with utility functions, or is {datetime: count} sufficient?
     @copy_doc_signature(*docs._get_observations, docs._observation_histogram)
     def histogram(self, **params) -> HistogramResponse:
@@ -442,7 +466,8 @@ class ObservationPaginator(IDRangePaginator):
     parameters
 
     This also optionally fills in missing annotation information for each observation, using results
-    from ``GET /controlled_terms``.
+    from ``GET /controlled_terms``. This is skipped for raw JSON results from
+    :py:meth:`~Paginator.iter_json` or :py:meth:`~Paginator.iter_pages`.
     """
 
     def __init__(
@@ -454,8 +479,8 @@ class ObservationPaginator(IDRangePaginator):
         super().__init__(*args, **kwargs)
         self.annotation_callback = annotation_callback
 
-    def next_page(self) -> List[Observation]:
-        observations = super().next_page()
+    def _convert_page(self, results: List[ResponseResult]) -> List[Observation]:
+        observations = super()._convert_page(results)
         # Use cached controlled_terms lookup to fill in missing annotation details
         for obs in observations:
             obs.annotations = self.annotation_callback(obs.annotations)
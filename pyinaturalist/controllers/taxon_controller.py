@@ -48,11 +48,10 @@ class TaxonController(BaseController):
             preferred_place_id: Place preference for regional taxon common names
             all_names: Include all taxon names in the response
         """
-
-        params = self.client.add_defaults(get_taxa_by_id, params)
-        return IDPaginator(
+        return self.client.paginate(
             get_taxa_by_id,
             Taxon,
+            cls=IDPaginator,
             ids=ensure_list(taxon_ids),
             ids_per_request=IDS_PER_REQUEST,
             **params,
@@ -1,7 +1,8 @@
 """Type conversion utilities used for both requests and responses"""
 
 import re
-from datetime import date, datetime
+from datetime import date, datetime, tzinfo
+from functools import lru_cache
 from io import BytesIO
 from logging import getLogger
 from os.path import abspath, expanduser
@@ -11,7 +12,7 @@ from warnings import catch_warnings, simplefilter
 
 from dateutil.parser import UnknownTimezoneWarning  # type: ignore  # (missing from type stubs)
 from dateutil.parser import parse as parse_date
-from dateutil.tz import tzlocal
+from dateutil.tz import tzlocal, tzoffset, tzutc
 from requests import Session
 
 from pyinaturalist.constants import (
@@ -37,6 +38,16 @@ OBSERVATION_TIME_FIELDS = (
 # Extremely simplified URL regex, just enough to differentiate from local paths
 URL_PATTERN = re.compile(r'^https?://.+')
 
+# Well-formed ISO 8601 dates and timestamps, as returned by the API. Anything else (like user-entered
+# values for observed_on_string) is handled by dateutil.
+ISO_8601_PATTERN = re.compile(
+    r'(\d{4})-(\d{2})-(\d{2})'
+    r'(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d+))?)?)?'
+    r'\s*(?:(Z)|([+-])(\d{2}):?(\d{2})?)?'
+)
+# Number of date-only values (like '2020-01-01') to keep in an in-memory cache
+DATE_CACHE_SIZE = 1024
+
 logger = getLogger(__name__)
 
 
@@ -44,15 +55,42 @@ logger = getLogger(__name__)
 # --------------------
 
 
-def convert_all_coordinates(results: List[ResponseResult]) -> List[ResponseResult]:
+def convert_all_results(results: List[ResponseResult], copy: bool = False) -> List[ResponseResult]:
+    """Convert coordinates and timestamps in all response items, in a single pass. This combines
+    :py:func:`.convert_all_coordinates` and :py:func:`.convert_all_timestamps`, and can be applied
+    to each page of results separately (for example, with :py:func:`.iter_all`).
+
+    Args:
+        results: Results from API response
+        copy: Convert copies of the results, and leave the originals unmodified. By default,
+            results are modified in place.
+    """
+    if copy:
+        results = [_copy_result(result) for result in results]
+    for result in results:
+        convert_lat_long_dict(result)
+        convert_lat_long_list(result)
+        convert_generic_timestamps(result)
+        convert_observation_timestamps(result)
+    return results
+
+
+def convert_all_coordinates(
+    results: List[ResponseResult], copy: bool = False
+) -> List[ResponseResult]:
     """Convert coordinate pairs in response items from strings to floats, if valid
 
     Args:
         results: Results from API response; expects coordinates in either 'location' key or
             'latitude' and 'longitude' keys
+        copy: Convert copies of the results, and leave the originals unmodified. By default,
+            results are modified in place.
     """
-    results = [convert_lat_long_dict(result) for result in results]
-    results = [convert_lat_long_list(result) for result in results]
+    if copy:
+        results = [_copy_result(result) for result in results]
+    for result in results:
+        convert_lat_long_dict(result)
+        convert_lat_long_list(result)
     return results
 
 
@@ -65,10 +103,21 @@ def convert_all_place_coordinates(response: JsonResponse) -> JsonResponse:
     return response
 
 
-def convert_all_timestamps(results: List[ResponseResult]) -> List[ResponseResult]:
-    """Replace all date/time info with datetime objects, where possible"""
-    results = [convert_generic_timestamps(result) for result in results]
-    results = [convert_observation_timestamps(result) for result in results]
+def convert_all_timestamps(
+    results: List[ResponseResult], copy: bool = False
+) -> List[ResponseResult]:
+    """Replace all date/time info with datetime objects, where possible
+
+    Args:
+        results: Results from API response
+        copy: Convert copies of the results, and leave the originals unmodified. By default,
+            results are modified in place.
+    """
+    if copy:
+        results = [_copy_result(result) for result in results]
+    for result in results:
+        convert_generic_timestamps(result)
+        convert_observation_timestamps(result)
     return results
 
 
@@ -157,9 +206,15 @@ def convert_generic_timestamps(result: ResponseResult) -> ResponseResult:
     return result
 
 
-def convert_observation_timestamps(result: ResponseResult) -> ResponseResult:
-    """Replace observation date/time info with datetime objects"""
-    observation = result.copy()
+def convert_observation_timestamps(result: ResponseResult, copy: bool = False) -> ResponseResult:
+    """Replace observation date/time info with datetime objects
+
+    Args:
+        result: Observation record from API response
+        copy: Convert a copy of the result, and leave the original unmodified. By default, the
+            result is modified in place.
+    """
+    observation = result.copy() if copy else result
 
     observed_on = observation.pop('time_observed_at', None)
     if not isinstance(observation.get('observed_on'), datetime) and observed_on:
@@ -172,6 +227,14 @@ def convert_observation_timestamps(result: ResponseResult) -> ResponseResult:
     return observation
 
 
+def _copy_result(result: ResponseResult) -> ResponseResult:
+    """Make a copy of a response item, including any inner record that would be converted"""
+    result = result.copy()
+    if isinstance(result.get('record'), dict):
+        result['record'] = result['record'].copy()
+    return result
+
+
 def safe_split(value: Any, delimiter: str = '|') -> List[str]:
     """Split a pipe-(or other token)-delimited string"""
     return list(ensure_list(value, split_str_list=True, delimiter=delimiter))
@@ -270,6 +333,13 @@ def try_datetime(timestamp: Any, **kwargs) -> Optional[datetime]:
     if not timestamp or not str(timestamp).strip():
         return None
 
+    # Fast path for ISO 8601 strings; fall back to dateutil for anything else
+    if isinstance(timestamp, str) and not kwargs:
+        timestamp = timestamp.strip()
+        dt = _parse_date(timestamp) if len(timestamp) == 10 else _parse_iso_8601(timestamp)
+        if dt is not None:
+            return dt
+
     try:
         # Suppress UnknownTimezoneWarning
         with catch_warnings():
@@ -280,6 +350,51 @@ def try_datetime(timestamp: Any, **kwargs) -> Optional[datetime]:
         return None
 
 
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date(timestamp: str) -> Optional[datetime]:
+    """Parse a date-only ISO 8601 string, with caching for repeated values"""
+    return _parse_iso_8601(timestamp)
+
+
+def _parse_iso_8601(timestamp: str) -> Optional[datetime]:
+    """Parse an ISO 8601 date or timestamp string into a datetime, with the same result as dateutil;
+    return ``None`` if it's not in a supported format
+    """
+    match = ISO_8601_PATTERN.fullmatch(timestamp)
+    if not match:
+        return None
+
+    year, month, day, hour, minute, second, fraction, utc, sign, tz_hours, tz_minutes = (
+        match.groups()
+    )
+    tz: Optional[tzinfo] = None
+    if utc:
+        tz = tzutc()
+    elif sign:
+        offset = int(tz_hours) * 3600 + int(tz_minutes or 0) * 60
+        tz = _get_tzoffset(-offset if sign == '-' else offset)
+
+    try:
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour or 0),
+            int(minute or 0),
+            int(second or 0),
+            int(fraction[:6].ljust(6, '0')) if fraction else 0,
+            tzinfo=tz,
+        )
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=None)
+def _get_tzoffset(offset: int) -> tzinfo:
+    """Get a timezone for a UTC offset in seconds, using the same types as dateutil"""
+    return tzutc() if offset == 0 else tzoffset(None, offset)
+
+
 def try_date(timestamp: Any, **kwargs) -> Optional[date]:
     """Parse a date string into a date, if valid; return ``None`` otherwise"""
     dt = try_datetime(timestamp, **kwargs)
@@ -672,6 +672,17 @@ def _only_id(only_id: Optional[bool] = None):
     """
 
 
+def _shards(shards: Optional[int] = None, shard_interval: Optional[str] = None):
+    """Args:
+    shards: When fetching all results, split the range of IDs into this many windows and fetch them
+        concurrently (still subject to rate-limiting). Results will not be in ID order.
+    shard_interval: Split the date range (``d1``/``d2`` or ``created_d1``/``created_d2``) into
+        ``shards`` windows instead, based on result counts for each interval of this size
+        (``'day'``, ``'week'``, ``'month'``, or ``'year'``). Requires ``shards`` greater than 1, and
+        sends one extra request per interval to get result counts.
+    """
+
+
 def _observation_id(observation_id: int):
     """Args:
     observation_id: iNaturalist observation ID
@@ -0,0 +1,607 @@
+"""Export model data to `Apache Arrow <https://arrow.apache.org>`_ tables and Parquet files.
+Requires installing `pyarrow <https://arrow.apache.org/docs/python>`_.
+
+Arrow schemas are derived from model field definitions. Nested model objects are stored as structs
+(one level deep), and any other nested data is stored as JSON strings. Empty values (like empty
+strings, lists, and dicts) are stored as nulls.
+
+JSON results are converted column by column, without creating model objects. Values that models
+modify while initializing (like defaults for missing values) are read the same way from JSON, so the
+same data produces the same rows whether it's passed as JSON or model objects.
+
+Example:
+
+    Write all results from a paginated request to a Parquet file, one page at a time:
+
+    >>> from pyinaturalist import iNatClient
+    >>> client = iNatClient()
+    >>> client.observations.search(place_id=6803).to_parquet('observations.parquet')
+
+    Or convert a collection of model objects into an Arrow table:
+
+    >>> from pyinaturalist import Observation
+    >>> from pyinaturalist.export import to_arrow
+    >>> observations = Observation.from_json_list(get_observations(user_id='my_username'))
+    >>> table = to_arrow(observations, Observation)
+"""
+
+import json
+from datetime import date, datetime
+from functools import lru_cache, partial
+from inspect import isclass, unwrap
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from attr import NOTHING, Attribute, Factory, fields
+
+from pyinaturalist.constants import (
+    CC_LICENSES,
+    ICONIC_TAXA,
+    INAT_BASE_URL,
+    PHOTO_BASE_URL,
+    PHOTO_CC_BASE_URL,
+    RANK_EQUIVALENTS,
+    RANK_LEVELS,
+    UNRANKED,
+    PathOrStr,
+    ResponseResult,
+)
+from pyinaturalist.converters import format_license, try_date, try_datetime, try_float, try_int
+from pyinaturalist.models import (
+    BaseModel,
+    BaseModelCollection,
+    DefaultTimestamp,
+    IconPhoto,
+    Observation,
+    Photo,
+    Taxon,
+    intern_str,
+)
+from pyinaturalist.models.lazy_property import LazyProperty, get_lazy_properties
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None  # type: ignore
+    pq = None  # type: ignore
+
+ResultOrObject = Union[ResponseResult, BaseModel]
+ArrayBuilder = Callable[[List[Any]], 'pa.Array']
+ValueGetter = Callable[[Any], Any]
+NoneType = type(None)
+
+
+class ArrowColumn(NamedTuple):
+    """Info needed to get values for a single column from either JSON results or model objects"""
+
+    name: str
+    type: 'pa.DataType'
+    from_json: ArrayBuilder  #: Build an array from a list of JSON results
+    from_object: ValueGetter  #: Get an Arrow-compatible value from a model object
+
+
+def get_arrow_schema(model: Type[BaseModel]) -> 'pa.Schema':
+    """Get an Arrow schema for a model class, based on its field definitions"""
+    columns = _get_columns(model)  # type: ignore
+    return pa.schema([pa.field(c.name, c.type) for c in columns])
+
+
+def to_record_batch(results: Sequence[ResultOrObject], model: Type[BaseModel]) -> 'pa.RecordBatch':
+    """Convert JSON results or model objects into an Arrow record batch
+
+    Args:
+        results: JSON results or model objects
+        model: Model class that describes the results
+    """
+    _check_pyarrow()
+    columns = _get_columns(model)  # type: ignore
+    if all(isinstance(r, dict) for r in results) and _is_direct(model):  # type: ignore
+        results = [_flatten_json(r, model) for r in results]  # type: ignore
+        arrays = [c.from_json(results) for c in columns]  # type: ignore
+    else:
+        objects = [model.from_json(r) if isinstance(r, dict) else r for r in results]
+        arrays = [pa.array([c.from_object(obj) for obj in objects], type=c.type) for c in columns]
+    return pa.RecordBatch.from_arrays(arrays, schema=get_arrow_schema(model))
+
+
+def to_arrow(results: Sequence[ResultOrObject], model: Type[BaseModel]) -> 'pa.Table':
+    """Convert JSON results or model objects into an Arrow table
+
+    Args:
+        results: JSON results or model objects
+        model: Model class that describes the results
+    """
+    return pa.Table.from_batches([to_record_batch(results, model)])
+
+
+def write_parquet(
+    pages: Iterable[Sequence[ResultOrObject]],
+    path: PathOrStr,
+    model: Type[BaseModel],
+    **kwargs,
+) -> int:
+    """Write pages of results to a Parquet file. Each page is written as a separate row group as soon
+    as it's received, so memory usage depends only on page size, not total number of results.
+
+    Args:
+        pages: Pages of JSON results or model objects
+        path: Path to Parquet file to write
+        model: Model class that describes the results
+        kwargs: Additional keyword arguments for :py:class:`pyarrow.parquet.ParquetWriter`
+
+    Returns:
+        Total number of rows written
+    """
+    _check_pyarrow()
+    n_rows = 0
+    with pq.ParquetWriter(str(path), get_arrow_schema(model), **kwargs) as writer:
+        for page in pages:
+            if page:
+                writer.write_batch(to_record_batch(page, model))
+                n_rows += len(page)
+    return n_rows
+
+
+def get_collection_model(collection: BaseModelCollection) -> Type[BaseModel]:
+    """Get the model class of the items in a collection"""
+    converter = fields(type(collection)).data.converter
+    model = getattr(converter, '__self__', None)
+    if model is None and collection.data:
+        model = type(collection.data[0])
+    if model is None:
+        raise ValueError(f'Could not determine model class for {type(collection).__name__}')
+    return model
+
+
+def _check_pyarrow():
+    if pa is None:
+        raise ImportError('Arrow export requires pyarrow. To install: pip install pyarrow')
+
+
+@lru_cache
+def _get_columns(model: Type[BaseModel], nested: bool = False) -> Tuple[ArrowColumn, ...]:
+    """Get column info for all fields of a model class. For nested models, lazy-loaded properties
+    (which contain other nested models) are skipped.
+    """
+    _check_pyarrow()
+    json_getters = _JSON_GETTERS.get(model, {})
+    columns = []
+    for f in fields(model):
+        if f.name.startswith('_') or f.type is None:
+            continue
+        arrow_type, convert, build = _get_arrow_type(f.type, nested)
+        # Field converters only need to be applied to JSON values, and some are redundant
+        converter = f.converter
+        if pa.types.is_struct(arrow_type) or (converter, convert) in _REDUNDANT_CONVERTERS:
+            converter = None
+
+        get_json = partial(
+            _get_json_values,
+            key=f.name if f.init else None,
+            get_value=json_getters.get(f.name),
+            default=_get_default(f),
+            converter=converter,
+            build=build,
+        )
+        columns.append(
+            ArrowColumn(f.name, arrow_type, get_json, _object_value_getter(f.name, convert))
+        )
+
+    if not nested:
+        for name, prop in get_lazy_properties(model).items():
+            arrow_type, convert, build = _get_arrow_type(prop.type, nested)
+            converter = None
+            if not _is_plain_converter(prop):
+                converter = partial(_apply_lazy_converter, prop=prop)
+                convert = partial(_convert_lazy, prop=prop, convert=convert)
+
+            get_json = partial(
+                _get_json_values,
+                key=name,
+                get_value=json_getters.get(name),
+                converter=converter,
+                build=build,
+            )
+            columns.append(
+                ArrowColumn(
+                    name, arrow_type, get_json, _object_value_getter(prop.temp_attr, convert)
+                )
+            )
+    return tuple(columns)
+
+
+def _get_arrow_type(field_type: Any, nested: bool) -> Tuple['pa.DataType', Callable, ArrayBuilder]:
+    """Get an Arrow data type for a model field type, plus functions to convert a single value and to
+    build an array from a list of JSON values
+    """
+    field_type = _unwrap_optional(field_type)
+    origin = getattr(field_type, '__origin__', None)
+    args = getattr(field_type, '__args__', ())
+    primitive_types = _get_primitive_types()
+    convert: Callable
+
+    if isclass(field_type) and issubclass(field_type, BaseModel):
+        if nested:
+            convert = partial(_model_to_json, model=field_type)
+            build = partial(_values_to_array, arrow_type=pa.string(), convert=convert)
+            return pa.string(), convert, build
+        columns = _get_columns(field_type, nested=True)  # type: ignore
+        arrow_type = pa.struct([pa.field(c.name, c.type) for c in columns])
+        convert = partial(_convert_struct, model=field_type, columns=columns)
+        build = partial(_struct_to_array, arrow_type=arrow_type, model=field_type, columns=columns)
+        return arrow_type, convert, build
+    elif origin is list and args:
+        item_type, convert_item, build_item = _get_arrow_type(args[0], nested)
+        arrow_type = pa.list_(item_type)
+        convert = partial(_convert_list, convert_item=convert_item)
+        build = partial(_list_to_array, arrow_type=arrow_type, build_item=build_item)
+        return arrow_type, convert, build
+    # Fixed-length tuples of a single type, like coordinates or dimensions
+    elif origin is tuple and args and len(set(args)) == 1 and args[0] in primitive_types:
+        item_type, convert_item = primitive_types[args[0]]
+        arrow_type = pa.list_(item_type, len(args))
+        convert = partial(_convert_list, convert_item=convert_item)
+        build = partial(_values_to_array, arrow_type=arrow_type, convert=convert)
+        return arrow_type, convert, build
+    elif field_type in primitive_types:
+        arrow_type, convert = primitive_types[field_type]
+        build = partial(
+            _primitive_to_array,
+            arrow_type=arrow_type,
+            convert=convert,
+            native_type=field_type if field_type in _NATIVE_TYPES else None,
+        )
+        return arrow_type, convert, build
+    return (
+        pa.string(),
+        _to_json,
+        partial(_values_to_array, arrow_type=pa.string(), convert=_to_json),
+    )
+
+
+@lru_cache
+def _get_primitive_types() -> Dict[type, Tuple['pa.DataType', Callable]]:
+    # Note: bool must be checked before int, since bool is a subclass of int
+    return {
+        bool: (pa.bool_(), _to_bool),
+        int: (pa.int64(), try_int),
+        float: (pa.float64(), try_float),
+        str: (pa.string(), _to_str),
+        datetime: (pa.timestamp('us', tz='UTC'), _to_datetime),
+        date: (pa.date32(), try_date),
+    }
+
+
+def _unwrap_optional(field_type: Any) -> Any:
+    """Get X from Optional[X]"""
+    args = getattr(field_type, '__args__', ())
+    if getattr(field_type, '__origin__', None) is Union and type(None) in args:
+        non_null_args = [arg for arg in args if arg is not type(None)]
+        if len(non_null_args) == 1:
+            return non_null_args[0]
+    return field_type
+
+
+@lru_cache
+def _is_direct(model: Type[BaseModel]) -> bool:
+    """Check if values for a model can be read directly from JSON. This is the case unless the model
+    modifies values while initializing (with a custom ``__init__()``, ``__attrs_post_init__()``, or
+    ``from_json()``) and there are no JSON getters in ``_JSON_GETTERS`` that do the same.
+    """
+    if model in _JSON_GETTERS:
+        return True
+    init = unwrap(model.__init__)  # type: ignore
+    return (
+        init.__code__.co_filename.startswith('<attrs generated')
+        and not hasattr(model, '__attrs_post_init__')
+        and model.from_json.__func__ is BaseModel.from_json.__func__  # type: ignore
+    )
+
+
+def _is_plain_converter(prop: LazyProperty) -> bool:
+    """Check if a lazy-loaded property just initializes model objects of its own type, so values can
+    be read directly from its JSON
+    """
+    prop_type = _unwrap_optional(prop.type)
+    if getattr(prop_type, '__origin__', None) is list:
+        prop_type = prop_type.__args__[0]
+    return (
+        not prop.converter_kwargs
+        and getattr(prop.converter, '__self__', None) is prop_type
+        and getattr(prop.converter, '__func__', None)
+        in (BaseModel.from_json.__func__, BaseModel.from_json_list.__func__)  # type: ignore
+    )
+
+
+def _get_default(f: Attribute) -> Any:
+    """Get a field's default value, to use for missing JSON values"""
+    default = f.default
+    if isinstance(default, Factory):  # type: ignore
+        default = None if default.takes_self else default.factory()  # type: ignore
+    return None if default is NOTHING else default
+
+
+def _get_json_values(
+    results: List[ResponseResult],
+    key: Optional[str],
+    get_value: Optional[Callable[[ResponseResult], Any]],
+    build: ArrayBuilder,
+    converter: Optional[Callable] = None,
+    default: Any = None,
+) -> 'pa.Array':
+    """Get values for a single field from JSON results, and build an Arrow array from them.
+    Like model initialization, missing values are replaced with the field's default value, and then
+    the field's converter (if any) is applied.
+
+    Args:
+        results: JSON results
+        key: JSON key for the field, or ``None`` for fields that aren't initialized from JSON
+        get_value: Function to get the value from a JSON result, if it's not just ``result[key]``
+        build: Function to build an Arrow array from the field values
+        converter: Model field converter
+        default: Default value for missing values
+    """
+    if get_value is not None:
+        values = [get_value(result) for result in results]
+    elif key is not None:
+        values = [result.get(key) for result in results]
+    else:
+        values = [None] * len(results)
+
+    if default is not None:
+        values = [default if value is None else value for value in values]
+    if converter is not None:
+        values = [None if value is None else converter(value) for value in values]
+    return build(values)
+
+
+def _primitive_to_array(
+    values: List[Any], arrow_type: 'pa.DataType', convert: Callable, native_type: Optional[type]
+) -> 'pa.Array':
+    """Build an array of primitive values. If values are already the right type, pyarrow can convert
+    them all at once; otherwise, they are converted one at a time first.
+    """
+    if native_type is None or not set(map(type, values)) <= {native_type, NoneType}:
+        return _values_to_array(values, arrow_type, convert)
+    if native_type is str and '' in values:
+        values = [value or None for value in values]
+    return pa.array(values, type=arrow_type)
+
+
+def _list_to_array(
+    values: List[Any], arrow_type: 'pa.ListType', build_item: ArrayBuilder
+) -> 'pa.Array':
+    """Build an array of lists from the offsets of each list within a single array of all items"""
+    items: List = []
+    offsets = [0]
+    for value in values:
+        if value:
+            items.extend(value)
+        offsets.append(len(items))
+    return pa.ListArray.from_arrays(
+        pa.array(offsets, type=pa.int32()),
+        build_item(items),
+        type=arrow_type,
+        mask=pa.array([not value for value in values], type=pa.bool_()),
+    )
+
+
+def _struct_to_array(
+    values: List[Any],
+    arrow_type: 'pa.StructType',
+    model: Type[BaseModel],
+    columns: Tuple[ArrowColumn, ...],
+) -> 'pa.Array':
+    """Build an array of structs from arrays of each of their fields. If values can't be read directly
+    from JSON, or contain model objects, they are converted one at a time instead.
+    """
+    if not _is_direct(model) or not set(map(type, values)) <= {dict, NoneType}:  # type: ignore
+        convert = partial(_convert_struct, model=model, columns=columns)
+        return _values_to_array(values, arrow_type, convert)
+
+    rows = [_flatten_json(value, model) if value else {} for value in values]
+    return pa.StructArray.from_arrays(
+        [c.from_json(rows) for c in columns],
+        fields=list(arrow_type),
+        mask=pa.array([not value for value in values], type=pa.bool_()),
+    )
+
+
+def _values_to_array(values: List[Any], arrow_type: 'pa.DataType', convert: Callable) -> 'pa.Array':
+    """Build an array from values that are converted one at a time"""
+    return pa.array(
+        [None if value is None else convert(value) for value in values], type=arrow_type
+    )
+
+
+def _object_value_getter(attr: str, convert: Callable) -> ValueGetter:
+    """Make a function that gets a converted value from a model object"""
+
+    def get_object_value(obj: BaseModel) -> Any:
+        return convert(getattr(obj, attr, None))
+
+    return get_object_value
+
+
+def _is_json(value: Any) -> bool:
+    return isinstance(value, dict) or (
+        isinstance(value, list) and bool(value) and isinstance(value[0], dict)
+    )
+
+
+def _apply_lazy_converter(value: Any, prop: LazyProperty) -> Any:
+    """Apply a lazy-loaded property's converter to JSON that hasn't been converted yet, without
+    storing it on the original object
+    """
+    return prop.converter(value, **prop.converter_kwargs) if _is_json(value) else value
+
+
+def _convert_lazy(value: Any, prop: LazyProperty, convert: Callable) -> Any:
+    return convert(_apply_lazy_converter(value, prop))
+
+
+def _convert_list(value: Any, convert_item: Callable) -> Optional[List]:
+    if not value:
+        return None
+    return [convert_item(item) for item in value]
+
+
+def _convert_struct(
+    value: Any, model: Type[BaseModel], columns: Tuple[ArrowColumn, ...]
+) -> Optional[Dict]:
+    if not value:
+        return None
+    if isinstance(value, dict):
+        value = model.from_json(value)
+    return {c.name: c.from_object(value) for c in columns}
+
+
+def _model_to_json(value: Any, model: Type[BaseModel]) -> Optional[str]:
+    if isinstance(value, dict):
+        value = model.from_json(value)
+    return _to_json(value)
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    """Parse a timestamp, except for placeholder values set by model defaults"""
+    return None if isinstance(value, DefaultTimestamp) else try_datetime(value)
+
+
+def _to_bool(value: Any) -> Optional[bool]:
+    return None if value is None else bool(value)
+
+
+def _to_json(value: Any) -> Optional[str]:
+    if value is None or value == {} or value == []:
+        return None
+    if isinstance(value, BaseModel):
+        value = value.to_dict()
+    elif isinstance(value, list):
+        value = [v.to_dict() if isinstance(v, BaseModel) else v for v in value]
+    return json.dumps(value, default=_json_default)
+
+
+def _json_default(value: Any) -> Optional[str]:
+    return None if isinstance(value, DefaultTimestamp) else str(value)
+
+
+def _to_str(value: Any) -> Optional[str]:
+    return None if value is None or value == '' else str(value)
+
+
+def _flatten_json(result: ResponseResult, model: Type[BaseModel]) -> ResponseResult:
+    """Flatten a nested record, if the model's ``from_json()`` does the same"""
+    key = _NESTED_KEYS.get(model)
+    if key and key in result:
+        result = {**result, **result[key]}
+        result.pop(key)
+    return result
+
+
+# Functions to read values that models modify while initializing (in a custom ``__init__()``,
+# ``__attrs_post_init__()``, or ``from_json()``), so those values can be read directly from JSON.
+# These must be kept consistent with the corresponding model code.
+def _get_observed_on(result: ResponseResult) -> Any:
+    observed_on = result.get('observed_on')
+    if isinstance(observed_on, datetime):
+        return observed_on
+    return result.get('time_observed_at') or observed_on
+
+
+def _get_observation_uri(result: ResponseResult) -> str:
+    obs_id = result.get('id')
+    return result.get('uri') or f'{INAT_BASE_URL}/observations/{"" if obs_id is None else obs_id}'
+
+
+def _get_identifications_count(result: ResponseResult) -> Optional[int]:
+    identifications = result.get('identifications')
+    if identifications and not result.get('identifications_count'):
+        return len(identifications)
+    return result.get('identifications_count')
+
+
+def _get_photo_url(result: ResponseResult) -> str:
+    if url := result.get('url'):
+        return url
+    license_code = format_license(result.get('license_code') or '')
+    if license_code and license_code in CC_LICENSES:
+        return f'{PHOTO_CC_BASE_URL}/{result.get("id")}/original.jpg'
+    return f'{PHOTO_BASE_URL}/{result.get("id")}?size=original'
+
+
+def _get_ancestor_ids(result: ResponseResult) -> Optional[List[int]]:
+    ancestor_ids = result.get('ancestor_ids')
+    if ancestor_ids:
+        return ancestor_ids
+    elif ancestry := result.get('ancestry'):
+        delimiter = ',' if ',' in ancestry else '/'
+        return [int(x) for x in ancestry.split(delimiter)]
+    elif ancestors := result.get('ancestors'):
+        return [t.id for t in Taxon.from_sorted_json_list(ancestors)]
+    return ancestor_ids
+
+
+def _get_iconic_taxon_name(result: ResponseResult) -> str:
+    return result.get('iconic_taxon_name') or ICONIC_TAXA.get(
+        result.get('iconic_taxon_id') or 0, 'Unknown'
+    )
+
+
+def _get_rank(result: ResponseResult) -> str:
+    rank = (result.get('rank') or '').lower()
+    return RANK_EQUIVALENTS.get(rank, rank)
+
+
+def _get_rank_level(result: ResponseResult) -> float:
+    return result.get('rank_level') or RANK_LEVELS.get(_get_rank(result), UNRANKED)
+
+
+def _get_default_photo(result: ResponseResult) -> Any:
+    return result.get('default_photo') or IconPhoto.from_iconic_taxon(
+        _get_iconic_taxon_name(result)
+    )
+
+
+_JSON_GETTERS: Dict[Type[BaseModel], Dict[str, Callable[[ResponseResult], Any]]] = {
+    Observation: {
+        'observed_on': _get_observed_on,
+        'uri': _get_observation_uri,
+        'identifications_count': _get_identifications_count,
+    },
+    Photo: {'url': _get_photo_url},
+    Taxon: {
+        'ancestor_ids': _get_ancestor_ids,
+        'default_photo': _get_default_photo,
+        'iconic_taxon_name': _get_iconic_taxon_name,
+        'rank': _get_rank,
+        'rank_level': _get_rank_level,
+    },
+}
+
+# Keys of nested records that are flattened by a model's from_json()
+_NESTED_KEYS: Dict[Type[BaseModel], str] = {Photo: 'photo'}
+
+# Types that pyarrow can convert directly, without the corresponding conversion functions
+_NATIVE_TYPES = frozenset([bool, datetime, float, int, str])
+
+# Field converters that don't need to be applied before the corresponding conversion functions
+_REDUNDANT_CONVERTERS = frozenset(
+    [
+        (try_int, try_int),
+        (try_float, try_float),
+        (try_datetime, _to_datetime),
+        (intern_str, _to_str),
+    ]
+)
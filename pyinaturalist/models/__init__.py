@@ -4,15 +4,16 @@ See :ref:`data-models` section for usage details.
 
 # ruff: noqa: F401, E402
 # isort: skip_file
+import sys
 from datetime import datetime, timezone
 from typing import Callable, Dict, Iterable, Optional, Union
 
 import attr
-from attr import define, validators
+from attr import converters, define, validators
 
 from pyinaturalist.constants import JsonResponse, ResponseOrResults
 from pyinaturalist.converters import convert_lat_long, try_datetime
-from pyinaturalist.models.base import BaseModel, BaseModelCollection, T, load_json
+from pyinaturalist.models.base import BaseModel, BaseModelCollection, T, dump_json, load_json
 from pyinaturalist.models.lazy_property import LazyProperty, add_lazy_attrs, get_lazy_properties
 
 
@@ -24,16 +25,28 @@ define_model: Callable = define(auto_attribs=False, field_transformer=add_lazy_a
 define_model_custom_init: Callable = define(
     auto_attribs=False, init=False, field_transformer=add_lazy_attrs
 )
-define_model_collection: Callable = define(auto_attribs=False, order=False, slots=False)
+define_model_collection: Callable = define(auto_attribs=False, order=False)
 
 
 def field(
-    doc: str = '', options: Optional[Iterable] = None, metadata: Optional[Dict] = None, **kwargs
+    doc: str = '',
+    options: Optional[Iterable] = None,
+    metadata: Optional[Dict] = None,
+    intern: bool = False,
+    **kwargs,
 ):
-    """A field with extra metadata for documentation and options"""
+    """A field with extra metadata for documentation and options.
+
+    String values for fields with a fixed set of ``options`` are interned, so repeated values across
+    many model objects share the same string in memory. Use ``intern=True`` to do the same for other
+    fields with a small number of distinct values.
+    """
     metadata = metadata or {}
     metadata['doc'] = doc
     metadata['options'] = options
+    if options is not None or intern:
+        converter = kwargs.get('converter')
+        kwargs['converter'] = converters.pipe(converter, intern_str) if converter else intern_str
     return attr.field(**kwargs, metadata=metadata)
 
 
@@ -58,9 +71,23 @@ def datetime_field(**kwargs):
     return field(default=None, converter=try_datetime, **kwargs)
 
 
+class DefaultTimestamp(datetime):
+    """A timestamp that was set to the current time by default, instead of from API data. This
+    behaves the same as a regular ``datetime``, but can be distinguished from real values (for
+    example, when exporting data).
+    """
+
+
 def datetime_now_field(**kwargs):
     """Field that converts date/time strings into datetime objects, and defaults to the current time"""
-    return field(converter=try_datetime, factory=lambda: datetime.now(timezone.utc), **kwargs)
+    return field(
+        converter=try_datetime, factory=lambda: DefaultTimestamp.now(timezone.utc), **kwargs
+    )
+
+
+def intern_str(value):
+    """Converter to intern a string value, if applicable"""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
 def upper(value) -> Optional[str]:
@@ -103,6 +130,9 @@ from pyinaturalist.models.observation import (
     Vote,
 )
 from pyinaturalist.models.search import SearchResult
+from pyinaturalist.models.identity_map import IdentityMap
+from pyinaturalist.models.observation_frame import ObservationFrame
+from pyinaturalist.models.projection import ProjectedModel, get_projection
 
 
 # Type aliases involving model objects
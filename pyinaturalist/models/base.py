@@ -1,19 +1,35 @@
 """Base class and utilities for data models"""
 
-from collections import UserList
-from copy import deepcopy
-from datetime import datetime
+from collections.abc import MutableSequence
+from copy import copy, deepcopy
+from datetime import date, datetime
+from functools import lru_cache
+from inspect import unwrap
 from logging import getLogger
 from os.path import expanduser
 from pathlib import Path
-from typing import Dict, Generic, List, Optional, Type, TypeVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
-from attr import Factory, asdict, define, field, fields_dict
+from attr import Factory, define, field, fields, fields_dict
 
 from pyinaturalist.constants import (
     DATETIME_SHORT_FORMAT,
     AnyFile,
     JsonResponse,
+    PathOrStr,
     ResponseOrFile,
     ResponseOrResults,
     TableRow,
@@ -26,10 +42,22 @@ try:
 except ImportError:
     import json  # type: ignore
 
+# For JSON output, orjson is faster still
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
 T = TypeVar('T', bound='BaseModel')
 TC = TypeVar('TC', bound='BaseModelCollection')
 logger = getLogger(__name__)
 
+# Types that don't need any conversion in dict output
+ATOMIC_TYPES = frozenset([bool, date, datetime, float, int, str, type(None)])
+
 
 @define(auto_attribs=False)
 class BaseModel:
@@ -60,13 +88,9 @@ class BaseModel:
         if isinstance(value, cls):
             return value
 
-        cls_attrs = {k.lstrip('_'): v for k, v in fields_dict(cls).items()}
-
-        def is_valid_attr(k):
-            return (k in cls_attrs and cls_attrs[k].init is True) or k in cls.temp_attrs
-
-        valid_json = {k: v for k, v in value.items() if is_valid_attr(k) and v is not None}
-        return cls(**valid_json, **kwargs)
+        schema = get_schema(cls)  # type: ignore
+        valid_json = {k: v for k, v in value.items() if k in schema.init_keys and v is not None}
+        return schema.construct(**valid_json, **kwargs)
 
     @classmethod
     def from_json_file(cls: Type[T], value: AnyFile) -> List[T]:
@@ -105,30 +129,35 @@ class BaseModel:
         return [getattr(a, 'name', '') for a in self.__attrs_attrs__]
 
     def to_dict(self, keys: Optional[List[str]] = None, recurse: bool = True) -> JsonResponse:
-        """Convert this object back to dict format
+        """Convert this object back to dict format. Lazy-loaded nested objects that haven't been
+        accessed yet are returned in their original (JSON) format, without converting them.
 
         Args:
             keys: Only keep the specified keys (attribute names)
             recurse: Recurse into nested model objects
         """
+        schema = get_schema(type(self))  # type: ignore
+        if recurse and not keys:
+            return schema.serialize(self)
+
+        serialize = _serialize if recurse else _identity
+        return {
+            key: [] if (is_lazy_list and value is None) else serialize(value)
+            for attr, key, is_lazy_list in schema.serializer_fields
+            if not keys or key in keys
+            for value in [getattr(self, attr)]
+        }
+
+    def to_json(self, keys: Optional[List[str]] = None, indent: Optional[int] = None) -> str:
+        """Convert this object into a JSON string. Uses
+        `orjson <https://github.com/ijl/orjson>`_ or `ujson <https://github.com/ultrajson/ultrajson>`_
+        if installed.
 
-        def recursive_serializer(_inst, _attribute, value):
-            if keys and _attribute and _attribute.name.lstrip('_') not in keys:
-                return None
-            return value.to_dict() if isinstance(value, BaseModel) else value
-
-        obj_dict = asdict(
-            self,
-            filter=lambda a, _: a.init is True,
-            retain_collection_types=True,
-            recurse=recurse,
-            value_serializer=recursive_serializer if recurse else None,
-        )
-
-        obj_dict = {k.lstrip('_'): v for k, v in obj_dict.items()}
-        if keys:
-            obj_dict = {k: v for k, v in obj_dict.items() if k in keys}
-        return obj_dict
+        Args:
+            keys: Only keep the specified keys (attribute names)
+            indent: Number of spaces to indent JSON output
+        """
+        return dump_json(self.to_dict(keys=keys), indent=indent)
 
     def __rich_repr__(self):
         """Custom output to use when pretty-printed with rich. Compared to default rich behavior for
@@ -191,14 +220,16 @@ class BaseModel:
         return f'{self.__class__.__name__}({repr_attrs_str})'
 
 
-@define(auto_attribs=False, order=False, slots=False)
-class BaseModelCollection(BaseModel, UserList, Generic[T]):
+@define(auto_attribs=False, order=False)
+class BaseModelCollection(BaseModel, MutableSequence, Generic[T]):
     """Base class for data model collections. These will behave the same as lists but enable some
     additional operations on contained items.
+
+    Like other models, collections are slotted classes, so they don't have an instance ``__dict__``.
     """
 
     data: List[T] = field(factory=list, init=False, repr=False)
-    _id_map: Dict[int, T] = field(default=None, init=False, repr=False)
+    _id_map: Optional[Dict[int, T]] = field(default=None, init=False, repr=False)
 
     @classmethod
     def copy(cls, obj):
@@ -231,15 +262,169 @@ class BaseModelCollection(BaseModel, UserList, Generic[T]):
         """Remove any duplicates from this collection based on ID"""
         self.data = list(self.id_map.values())
 
+    def to_arrow(self) -> 'pa.Table':
+        """Convert this collection into an Apache Arrow table. Requires installing ``pyarrow``."""
+        from pyinaturalist.export import get_collection_model, to_arrow
+
+        return to_arrow(self.data, get_collection_model(self))
+
+    def to_parquet(self, path: PathOrStr, **kwargs):
+        """Write this collection to a Parquet file. Requires installing ``pyarrow``.
+
+        Args:
+            path: Path to Parquet file to write
+            kwargs: Additional keyword arguments for :py:class:`pyarrow.parquet.ParquetWriter`
+        """
+        from pyinaturalist.export import get_collection_model, write_parquet
+
+        write_parquet([self.data], path, get_collection_model(self), **kwargs)
+
     def get_count(self, id: int, count_field: str = 'count') -> int:
         """Get a count associated with the given ID.
         Returns 0 if the collection type is not countable or the ID doesn't exist.
         """
         return getattr(self.id_map.get(id), count_field, 0)
 
+    def to_json(self, keys: Optional[List[str]] = None, indent: Optional[int] = None) -> str:
+        """Convert the items in this collection into a JSON string (as a list). Uses
+        `orjson <https://github.com/ijl/orjson>`_ or `ujson <https://github.com/ultrajson/ultrajson>`_
+        if installed.
+
+        Args:
+            keys: Only keep the specified keys (attribute names)
+            indent: Number of spaces to indent JSON output
+        """
+        return dump_json([obj.to_dict(keys=keys) for obj in self.data], indent=indent)
+
     def __str__(self) -> str:
         return '\n'.join([str(obj) for obj in self.data])
 
+    # List methods
+    # ------------
+
+    def __add__(self: TC, other: Iterable[T]) -> TC:
+        return self._copy_with(self.data + list(other))
+
+    def __contains__(self, item) -> bool:
+        return item in self.data
+
+    def __delitem__(self, index):
+        del self.data[index]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._copy_with(self.data[index])
+        return self.data[index]
+
+    def __iadd__(self: TC, other: Iterable[T]) -> TC:
+        self.data.extend(other)
+        return self
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __radd__(self: TC, other: Iterable[T]) -> TC:
+        return self._copy_with(list(other) + self.data)
+
+    def __setitem__(self, index, value):
+        self.data[index] = value
+
+    def append(self, item: T):
+        self.data.append(item)
+
+    def extend(self, other: Iterable[T]):
+        self.data.extend(other)
+
+    def insert(self, index: int, item: T):
+        self.data.insert(index, item)
+
+    def sort(self, *args, **kwargs):
+        self.data.sort(*args, **kwargs)
+
+    def _copy_with(self: TC, data: List[T]) -> TC:
+        """Make a new collection of the same type and attributes, with different items"""
+        obj = copy(self)
+        # Items are already model objects, so skip the field converter
+        object.__setattr__(obj, 'data', data)
+        obj._id_map = None
+        return obj
+
+
+class ModelSchema:
+    """Info about a model class needed to initialize it from JSON, which only needs to be computed
+    once per class. Use :py:func:`.get_schema` to get a cached instance.
+
+    Args:
+        init_keys: Keys that are accepted by the model's ``__init__``, including temp attributes
+        init: The model's original ``__init__``, without any modified signature for documentation
+        serializer_fields: Attribute name, dict key, and whether it's a lazy-loaded list, for each
+            field included in :py:meth:`.BaseModel.to_dict` output
+        serialize: Generated function to convert a model object into a dict
+    """
+
+    def __init__(self, model: Type[BaseModel]):
+        from pyinaturalist.models import get_lazy_properties
+
+        self.model = model
+        self.init_keys = frozenset(
+            [k.lstrip('_') for k, v in fields_dict(model).items() if v.init is True]
+            + list(model.temp_attrs)
+        )
+        self.init = unwrap(model.__init__)
+
+        lazy_lists = {
+            prop.temp_attr for prop in get_lazy_properties(model).values() if prop.is_list
+        }
+        self.serializer_fields: Tuple[Tuple[str, str, bool], ...] = tuple(
+            (a.name, a.name.lstrip('_'), a.name in lazy_lists)
+            for a in fields(model)
+            if a.init is True
+        )
+        self.serialize: Callable[[BaseModel], JsonResponse] = self._make_serializer()
+
+    def construct(self, **kwargs):
+        """Initialize a model object. Equivalent to ``model(**kwargs)``, but skips argument binding
+        for signatures modified by :py:func:`.extend_init_signature`.
+        """
+        obj = self.model.__new__(self.model)
+        self.init(obj, **kwargs)
+        return obj
+
+    def _make_serializer(self) -> Callable[[BaseModel], JsonResponse]:
+        """Generate a function that converts a model object into a dict with a single dict literal,
+        similar to how ``attrs`` generates ``__init__`` methods
+        """
+        lines = ['def serialize(obj):', '    return {']
+        for attr, key, is_lazy_list in self.serializer_fields:
+            func = '_serialize_lazy_list' if is_lazy_list else '_serialize'
+            lines.append(f'        {key!r}: {func}(obj.{attr}),')
+        lines.append('    }')
+
+        namespace = {'_serialize': _serialize, '_serialize_lazy_list': _serialize_lazy_list}
+        filename = f'<generated serializer {self.model.__module__}.{self.model.__qualname__}>'
+        exec(compile('\n'.join(lines), filename, 'exec'), namespace)
+        return namespace['serialize']  # type: ignore
+
+
+@lru_cache(maxsize=None)
+def get_schema(model: Type[BaseModel]) -> ModelSchema:
+    """Get the schema for a model class"""
+    return ModelSchema(model)
+
+
+def dump_json(value: Any, indent: Optional[int] = None) -> str:
+    """Serialize a JSON-compatible object, with handling for datetimes and model objects. Uses orjson
+    or ujson if installed.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(value, default=_json_default, option=option).decode()
+    kwargs = {'indent': indent} if indent else {}
+    return json.dumps(value, default=_json_default, **kwargs)
+
 
 def load_json(value: ResponseOrFile) -> ResponseOrResults:
     """Load a JSON string, file path, or file-like object"""
@@ -256,3 +441,39 @@ def load_json(value: ResponseOrFile) -> ResponseOrResults:
     if 'results' in json_value:
         json_value = json_value['results']
     return json_value
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    """Handle types that aren't natively supported by JSON serializers"""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, BaseModel):
+        return value.to_dict()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def _serialize(value: Any) -> Any:
+    """Recursively convert any model objects within a value into dicts. Containers are copied, and
+    other values are returned as-is.
+    """
+    value_type = type(value)
+    if value_type in ATOMIC_TYPES:
+        return value
+    if isinstance(value, BaseModel):
+        return value.to_dict()
+    if value_type in (list, tuple, set):
+        return value_type(_serialize(v) for v in value)
+    if value_type is dict:
+        return {k: _serialize(v) for k, v in value.items()}
+    return value
+
+
+def _serialize_lazy_list(value: Any) -> Any:
+    """Lazy-loaded lists that were never set or accessed are stored as None"""
+    return [] if value is None else _serialize(value)
@@ -24,7 +24,7 @@ class ControlledTermValue(BaseModel):
     """
 
     blocking: bool = field(default=None)
-    label: str = field(default=None)
+    label: str = field(default=None, intern=True)
     ontology_uri: str = field(default=None)
     uri: str = field(default=None)
     uuid: str = field(default=None)
@@ -43,7 +43,7 @@ class ControlledTerm(BaseModel):
 
     is_value: bool = field(default=None)
     multivalued: bool = field(default=None)
-    label: str = field(default=None)
+    label: str = field(default=None, intern=True)
     ontology_uri: str = field(default=None)
     uri: str = field(default=None)
     uuid: str = field(default=None)
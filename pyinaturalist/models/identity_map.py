@@ -0,0 +1,186 @@
+from collections import OrderedDict
+from functools import lru_cache
+from inspect import isclass
+from threading import RLock
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+import attr
+
+from pyinaturalist.constants import JsonResponse, ResponseResult
+from pyinaturalist.models import BaseModel, Taxon, User
+from pyinaturalist.models.lazy_property import get_lazy_properties
+
+# Default maximum number of shared objects to keep in an IdentityMap
+IDENTITY_MAP_MAX_SIZE = 10000
+
+
+class IdentityMap:
+    """Keeps a single shared instance of each nested model object, by ID. For example, in a page of
+    observations of the same species, all observations and identifications of that species will
+    refer to the same :py:class:`.Taxon` object, instead of each having a separate copy.
+
+    This reduces memory usage and the time needed to convert results into model objects, especially
+    for large numbers of results with many repeated taxa or users. Shared objects are created from the
+    first result they appear in, and updated in place if a later result contains more complete data
+    for the same object (for example, a full taxon record after a partial one that only contains an
+    ID). They should be treated as read-only, since any changes will affect all results that refer to
+    them.
+
+    At most ``max_size`` objects are kept, and the least recently used objects are removed first.
+    Removed objects are still valid, but won't be shared with later results. An identity map that is
+    reused across many requests can be emptied with :py:meth:`.clear`.
+
+    Example:
+
+        Use a separate identity map for each paginator created by a client:
+
+        >>> from pyinaturalist import iNatClient
+        >>> client = iNatClient(identity_map=True)
+        >>> observations = client.observations.search(taxon_id=48662).all()
+        >>> observations[0].taxon is observations[1].taxon
+        True
+
+        Or share one identity map across all requests made by a client:
+
+        >>> from pyinaturalist import IdentityMap
+        >>> client = iNatClient(identity_map=IdentityMap())
+
+        Or use one for a single paginator:
+
+        >>> from pyinaturalist import Paginator, Taxon, get_taxa
+        >>> taxa = Paginator(get_taxa, Taxon, q='vespa', identity_map=True).all()
+
+    Args:
+        models: Model classes to deduplicate
+        max_size: Maximum number of objects to keep, or ``None`` for no limit
+    """
+
+    def __init__(
+        self,
+        models: Iterable[Type[BaseModel]] = (Taxon, User),
+        max_size: Optional[int] = IDENTITY_MAP_MAX_SIZE,
+    ):
+        self.models = tuple(models)
+        self.max_size = max_size
+        self._objects: OrderedDict[Tuple[Type[BaseModel], int], BaseModel] = OrderedDict()
+        # Size of each JSON value seen so far for each object, to check if a later record has more data
+        self._sizes: Dict[Tuple[Type[BaseModel], int], Dict[str, int]] = {}
+        self._lock = RLock()
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def clear(self):
+        """Remove all stored objects. Objects already shared by results are not affected, but won't
+        be shared with any later results.
+        """
+        with self._lock:
+            self._objects.clear()
+            self._sizes.clear()
+
+    def dedupe(self, results: List[ResponseResult], model: Type[BaseModel]) -> List[ResponseResult]:
+        """Replace JSON for any nested model objects in the given results with shared model
+        objects. Results are modified in place, and can then be converted as usual with
+        ``model.from_json_list()``.
+
+        Args:
+            results: JSON results to deduplicate
+            model: Model class of the results
+        """
+        with self._lock:
+            for result in results:
+                self._dedupe_nested(result, model)
+        return results
+
+    def get(self, value: JsonResponse, model: Type[BaseModel]) -> BaseModel:
+        """Get the shared model object for a JSON record, or create one if it doesn't exist yet. If
+        the record contains more data than previous records for the same object, the shared object
+        is updated with the additional values.
+        """
+        key = (model, value['id'])
+        with self._lock:
+            self._dedupe_nested(value, model)
+            obj = self._objects.get(key)
+            if obj is None:
+                self._sizes[key] = {k: _get_size(v) for k, v in value.items()}
+                obj = self._objects[key] = model.from_json(value)
+                self._evict()
+            else:
+                self._objects.move_to_end(key)
+                if self._update_sizes(key, value):
+                    _merge_objects(obj, model.from_json(value))
+        return obj
+
+    def _evict(self):
+        """Remove the least recently used objects, if over the size limit"""
+        while self.max_size is not None and len(self._objects) > self.max_size:
+            key, _ = self._objects.popitem(last=False)
+            del self._sizes[key]
+
+    def _update_sizes(self, key: Tuple[Type[BaseModel], int], value: JsonResponse) -> bool:
+        """Update stored value sizes for an object, and return True if any values are larger"""
+        sizes = self._sizes[key]
+        has_more_data = False
+        for k, v in value.items():
+            size = _get_size(v)
+            if size > sizes.get(k, 0):
+                sizes[k] = size
+                has_more_data = True
+        return has_more_data
+
+    def _dedupe_nested(self, value: JsonResponse, model: Type[BaseModel]):
+        """Replace nested JSON with shared model objects, including within nested lists"""
+        for name, nested_model, is_list in _get_nested_models(model):  # type: ignore
+            nested_value = value.get(name)
+            if not nested_value:
+                continue
+            if is_list:
+                value[name] = [self._get_or_dedupe(item, nested_model) for item in nested_value]
+            else:
+                value[name] = self._get_or_dedupe(nested_value, nested_model)
+
+    def _get_or_dedupe(self, value, model: Type[BaseModel]):
+        # Skip values that have already been converted into model objects
+        if not isinstance(value, dict):
+            return value
+        if model in self.models and value.get('id') is not None:
+            return self.get(value, model)
+        self._dedupe_nested(value, model)
+        return value
+
+
+def _get_size(value: Any) -> int:
+    """Get a rough measure of how much data a JSON value contains: the number of items for lists
+    and dicts, and 0 or 1 for empty or non-empty single values
+    """
+    if isinstance(value, (list, dict)):
+        return len(value)
+    return int(value is not None and value != '')
+
+
+def _merge_objects(obj: BaseModel, new_obj: BaseModel):
+    """Update a shared object in place with any values from a new object that are missing or
+    empty, or that contain more items
+    """
+    for a in attr.fields(type(obj)):
+        value, new_value = getattr(obj, a.name), getattr(new_obj, a.name)
+        if (not value and new_value) or (
+            isinstance(value, list) and isinstance(new_value, list) and len(new_value) > len(value)
+        ):
+            object.__setattr__(obj, a.name, new_value)
+
+
+@lru_cache
+def _get_nested_models(model: Type[BaseModel]) -> List[Tuple[str, Type[BaseModel], bool]]:
+    """Get the names and model classes of all lazy-loaded nested model properties, and whether they
+    contain a list of objects
+    """
+    nested_models = []
+    for name, prop in get_lazy_properties(model).items():
+        prop_type = prop.type
+        is_list = getattr(prop_type, '__origin__', None) is list
+        if is_list:
+            prop_type = prop_type.__args__[0]
+        if isclass(prop_type) and issubclass(prop_type, BaseModel):
+            nested_models.append((name, prop_type, is_list))
+    return nested_models
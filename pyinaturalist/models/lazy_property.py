@@ -2,7 +2,7 @@ from functools import update_wrapper
 from inspect import signature
 from typing import Any, Callable, Dict, List, Optional, Type
 
-from attr import Attribute, Factory
+from attr import Attribute
 
 from pyinaturalist.models import BaseModel
 
@@ -32,9 +32,13 @@ class LazyProperty(property):
     How it works:
 
     1. During attrs init, the temporary attribute is set containing a raw dict
-    2. When ``foo`` is first accessed, it runs the converter on the temp attribute
+    2. When ``foo`` is first accessed, it runs the converter on the temp attribute, and replaces the
+       raw value with the converted value
     3. When ``foo`` is accessed again, the previously converted temp attribute will be returned
 
+    To reduce memory usage, list properties don't allocate an empty list for each object. If no value
+    was provided, an empty list is only created when the property is first accessed.
+
     Example::
 
         # Just pretend these are expensive conversion functions
@@ -51,7 +55,7 @@ class LazyProperty(property):
 
             # Auto-generated temp attributes will look like:
             # _str_field = field(default=None)
-            # _list_field = field(factory=list)
+            # _list_field = field(default=None)
 
     """
 
@@ -67,14 +71,11 @@ class LazyProperty(property):
         self.converter = converter
         self.converter_kwargs = converter_kwargs
         self.default: Any = None
+        self.is_list = _returns_list(converter)
         self.type = type
         self.__doc__ = doc
         self.__set_name__(None, name)
 
-        # Use either a list factory or default value, depending on the converter's return type
-        if _returns_list(converter):
-            self.default = Factory(list)
-
     def __get__(self, obj, cls):
         """When accessing the value, convert it if it hasn't already been, and cache the converted
         value for subsequent calls.
@@ -86,6 +87,9 @@ class LazyProperty(property):
         if value and not _is_model_object_or_list(value):
             value = self.converter(value, **self.converter_kwargs)
             setattr(obj, self.temp_attr, value)
+        elif value is None and self.is_list:
+            value = []
+            setattr(obj, self.temp_attr, value)
 
         return value
 
@@ -99,8 +103,13 @@ class LazyProperty(property):
         self.temp_attr = f'_{name}'
 
     def get_lazy_attr(self) -> Attribute:
-        """Get a temp attribute to be used by this LazyProperty instance"""
-        return make_attribute(self.temp_attr, init=True, repr=False, default=self.default)
+        """Get a temp attribute to be used by this LazyProperty instance. For list properties, a
+        missing value and an empty list are considered equal.
+        """
+        eq_key = _empty_to_none if self.is_list else None
+        return make_attribute(
+            self.temp_attr, init=True, repr=False, default=self.default, eq=True, eq_key=eq_key
+        )
 
 
 def add_lazy_attrs(cls, fields):
@@ -113,7 +122,13 @@ def add_lazy_attrs(cls, fields):
 
 
 def get_lazy_properties(cls: Type[BaseModel]) -> Dict[str, LazyProperty]:
-    return {k: v for k, v in cls.__dict__.items() if isinstance(v, LazyProperty)}
+    """Get all LazyProperties for a model class, including any inherited from parent classes"""
+    return {
+        k: v
+        for c in reversed(cls.__mro__)
+        for k, v in c.__dict__.items()
+        if isinstance(v, LazyProperty)
+    }
 
 
 def make_attribute(name, **kwargs):
@@ -121,6 +136,10 @@ def make_attribute(name, **kwargs):
     return Attribute(name=name, **kwargs)
 
 
+def _empty_to_none(value):
+    return value or None
+
+
 # TODO: Make this more generic by looking for converter function return type instead of BaseModel?
 def _is_model_object_or_list(value):
     try:
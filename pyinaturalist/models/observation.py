@@ -145,9 +145,9 @@ class Observation(BaseModel):
         default=None, doc='Indicates if the organism is non-wild (captive or cultivated)'
     )
     community_taxon_id: int = field(default=None, doc='The current community identification taxon')
-    context_geoprivacy: str = field(default=None)
-    context_taxon_geoprivacy: str = field(default=None)
-    context_user_geoprivacy: str = field(default=None)
+    context_geoprivacy: str = field(default=None, intern=True)
+    context_taxon_geoprivacy: str = field(default=None, intern=True)
+    context_user_geoprivacy: str = field(default=None, intern=True)
     description: str = field(default=None, doc='Observation description')
     geoprivacy: str = field(default=None, options=GEOPRIVACY_LEVELS, doc='Location privacy level')
     identifications_count: int = field(default=0, doc='Total number of identifications')
@@ -229,7 +229,7 @@ class Observation(BaseModel):
         default=None, doc="Taxon name from observer's initial identification"
     )
     tags: List[str] = field(factory=list, doc='Arbitrary user tags added to the observation')
-    taxon_geoprivacy: str = field(default=None)
+    taxon_geoprivacy: str = field(default=None, intern=True)
     updated_at: DateTime = datetime_field(doc='Date and time the observation was last updated')
     uri: str = field(default=None, doc='Link to observation details page')
     uuid: str = field(
@@ -309,7 +309,7 @@ class Observation(BaseModel):
     def __init__(self, **kwargs):
         # Convert observation timestamps prior to __attrs_init__
         observed_on = kwargs.pop('time_observed_at', None)
-        if not isinstance(kwargs['observed_on'], datetime) and observed_on:
+        if not isinstance(kwargs.get('observed_on'), datetime) and observed_on:
             kwargs['observed_on'] = observed_on
 
         # Set default URL based on observation ID
@@ -0,0 +1,416 @@
+"""A columnar collection of observations, for fast analysis of large numbers of records.
+Requires installing `numpy <https://numpy.org>`_.
+"""
+
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from pyinaturalist.constants import ResponseOrResults, ResponseResult
+from pyinaturalist.converters import convert_lat_long, try_datetime
+from pyinaturalist.models import Observation, Taxon, User
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+
+# Value used for missing IDs in integer columns, and missing values in boolean columns
+NULL_ID = -1
+# Number of results to convert at once when building from an iterable of individual results
+CHUNK_SIZE = 10000
+
+ID_COLUMNS = ('id', 'taxon_id', 'user_id')
+FLOAT_COLUMNS = ('latitude', 'longitude', 'positional_accuracy')
+BOOL_COLUMNS = ('captive',)
+DATETIME_COLUMNS = ('observed_on', 'created_at', 'updated_at')
+STRING_COLUMNS = (
+    'quality_grade',
+    'geoprivacy',
+    'taxon_name',
+    'taxon_rank',
+    'iconic_taxon_name',
+    'user_login',
+)
+COLUMNS = ID_COLUMNS + FLOAT_COLUMNS + BOOL_COLUMNS + DATETIME_COLUMNS + STRING_COLUMNS
+
+HISTOGRAM_INTERVALS = {'year': 'Y', 'month': 'M', 'day': 'D', 'hour': 'h'}
+
+Index = Union[int, slice, List[int], 'np.ndarray']
+
+
+class ObservationFrame:
+    """:fa:`table` A columnar collection of observations, with values for each field stored in a
+    typed NumPy array. String fields are dictionary-encoded, and timestamps are stored in UTC.
+
+    Compared to a list of :py:class:`.Observation` objects, this uses much less memory, and filtering,
+    grouping, and counting can be done without looping over individual records in python. Full
+    :py:class:`.Observation` objects can be created for individual rows as needed.
+
+    Example:
+
+        Build from a paginated search, one page at a time:
+
+        >>> from pyinaturalist import ObservationFrame, iNatClient
+        >>> client = iNatClient()
+        >>> pages = client.observations.search(place_id=6803).iter_pages(raw=True)
+        >>> frame = ObservationFrame.from_pages(pages)
+
+        Filter, count, and group results:
+
+        >>> research_grade = frame.filter(quality_grade='research')
+        >>> research_grade.filter_bbox(nelat=-36.8, nelng=174.9, swlat=-37.0, swlng=174.7)
+        >>> research_grade.value_counts('taxon_name')
+        {'Passer domesticus': 512, 'Turdus merula': 347, ...}
+        >>> frame.histogram('month')
+        {datetime(2023, 1, 1, 0, 0): 1204, datetime(2023, 2, 1, 0, 0): 1351, ...}
+
+        Get a single row as an :py:class:`.Observation`:
+
+        >>> obs = frame[0]
+
+    Args:
+        columns: Arrays of values for each column, all of the same length. String columns contain
+            integer codes that refer to values in ``categories``, with ``-1`` for missing values.
+            Boolean columns contain ``1`` for true, ``0`` for false, and ``-1`` for missing values.
+        categories: Unique values for each string column
+        results: Original JSON results, if they should be kept for creating full
+            :py:class:`.Observation` objects
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, 'np.ndarray'],
+        categories: Dict[str, List[str]],
+        results: Optional[List[ResponseResult]] = None,
+    ):
+        _check_numpy()
+        self._columns = columns
+        self._categories = categories
+        self._results = results
+
+    @classmethod
+    def from_json_list(
+        cls, value: Union[ResponseOrResults, Iterable[ResponseResult]], keep_json: bool = False
+    ) -> 'ObservationFrame':
+        """Create a frame from an API response or an iterable of observation results (for example,
+        from :py:func:`.iter_all`). Results are converted in chunks, so an iterator is never fully
+        loaded into memory.
+
+        Args:
+            value: API response or observation results
+            keep_json: Keep the original JSON results, so :py:meth:`.get_observation` can return
+                complete records. This uses much more memory.
+        """
+        results = value.get('results', [value]) if isinstance(value, dict) else value
+        iterator: Iterator[ResponseResult] = iter(results)
+        pages = iter(lambda: list(islice(iterator, CHUNK_SIZE)), [])
+        return cls.from_pages(pages, keep_json=keep_json)
+
+    @classmethod
+    def from_pages(
+        cls, pages: Iterable[List[ResponseResult]], keep_json: bool = False
+    ) -> 'ObservationFrame':
+        """Create a frame from pages of observation results (for example, from
+        :py:meth:`.Paginator.iter_pages` with ``raw=True``). Each page is converted to arrays as soon
+        as it's received.
+
+        Args:
+            pages: Pages of observation results
+            keep_json: Keep the original JSON results, so :py:meth:`.get_observation` can return
+                complete records. This uses much more memory.
+        """
+        _check_numpy()
+        encoders: Dict[str, Dict[str, int]] = {k: {} for k in STRING_COLUMNS}
+        chunks: Dict[str, List[np.ndarray]] = {k: [] for k in COLUMNS}
+        results: Optional[List[ResponseResult]] = [] if keep_json else None
+
+        for page in pages:
+            for column, array in _convert_page(page, encoders).items():
+                chunks[column].append(array)
+            if results is not None:
+                results.extend(page)
+
+        columns = {
+            k: np.concatenate(v) if v else np.array([], dtype=_get_dtype(k))
+            for k, v in chunks.items()
+        }
+        categories = {k: list(encoder) for k, encoder in encoders.items()}
+        return cls(columns, categories, results)
+
+    def __getitem__(self, key: Union[str, Index]) -> Any:
+        """Get a column by name, a single :py:class:`.Observation` by position, or a new frame
+        containing a subset of rows (by slice, boolean mask, or array of positions)
+        """
+        if isinstance(key, str):
+            return self.get_column(key)
+        elif isinstance(key, (int, np.integer)):
+            return self.get_observation(int(key))
+
+        columns = {k: v[key] for k, v in self._columns.items()}
+        results = None
+        if self._results is not None:
+            results = [self._results[i] for i in np.arange(len(self))[key]]
+        return ObservationFrame(columns, self._categories, results)
+
+    def __iter__(self) -> Iterator[Observation]:
+        """Iterate over all rows as :py:class:`.Observation` objects"""
+        for i in range(len(self)):
+            yield self.get_observation(i)
+
+    def __len__(self) -> int:
+        return len(self._columns['id'])
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({len(self)} observations)'
+
+    @property
+    def columns(self) -> List[str]:
+        """Names of all available columns"""
+        return list(self._columns)
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of all column arrays, in bytes"""
+        return sum(array.nbytes for array in self._columns.values())
+
+    def get_column(self, column: str) -> 'np.ndarray':
+        """Get all values for a column. String and boolean columns are decoded into an array of
+        objects, with ``None`` for missing values.
+        """
+        if column not in self._columns:
+            raise KeyError(f'Invalid column: {column}. Available columns: {self.columns}')
+        values = self._columns[column]
+        if column in STRING_COLUMNS:
+            # A code of -1 refers to the last item, which is None
+            return np.array(self._categories[column] + [None], dtype=object)[values]
+        elif column in BOOL_COLUMNS:
+            return np.array([False, True, None], dtype=object)[values]
+        return values
+
+    def get_observation(self, index: int) -> Observation:
+        """Create an :py:class:`.Observation` object for a single row. If the frame was created with
+        ``keep_json=True``, this will contain all fields from the original result; otherwise, it will
+        only contain the fields stored in this frame.
+        """
+        if self._results is not None:
+            return Observation.from_json(self._results[index])
+
+        row = {k: self._get_value(k, index) for k in COLUMNS}
+        location = (row['latitude'], row['longitude'])
+        taxon = None
+        if row['taxon_id'] is not None:
+            taxon = Taxon.from_json(
+                {
+                    'id': row['taxon_id'],
+                    'name': row['taxon_name'],
+                    'rank': row['taxon_rank'],
+                    'iconic_taxon_name': row['iconic_taxon_name'],
+                }
+            )
+        return Observation(
+            id=row['id'],
+            captive=row['captive'],
+            created_at=row['created_at'],
+            geoprivacy=row['geoprivacy'],
+            location=location if None not in location else None,
+            observed_on=row['observed_on'],
+            positional_accuracy=(
+                int(row['positional_accuracy']) if row['positional_accuracy'] is not None else None
+            ),
+            quality_grade=row['quality_grade'],
+            taxon=taxon,
+            updated_at=row['updated_at'],
+            user=User.from_json({'id': row['user_id'], 'login': row['user_login']}),
+        )
+
+    def filter(self, mask: Optional['np.ndarray'] = None, **conditions) -> 'ObservationFrame':
+        """Get a new frame containing only rows that match all of the given conditions
+
+        Example:
+
+            >>> frame.filter(quality_grade='research', taxon_id=[3, 47158])
+            >>> frame.filter(frame['positional_accuracy'] < 100)
+
+        Args:
+            mask: A boolean array of rows to include
+            conditions: Column names and values to match. Multiple values may be given as a list.
+        """
+        mask = np.ones(len(self), dtype=bool) if mask is None else np.array(mask, dtype=bool)
+        for column, values in conditions.items():
+            mask &= self._match(column, values)
+        return self[mask]
+
+    def filter_bbox(
+        self, nelat: float, nelng: float, swlat: float, swlng: float
+    ) -> 'ObservationFrame':
+        """Get a new frame containing only rows within a bounding box"""
+        lat = self._columns['latitude']
+        lng = self._columns['longitude']
+        return self[(lat <= nelat) & (lat >= swlat) & (lng <= nelng) & (lng >= swlng)]
+
+    def filter_dates(
+        self,
+        d1: Union[datetime, str, None] = None,
+        d2: Union[datetime, str, None] = None,
+        column: str = 'observed_on',
+    ) -> 'ObservationFrame':
+        """Get a new frame containing only rows within a date range (inclusive)
+
+        Args:
+            d1: Start date
+            d2: End date
+            column: Date column to filter on
+        """
+        values = self._columns[column]
+        mask = ~np.isnat(values)
+        if d1:
+            mask &= values >= _to_datetime64(d1)
+        if d2:
+            mask &= values <= _to_datetime64(d2)
+        return self[mask]
+
+    def group_by(self, column: str) -> Dict[Any, 'ObservationFrame']:
+        """Split rows into a new frame for each unique value of a column"""
+        keys, inverse = np.unique(self._columns[column], return_inverse=True)
+        order = np.argsort(inverse, kind='stable')
+        splits = np.cumsum(np.bincount(inverse, minlength=len(keys)))[:-1]
+        return {
+            self._decode(column, key): self[indices]
+            for key, indices in zip(keys, np.split(order, splits))
+        }
+
+    def histogram(
+        self, interval: str = 'month', column: str = 'observed_on'
+    ) -> Dict[datetime, int]:
+        """Count observations per time interval, in the same format as
+        :py:func:`.get_observation_histogram`
+
+        Args:
+            interval: Time interval to group by: ``'year'``, ``'month'``, ``'day'``, or ``'hour'``
+            column: Date column to use
+        """
+        if interval not in HISTOGRAM_INTERVALS:
+            raise ValueError(f'Invalid interval: {interval}. Options: {list(HISTOGRAM_INTERVALS)}')
+        values = self._columns[column]
+        values = values[~np.isnat(values)].astype(f'datetime64[{HISTOGRAM_INTERVALS[interval]}]')
+        keys, counts = np.unique(values, return_counts=True)
+        return {key.astype('datetime64[us]').item(): int(count) for key, count in zip(keys, counts)}
+
+    def value_counts(self, column: str) -> Dict[Any, int]:
+        """Count observations for each unique value of a column, sorted by count (descending)"""
+        keys, counts = np.unique(self._columns[column], return_counts=True)
+        order = np.argsort(-counts, kind='stable')
+        return {self._decode(column, keys[i]): int(counts[i]) for i in order}
+
+    def _decode(self, column: str, value: Any) -> Any:
+        """Convert a single stored value into a python object"""
+        if column in STRING_COLUMNS:
+            return None if value == -1 else self._categories[column][value]
+        elif column in ID_COLUMNS:
+            return None if value == NULL_ID else int(value)
+        elif column in BOOL_COLUMNS:
+            return None if value == NULL_ID else bool(value)
+        elif column in FLOAT_COLUMNS:
+            return None if np.isnan(value) else float(value)
+        elif column in DATETIME_COLUMNS:
+            return None if np.isnat(value) else value.item().replace(tzinfo=timezone.utc)
+        return value.item()
+
+    def _get_value(self, column: str, index: int) -> Any:
+        return self._decode(column, self._columns[column][index])
+
+    def _match(self, column: str, values: Any) -> 'np.ndarray':
+        """Get a boolean array of rows where a column matches any of the given values"""
+        if column not in self._columns:
+            raise KeyError(f'Invalid column: {column}. Available columns: {self.columns}')
+        values = values if isinstance(values, (list, tuple, set)) else [values]
+        if column in STRING_COLUMNS:
+            codes = {v: i for i, v in enumerate(self._categories[column])}
+            values = [codes.get(v, -2) if v is not None else -1 for v in values]
+        elif column in ID_COLUMNS:
+            values = [NULL_ID if v is None else v for v in values]
+        elif column in BOOL_COLUMNS:
+            values = [NULL_ID if v is None else int(bool(v)) for v in values]
+        return np.isin(self._columns[column], list(values))
+
+
+def _check_numpy():
+    if np is None:
+        raise ImportError('ObservationFrame requires numpy. To install: pip install numpy')
+
+
+def _convert_page(
+    page: List[ResponseResult], encoders: Dict[str, Dict[str, int]]
+) -> Dict[str, 'np.ndarray']:
+    """Convert a page of observation results into an array for each column"""
+    rows = [_get_row(obs) for obs in page]
+    values = dict(zip(COLUMNS, zip(*rows))) if rows else {k: () for k in COLUMNS}
+
+    columns = {}
+    for column in COLUMNS:
+        if column in STRING_COLUMNS:
+            encoder = encoders[column]
+            codes = [
+                -1 if v is None else encoder.setdefault(v, len(encoder)) for v in values[column]
+            ]
+            columns[column] = np.array(codes, dtype=_get_dtype(column))
+        else:
+            columns[column] = np.array(values[column], dtype=_get_dtype(column))
+    return columns
+
+
+def _get_row(obs: ResponseResult) -> Tuple:
+    """Get values for each column from a single observation result, in the same order as
+    ``COLUMNS``. Accepts results from any API version, either before or after conversion (for
+    example, with timestamps as either strings or datetimes).
+    """
+    taxon = obs.get('taxon') or {}
+    user = obs.get('user') or {}
+    latitude, longitude = convert_lat_long(obs.get('location') or obs) or (None, None)
+    taxon_id = obs.get('taxon_id') or taxon.get('id')
+    user_id = obs.get('user_id') or user.get('id')
+    captive = obs.get('captive')
+
+    return (
+        obs['id'],
+        NULL_ID if taxon_id is None else taxon_id,
+        NULL_ID if user_id is None else user_id,
+        latitude,
+        longitude,
+        obs.get('positional_accuracy'),
+        NULL_ID if captive is None else int(bool(captive)),
+        _to_utc(obs.get('time_observed_at') or obs.get('observed_on')),
+        _to_utc(obs.get('created_at')),
+        _to_utc(obs.get('updated_at')),
+        obs.get('quality_grade'),
+        obs.get('geoprivacy'),
+        taxon.get('name'),
+        taxon.get('rank'),
+        taxon.get('iconic_taxon_name'),
+        obs.get('user_login') or user.get('login'),
+    )
+
+
+def _get_dtype(column: str) -> str:
+    if column in ID_COLUMNS:
+        return 'int64'
+    elif column in FLOAT_COLUMNS:
+        return 'float64'
+    elif column in BOOL_COLUMNS:
+        return 'int8'
+    elif column in DATETIME_COLUMNS:
+        return 'datetime64[us]'
+    return 'int32'
+
+
+def _to_utc(value: Any) -> Optional[datetime]:
+    """Parse a timestamp, and convert it to a naive datetime in UTC"""
+    dt = try_datetime(value)
+    if dt is not None and dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def _to_datetime64(value: Union[datetime, str]) -> 'np.datetime64':
+    return np.datetime64(_to_utc(value), 'us')
@@ -0,0 +1,176 @@
+from functools import lru_cache
+from inspect import isclass
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Type, Union
+
+import attr
+
+from pyinaturalist.models import BaseModel, LazyProperty, add_lazy_attrs, get_lazy_properties
+
+# Requested fields, in any of the formats accepted by the v2 API: a comma-separated string, a list of
+# field names (optionally with dot notation for nested fields), or a nested dict
+FieldSelection = Union[str, Iterable[str], Dict[str, Any]]
+# Hashable version of a nested field selection: (name, nested selection or None for all fields)
+FrozenSelection = Tuple[Tuple[str, Optional['FrozenSelection']], ...]  # type: ignore
+
+
+@attr.define(auto_attribs=False)
+class ProjectedModel(BaseModel):
+    """Base class for projected models, which contain only a subset of a model's attributes. Use
+    :py:func:`.get_projection` to create a projected model class.
+
+    Accessing an attribute of the original model that wasn't included in the projection raises an
+    ``AttributeError`` that says so, instead of silently returning a default value.
+    """
+
+    model: Type[BaseModel] = BaseModel
+    projected_fields: Tuple[str, ...] = ()
+
+    @property
+    def _str_attrs(self):
+        return [name for name in self.projected_fields if name in self.__class__.__dict__]
+
+    def __getattr__(self, name: str):
+        model = self.__class__.model
+        if name in _get_attr_names(model):  # type: ignore
+            raise AttributeError(
+                f"'{name}' was not included in the selected fields for this {model.__name__} "
+                f"projection. Selected fields: {', '.join(self.projected_fields)}"
+            )
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+
+def get_projection(model: Type[BaseModel], fields: FieldSelection) -> Type[BaseModel]:
+    """Get a lightweight version of a model class that only contains the selected fields. This is
+    mainly useful for API v2 requests that only return some fields, where initializing (and
+    storing) the full model would be wasteful.
+
+    Projected models are slotted classes that only hold the selected attributes (plus ``id`` and
+    ``uuid``), and skip any default values and extra processing for other fields. Nested model
+    fields can also be projected, and any properties of the original model that only depend on
+    selected fields will still work.
+
+    Projected classes are cached, so calling this again with the same model and fields returns the
+    same class.
+
+    Example:
+
+        >>> from pyinaturalist import Observation, get_observations_v2
+        >>> fields = {'quality_grade': True, 'taxon': {'name': True, 'rank': True}}
+        >>> response = get_observations_v2(taxon_id=47219, fields=fields)
+        >>> ObsProjection = get_projection(Observation, fields)
+        >>> observations = ObsProjection.from_json_list(response)
+        >>> observations[0].taxon.name
+        'Apis mellifera'
+        >>> observations[0].observed_on
+        AttributeError: 'observed_on' was not included in the selected fields for this Observation projection
+
+    Args:
+        model: Model class to project
+        fields: Fields to include, in the same format as the v2 API ``fields`` parameter. May be a
+            comma-separated string, a list of field names (with dot notation for nested fields,
+            like ``taxon.name``), or a nested dict.
+
+    Returns:
+        A projected model class, or the original model class if ``fields='all'``
+    """
+    if fields == 'all':
+        return model
+    return _make_projection(model, _freeze(_parse_fields(fields)))  # type: ignore
+
+
+def _parse_fields(fields: FieldSelection) -> Dict[str, Optional[Dict]]:
+    """Parse a field selection into a nested dict, with ``None`` for non-nested (or all) fields"""
+    if isinstance(fields, dict):
+        return {
+            k: _parse_fields(v) if isinstance(v, (dict, list, str)) else None
+            for k, v in fields.items()
+            if v
+        }
+    if isinstance(fields, str):
+        fields = fields.split(',')
+
+    # Group nested field names (like 'taxon.name') by top-level field name
+    nested_names: Dict[str, List[str]] = {}
+    for field_name in fields:
+        name, _, nested_name = field_name.strip().partition('.')
+        nested_names.setdefault(name, []).append(nested_name)
+
+    # Selecting a field without nested names means selecting all of its nested fields
+    return {
+        name: None if '' in names else _parse_fields(names) for name, names in nested_names.items()
+    }
+
+
+def _freeze(parsed: Optional[Dict]) -> Optional[FrozenSelection]:
+    if parsed is None:
+        return None
+    return tuple(sorted((k, _freeze(v)) for k, v in parsed.items()))
+
+
+@lru_cache(maxsize=None)
+def _make_projection(model: Type[BaseModel], selection: FrozenSelection) -> Type[BaseModel]:
+    model_fields = {a.name: a for a in attr.fields(model) if a.init is True}
+    lazy_properties = get_lazy_properties(model)
+    namespace: Dict[str, Any] = {
+        '__doc__': f'{model.__name__} projection with fields: {", ".join(k for k, _ in selection)}',
+        '__module__': model.__module__,
+        'model': model,
+        'projected_fields': tuple(k for k, _ in selection),
+    }
+
+    for name, nested_selection in selection:
+        if name in lazy_properties:
+            namespace[name] = _project_lazy_property(lazy_properties[name], nested_selection)
+        elif name in model_fields:
+            namespace[name] = _copy_field(model_fields[name])
+
+    # Keep any regular properties of the original model (like Observation.username), which will work
+    # as long as the attributes they use were selected
+    for cls in reversed(model.__mro__[: model.__mro__.index(BaseModel)]):
+        for name, value in cls.__dict__.items():
+            if (
+                isinstance(value, property)
+                and not isinstance(value, LazyProperty)
+                and not name.startswith('_')
+                and name not in namespace
+            ):
+                namespace[name] = value
+
+    projected_cls = type(model.__name__, (ProjectedModel,), namespace)
+    return attr.define(auto_attribs=False, field_transformer=add_lazy_attrs)(projected_cls)
+
+
+def _project_lazy_property(
+    prop: LazyProperty, selection: Optional[FrozenSelection]
+) -> LazyProperty:
+    """Copy a lazy-loaded property, and project its nested model if only some fields are selected"""
+    converter = prop.converter
+    nested_model = getattr(prop.type, '__args__', [prop.type])[0]
+    if selection and isclass(nested_model) and issubclass(nested_model, BaseModel):
+        nested_projection = _make_projection(nested_model, selection)  # type: ignore
+        converter = (
+            nested_projection.from_json_list if prop.is_list else nested_projection.from_json
+        )
+    return LazyProperty(converter, type=prop.type, doc=prop.__doc__, **prop.converter_kwargs)
+
+
+def _copy_field(a: attr.Attribute):
+    """Make a new field definition from an existing attribute"""
+    return attr.field(
+        default=a.default,
+        validator=a.validator,
+        repr=a.repr,
+        eq=a.eq,
+        converter=a.converter,
+        metadata=dict(a.metadata),
+        type=a.type,
+        kw_only=a.kw_only,
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_attr_names(model: Type[BaseModel]) -> FrozenSet[str]:
+    """Get the names of all public attributes and properties of a model class"""
+    return frozenset(
+        name.lstrip('_') for cls in model.__mro__ for name in vars(cls) if not name.startswith('__')
+    )
@@ -50,7 +50,7 @@ class Taxon(BaseModel):
         doc='Taxon IDs of ancestors, from highest rank to lowest',
     )
     complete_rank: str = field(
-        default=None, doc='Complete or "leaf taxon" rank, e.g. species or subspecies'
+        default=None, intern=True, doc='Complete or "leaf taxon" rank, e.g. species or subspecies'
     )
     complete_species_count: int = field(
         default=None, doc='Total number of species descended from this taxon'
@@ -65,7 +65,7 @@ class Taxon(BaseModel):
         default=0, doc='ID of the iconic taxon (e.g., general taxon "category")'
     )
     iconic_taxon_name: str = field(
-        default=None, doc='Name of the iconic taxon (e.g., general taxon "category")'
+        default=None, intern=True, doc='Name of the iconic taxon (e.g., general taxon "category")'
     )
     is_active: bool = field(
         default=None, doc='Indicates if the taxon is active (and not renamed, moved, etc.)'
@@ -1,21 +1,35 @@
 """Classes to handle pagination of API requests"""
 
+import json
 from asyncio import AbstractEventLoop, get_running_loop
 from collections import deque
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from itertools import islice
 from logging import getLogger
 from math import ceil
+from pathlib import Path
+from queue import Full, Queue
+from threading import Condition, Event, Thread
+from time import monotonic
 from typing import (
     TYPE_CHECKING,
+    Any,
     AsyncIterable,
     AsyncIterator,
+    Awaitable,
     Callable,
+    Deque,
+    Dict,
     Generic,
     Iterable,
     Iterator,
     List,
     Optional,
+    Set,
+    Tuple,
     Type,
+    Union,
 )
 
 from requests import Response
@@ -27,13 +41,19 @@ from pyinaturalist.constants import (
     REQUESTS_PER_MINUTE,
     IntOrStr,
     JsonResponse,
+    PathOrStr,
     RequestParams,
     ResponseResult,
+    TimeInterval,
 )
-from pyinaturalist.models import T
+from pyinaturalist.models import IdentityMap, T
+from pyinaturalist.request_params import get_interval_ranges
 
 logger = getLogger(__name__)
 
+# Marks the end of a background thread's results in _iter_threaded()
+_DONE = object()
+
 
 # TODO: Add per-endpoint 'max_per_page' parameter to use with Paginator.all()
 class Paginator(Iterable, AsyncIterable, Generic[T]):
@@ -45,9 +65,22 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
         limit: Maximum number of total results to fetch
         per_page: Maximum number of results to fetch per page
         loop: An event loop to use to run any executors used for async iteration
+        async_request_function: An async version of ``request_function``, to use for async
+            iteration instead of sending requests from a separate thread
+        prefetch: Number of upcoming pages to fetch in the background while iterating over results
+        checkpoint: Path to a file used to save pagination state after each page of results. If the
+            file already exists for the same request, iteration will resume where it left off.
+            The file is deleted once all results have been fetched.
+        identity_map: Share a single instance of each nested :py:class:`.Taxon` and
+            :py:class:`.User` object across all results, by ID. Either ``True`` to create a new
+            :py:class:`.IdentityMap` for this paginator, or an existing one to share with other
+            paginators.
         kwargs: Original request parameters
     """
 
+    # Indicates that pages can be requested by page number, and don't depend on previous pages
+    prefetch_page_numbers: bool = True
+
     def __init__(
         self,
         request_function: Callable,
@@ -56,9 +89,19 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
         limit: Optional[int] = None,
         per_page: Optional[int] = None,
         loop: Optional[AbstractEventLoop] = None,
+        async_request_function: Optional[Callable[..., Awaitable]] = None,
+        prefetch: int = 0,
+        checkpoint: Optional[PathOrStr] = None,
+        identity_map: Union[bool, IdentityMap, None] = None,
         **request_kwargs,
     ):
         self.request_function = request_function
+        self.async_request_function = async_request_function
+        self.prefetch = prefetch
+        self.checkpoint = Path(checkpoint).expanduser() if checkpoint else None
+        self.identity_map = identity_map if isinstance(identity_map, IdentityMap) else None
+        if identity_map is True:
+            self.identity_map = IdentityMap()
         self.request_args = request_args
         self.request_kwargs = {k: v for k, v in request_kwargs.items() if v is not None}
         self.request_kwargs.pop('page', None)
@@ -81,19 +124,108 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
                 f'(args={self.request_args}, kwargs={log_kwargs})'
             )
 
+    def __await__(self):
+        """Get all results in a single list (non-blocking). Shortcut for :py:meth:`.async_all`."""
+        return self.async_all().__await__()
+
     async def __aiter__(self) -> AsyncIterator[T]:
-        """Iterate over paginated results, with non-blocking requests sent from a separate thread"""
+        """Iterate over paginated results, with non-blocking requests. If an async request function
+        is available, requests will be sent from the current event loop; otherwise, they will be sent
+        from a separate thread.
+        """
+        self._load_checkpoint()
+        if self.async_request_function is not None and not self._is_concurrent():
+            while not self.exhausted:
+                for result in await self.anext_page():
+                    yield result
+                self._save_checkpoint()
+            return
+
+        pages = self._iter_pages()
+
+        def next_page() -> Optional[List[T]]:
+            page = next(pages, None)
+            return None if page is None else self._convert_page(page)
+
         loop = self.loop or get_running_loop()
         with ThreadPoolExecutor(max_workers=1) as executor:
-            while not self.exhausted:
-                for result in await loop.run_in_executor(executor, self.next_page):
+            while (page := await loop.run_in_executor(executor, next_page)) is not None:
+                for result in page:
                     yield result
+                self._save_checkpoint()
 
     def __iter__(self) -> Iterator[T]:
         """Iterate over paginated results"""
-        while not self.exhausted:
-            for result in self.next_page():
-                yield result
+        for page in self.iter_pages():
+            yield from page
+
+    def iter_pages(self, raw: bool = False) -> Iterator[List]:
+        """Iterate over pages of results
+
+        Args:
+            raw: Get pages of raw JSON results, and skip converting them into model objects
+        """
+        self._load_checkpoint()
+        for page in self._iter_pages():
+            yield page if raw else self._convert_page(page)  # type: ignore
+            self._save_checkpoint()
+
+    def iter_json(self) -> Iterator[ResponseResult]:
+        """Iterate over results as raw JSON, without converting them into model objects. This is
+        faster if only a few fields are needed from each result.
+        """
+        for page in self.iter_pages(raw=True):
+            yield from page
+
+    def to_parquet(self, path: PathOrStr, **kwargs) -> int:
+        """Write all results to a Parquet file, one page at a time, so only one page of results is
+        held in memory at once. Pages are converted directly from JSON, without creating model
+        objects. Requires installing ``pyarrow``.
+
+        Example:
+
+            >>> client.observations.search(place_id=6803).to_parquet('observations.parquet')
+
+        Args:
+            path: Path to Parquet file to write
+            kwargs: Additional keyword arguments for :py:class:`pyarrow.parquet.ParquetWriter`
+
+        Returns:
+            Total number of results written
+        """
+        from pyinaturalist.export import write_parquet
+
+        if self.model is None:
+            raise ValueError('A model class is required to export results')
+        return write_parquet(self.iter_pages(raw=True), path, self.model, **kwargs)
+
+    def pipeline(
+        self, max_pages: int = 2, max_bytes: Optional[int] = None, raw: bool = False
+    ) -> 'PagePipeline':
+        """Fetch pages of results from a background thread while previous pages are being processed.
+        Fetched pages are kept in a limited buffer, and fetching will pause while the buffer is full.
+
+        Example:
+
+            >>> pipeline = client.observations.search(place_id=6803).pipeline(max_pages=5)
+            >>> for page in pipeline:
+            ...     save_to_db(page)
+            >>> print(pipeline.stats)
+
+        Args:
+            max_pages: Maximum number of pages to keep in the buffer
+            max_bytes: Maximum total size of pages to keep in the buffer, based on their size as
+                serialized JSON. A single page larger than this will still be fetched.
+            raw: Get pages of raw JSON results, and skip converting them into model objects
+        """
+        if self.checkpoint:
+            raise ValueError('Checkpoints are not supported with pipelines')
+        return PagePipeline(
+            self._iter_pages(),
+            convert=None if raw else self._convert_page,
+            max_pages=max_pages,
+            max_bytes=max_bytes,
+        )
 
     async def async_all(self) -> List[T]:  # Better name TBD?
         """Get all results in a single list (non-blocking)"""
@@ -130,23 +262,49 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
 
     def next_page(self) -> List[T]:
         """Get the next page of results, as model objects"""
-        return self.model.from_json_list(self._next_page())
+        return self._convert_page(self._next_page())
+
+    async def anext_page(self) -> List[T]:
+        """Get the next page of results, as model objects (non-blocking)"""
+        return self._convert_page(await self._anext_page())
 
     def _next_page(self) -> List[ResponseResult]:
         """Get the next page of results, as raw JSON"""
-        if self.exhausted:
+        request = self._prepare_request()
+        if request is None:
+            return []
+        args, kwargs = request
+        return self._process_response(self.request_function(*args, **kwargs))
+
+    async def _anext_page(self) -> List[ResponseResult]:
+        """Get the next page of results, as raw JSON (non-blocking)"""
+        request = self._prepare_request()
+        if request is None:
             return []
+        args, kwargs = request
+        response = await self.async_request_function(*args, **kwargs)  # type: ignore
+        return self._process_response(response)
+
+    def _convert_page(self, results: List[ResponseResult]) -> List[T]:
+        """Convert a page of raw JSON results into model objects"""
+        if self.identity_map is not None:
+            results = self.identity_map.dedupe(results, self.model)
+        return self.model.from_json_list(results)
+
+    def _prepare_request(self) -> Optional[Tuple[Tuple, RequestParams]]:
+        """Get request args and kwargs for the next page, or ``None`` if there are no more pages"""
+        if self.exhausted:
+            return None
 
         # If a limit is specified, avoid fetching more results than needed
         if self.total_limit and self.results_fetched + self.per_page > self.total_limit:
             self.per_page = self.total_limit - self.results_fetched
 
-        # Fetch results; handle response object or dict
-        response = self.request_function(
-            *self.request_args,
-            **self.request_kwargs,
-            **self._get_pagination_kwargs(),
-        )
+        return self.request_args, {**self.request_kwargs, **self._get_pagination_kwargs()}
+
+    def _process_response(self, response: Any) -> List[ResponseResult]:
+        """Get results from a response, and update pagination state"""
+        # Handle response object or dict
         if isinstance(response, Response):
             response = response.json()
         results = response.get('results', response)
@@ -164,7 +322,131 @@ class Paginator(Iterable, AsyncIterable, Generic[T]):
 
         return results
 
-    # The following two methods may be overridden by subclasses for different pagination methods
+    def _is_concurrent(self) -> bool:
+        """Check if this paginator will send multiple requests at once"""
+        return bool(self.prefetch)
+
+    def _iter_pages(self) -> Iterator[List[ResponseResult]]:
+        """Iterate over pages of raw JSON results"""
+        if self.prefetch:
+            yield from self._iter_prefetched_pages()
+            return
+        while not self.exhausted:
+            yield self._next_page()
+
+    def _iter_prefetched_pages(self) -> Iterator[List[ResponseResult]]:
+        """Iterate over pages of raw JSON results, while fetching up to ``prefetch`` upcoming pages in
+        the background. All requests still go through the session's rate limiter.
+        """
+        if self.prefetch_page_numbers:
+            return self._prefetch_by_page_number()
+        else:
+            return self._prefetch_sequential()
+
+    def _prefetch_by_page_number(self) -> Iterator[List[ResponseResult]]:
+        """Once the total number of results is known, request multiple page numbers at once"""
+        # The first page is needed to get the total number of results
+        yield self._next_page()
+        if self.exhausted:
+            return
+
+        max_results = self.total_results or 0
+        if self.total_limit:
+            max_results = min(max_results, self.total_limit)
+        page_numbers = iter(range(self.page, ceil(max_results / self.per_page) + 1))
+
+        futures: Deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=self.prefetch) as executor:
+            try:
+                while not self.exhausted:
+                    for page in islice(page_numbers, self.prefetch - len(futures)):
+                        futures.append(executor.submit(self._fetch_page_number, page))
+                    if not futures:
+                        break
+
+                    results = self._process_response(futures.popleft().result())
+                    # Trim the last page if it goes over the limit
+                    if self.total_limit and self.results_fetched > self.total_limit:
+                        n_extra = self.results_fetched - self.total_limit
+                        results = results[: len(results) - n_extra]
+                        self.results_fetched = self.total_limit
+                    yield results
+            # Cancel any remaining requests if exhausted or stopped early
+            finally:
+                _cancel_all(futures)
+
+    def _fetch_page_number(self, page: int) -> Any:
+        """Send a request for a specific page number"""
+        kwargs = {**self.request_kwargs, **self._get_pagination_kwargs(), 'page': page}
+        return self.request_function(*self.request_args, **kwargs)
+
+    def _prefetch_sequential(self) -> Iterator[List[ResponseResult]]:
+        """Fetch pages from a background thread, sending each request as soon as the previous
+        response is received, and keeping at most ``prefetch`` pages in a queue
+        """
+
+        def fetch_pages():
+            while not self.exhausted:
+                yield self._next_page()
+
+        return _iter_threaded([fetch_pages()], maxsize=self.prefetch)
+
+    def _load_checkpoint(self):
+        """Restore pagination state from a checkpoint file, if one exists for the same request"""
+        if not self.checkpoint:
+            return
+        if self._is_concurrent() and not self.prefetch_page_numbers:
+            raise ValueError('Checkpoints are not supported with shards or ID-based prefetching')
+        if not self.checkpoint.is_file():
+            return
+
+        checkpoint = json.loads(self.checkpoint.read_text())
+        if checkpoint['request_kwargs'] != self._get_checkpoint_kwargs():
+            logger.warning(f'Checkpoint {self.checkpoint} is for a different request; ignoring')
+            return
+        logger.info(f'Resuming from checkpoint {self.checkpoint}: {checkpoint["state"]}')
+        self._set_state(checkpoint['state'])
+
+    def _save_checkpoint(self):
+        """Save pagination state to a checkpoint file, or delete it if there are no more results"""
+        if not self.checkpoint:
+            return
+        if self.exhausted:
+            self.checkpoint.unlink(missing_ok=True)
+            return
+
+        checkpoint = {'request_kwargs': self._get_checkpoint_kwargs(), 'state': self._get_state()}
+        self.checkpoint.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temp file first, so an interrupted write won't leave a corrupted checkpoint
+        temp_path = self.checkpoint.with_suffix(f'{self.checkpoint.suffix}.tmp')
+        temp_path.write_text(json.dumps(checkpoint))
+        temp_path.replace(self.checkpoint)
+
+    def _get_checkpoint_kwargs(self) -> RequestParams:
+        """Get request parameters identifying this request, as they would be stored in a checkpoint"""
+        kwargs = {
+            'args': self.request_args,
+            **{
+                k: v for k, v in self.request_kwargs.items() if k not in ['session', 'access_token']
+            },
+        }
+        return json.loads(json.dumps(kwargs, default=str))
+
+    # The following methods may be overridden by subclasses for different pagination methods
+    def _get_state(self) -> Dict[str, Any]:
+        """Get the current pagination state, to save in a checkpoint"""
+        return {
+            'page': self.page,
+            'results_fetched': self.results_fetched,
+            'total_results': self.total_results,
+        }
+
+    def _set_state(self, state: Dict[str, Any]):
+        """Restore pagination state from a checkpoint"""
+        self.page = state['page']
+        self.results_fetched = state['results_fetched']
+        self.total_results = state['total_results']
+
     def _get_pagination_kwargs(self) -> RequestParams:
         """Get any extra request parameters needed for pagination"""
         return {'page': self.page, 'per_page': self.per_page}
@@ -225,11 +507,34 @@ class IDRangePaginator(Paginator):
         when retrieving records from large result sets. If you need to retrieve large numbers of
         records, use the ``per_page`` and ``id_above`` or ``id_below`` parameters instead.*
 
+    Args:
+        shards: Split the range of IDs into this many windows, and paginate through them
+            concurrently (still subject to rate-limiting). Results will not be in ID order.
+        shard_interval: Split the query's date range (either ``d1`` and ``d2``, or ``created_d1``
+            and ``created_d2``) instead of its range of IDs. The number of results is checked for
+            each time interval of this size (``'day'``, ``'month'``, etc.), and consecutive
+            intervals are combined into ``shards`` windows with similar numbers of results. This
+            sends one extra request per interval, which counts toward rate limits. Requires
+            ``shards`` greater than 1.
     """
 
-    def __init__(self, *args, **kwargs):
+    prefetch_page_numbers = False
+
+    def __init__(
+        self,
+        *args,
+        shards: int = 1,
+        shard_interval: Optional[TimeInterval] = None,
+        **kwargs,
+    ):
         super().__init__(*args, **kwargs)
         self.id_above: Optional[int] = None
+        self.shards = shards
+        self.shard_interval = shard_interval
+        if shard_interval is not None:
+            if shards <= 1:
+                raise ValueError('shard_interval requires shards to be greater than 1')
+            self.date_params = self._get_date_params()
 
     def _get_pagination_kwargs(self):
         return {
@@ -239,36 +544,194 @@ class IDRangePaginator(Paginator):
             'order': 'asc',
         }
 
-    def _next_page(self) -> List[ResponseResult]:
+    def _process_response(self, response: Any) -> List[ResponseResult]:
         # Update params for next request, if there are more results
-        results = super()._next_page()
+        results = super()._process_response(response)
         if not self.exhausted:
             self.id_above = results[-1]['id']
         return results
 
+    def _is_concurrent(self) -> bool:
+        return self.shards > 1 or super()._is_concurrent()
+
+    def _get_state(self) -> Dict[str, Any]:
+        return {**super()._get_state(), 'id_above': self.id_above}
+
+    def _set_state(self, state: Dict[str, Any]):
+        super()._set_state(state)
+        self.id_above = state['id_above']
+
+    def _iter_pages(self) -> Iterator[List[ResponseResult]]:
+        if self.shards > 1:
+            return self._iter_sharded_pages()
+        return super()._iter_pages()
+
+    def _iter_sharded_pages(self) -> Iterator[List[ResponseResult]]:
+        """Paginate through each window of IDs from a separate thread, and yield pages as soon as
+        they are received
+        """
+        shard_pages = [shard._iter_pages() for shard in self._get_shards()]
+        seen_ids: Set[int] = set()
+
+        for results in _iter_threaded(shard_pages, maxsize=self.shards):
+            results = [result for result in results if result['id'] not in seen_ids]
+            seen_ids.update(result['id'] for result in results)
+            # Trim the last page if it goes over the limit
+            if self.total_limit:
+                results = results[: self.total_limit - self.results_fetched]
+            self.results_fetched += len(results)
+            yield results
+            if self.total_limit and self.results_fetched >= self.total_limit:
+                break
+        self.exhausted = True
+
+    def _get_shards(self) -> List['IDRangePaginator']:
+        """Split the query into disjoint windows, and make a paginator for each one"""
+        if self.shard_interval is not None:
+            shards = self._get_date_shards()
+        else:
+            shards = self._get_id_shards()
+        if self.total_results and self.total_results > self.per_page:
+            self._estimate()
+        return shards
+
+    def _get_id_shards(self) -> List['IDRangePaginator']:
+        """Split the range of matching IDs into ``(id_above, id_below)`` windows"""
+        min_id = self._get_boundary_id('asc')
+        max_id = self._get_boundary_id('desc') if min_id is not None else None
+        if min_id is None or max_id is None:
+            return []
+
+        # Each window covers id_above < ID <= next id_above
+        id_range = max_id - min_id + 1
+        bounds = sorted({min_id - 1 + (id_range * i) // self.shards for i in range(self.shards)})
+        bounds.append(max_id)
+
+        shards = []
+        for id_above, id_max in zip(bounds, bounds[1:]):
+            shard = self._make_shard(id_below=id_max + 1)
+            shard.id_above = id_above
+            shards.append(shard)
+        return shards
+
+    def _get_date_shards(self) -> List['IDRangePaginator']:
+        """Split the query's date range into windows with similar numbers of results"""
+        start_key, end_key = self.date_params
+        end = self.request_kwargs[end_key]
+        ranges = get_interval_ranges(self.request_kwargs[start_key], end, self.shard_interval)  # type: ignore
+        if not ranges:
+            return []
+        # The last interval may extend past the original end date
+        ranges[-1] = (ranges[-1][0], end)
+        probes = [self._make_shard(**{start_key: start, end_key: end}) for start, end in ranges]
+        with ThreadPoolExecutor(max_workers=self.shards) as executor:
+            counts = list(executor.map(lambda probe: probe.count(), probes))
+        self.total_results = sum(counts)
+
+        return [
+            self._make_shard(**{start_key: window[0][0], end_key: window[-1][1]})
+            for window in _group_by_count(ranges, counts, self.shards)
+        ]
+
+    def _get_date_params(self) -> Tuple[str, str]:
+        """Get the names of the date range params to use for sharding"""
+        for start_key, end_key in [('d1', 'd2'), ('created_d1', 'created_d2')]:
+            if start_key in self.request_kwargs and end_key in self.request_kwargs:
+                return start_key, end_key
+        raise ValueError(
+            'shard_interval requires a date range: either d1 and d2, or created_d1 and created_d2'
+        )
+
+    def _make_shard(self, **kwargs) -> 'IDRangePaginator':
+        """Make a paginator for a subset of this query, with additional request parameters"""
+        return IDRangePaginator(
+            self.request_function,
+            self.model,
+            *self.request_args,
+            limit=self.total_limit,
+            per_page=self.per_page,
+            **{**self.request_kwargs, **kwargs},
+        )
+
+    def _get_boundary_id(self, order: str) -> Optional[int]:
+        """Get the lowest (``order='asc'``) or highest (``order='desc'``) ID matching the query"""
+        kwargs = {**self.request_kwargs, 'per_page': 1, 'order_by': 'id', 'order': order}
+        response = self.request_function(*self.request_args, **kwargs)
+        if isinstance(response, Response):
+            response = response.json()
+        if self.total_results is None:
+            self.total_results = int(response['total_results'])
+        results = response['results']
+        return results[0]['id'] if results else None
+
 
 class IDPaginator(Paginator):
-    """Paginator for ID-based endpoints that only accept a limited number of IDs per request"""
+    """Paginator for ID-based endpoints that only accept a limited number of IDs per request
+
+    Args:
+        ids: IDs to request
+        ids_per_request: Maximum number of IDs to request at once
+        workers: Number of batches of IDs to request concurrently (still subject to rate-limiting)
+        ordered: Yield results in the same order as ``ids``. If ``False``, results from concurrent
+            requests will be yielded as soon as they are received.
+    """
+
+    prefetch_page_numbers = False
 
     def __init__(
-        self, *args, ids: Optional[Iterable[IntOrStr]] = None, ids_per_request: int = 1, **kwargs
+        self,
+        *args,
+        ids: Optional[Iterable[IntOrStr]] = None,
+        ids_per_request: int = 1,
+        workers: int = 1,
+        ordered: bool = True,
+        **kwargs,
     ):
         super().__init__(*args, **kwargs)
+        if self.checkpoint:
+            raise ValueError('Checkpoints are not supported for requests by ID')
         if ids_per_request == 1:
             self.id_batches = deque(ids or [])
         else:
             self.id_batches = deque(list(_chunkify(ids, ids_per_request)))  # type: ignore
         self.total_results = len(ids)  # type: ignore
-
-    def _next_page(self) -> List[ResponseResult]:
-        """Get the next record by ID"""
+        self.ordered = ordered
+
+        # Concurrent batch requests use the same mechanism as page prefetching
+        if workers > 1:
+            self.prefetch = workers
+
+    def _iter_prefetched_pages(self) -> Iterator[List[ResponseResult]]:
+        """Request up to ``prefetch`` batches of IDs at once"""
+        futures: Deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=self.prefetch) as executor:
+            try:
+                while True:
+                    while len(futures) < self.prefetch and (request := self._prepare_request()):
+                        args, kwargs = request
+                        futures.append(executor.submit(self.request_function, *args, **kwargs))
+                    if not futures:
+                        break
+
+                    if self.ordered:
+                        future = futures.popleft()
+                    else:
+                        future = next(as_completed(futures))
+                        futures.remove(future)
+                    yield self._process_response(future.result())
+            finally:
+                _cancel_all(futures)
+
+    def _prepare_request(self) -> Optional[Tuple[Tuple, RequestParams]]:
+        """Get the next batch of IDs to request"""
         try:
             next_ids = self.id_batches.popleft()
         except IndexError:
             self.exhausted = True
-            return []
+            return None
+        return (next_ids, *self.request_args), self.request_kwargs
 
-        response = self.request_function(next_ids, *self.request_args, **self.request_kwargs)
+    def _process_response(self, response: Any) -> List[ResponseResult]:
         if isinstance(response, Response):
             response = response.json()
 
@@ -278,6 +741,201 @@ class IDPaginator(Paginator):
         return results
 
 
+@dataclass
+class PipelineStats:
+    """Buffer usage and wait times for a :py:class:`.PagePipeline`
+
+    Args:
+        pages_fetched: Number of pages added to the buffer
+        pages_consumed: Number of pages taken from the buffer
+        queue_depth: Current number of pages in the buffer
+        max_queue_depth: Highest number of pages in the buffer at once
+        queued_bytes: Current size of pages in the buffer
+        max_queued_bytes: Highest size of pages in the buffer at once
+        producer_stall_time: Total seconds spent waiting for space in the buffer (fetching is slower
+            than processing if this is low)
+        consumer_stall_time: Total seconds spent waiting for pages to be fetched (processing is
+            slower than fetching if this is low)
+    """
+
+    pages_fetched: int = 0
+    pages_consumed: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    queued_bytes: int = 0
+    max_queued_bytes: int = 0
+    producer_stall_time: float = 0.0
+    consumer_stall_time: float = 0.0
+
+
+class PagePipeline(Iterable):
+    """Iterate over pages that are fetched by a background producer thread, with a buffer limited by
+    number of pages and/or total size. See :py:meth:`.Paginator.pipeline` for usage.
+
+    Args:
+        pages: Iterator of raw JSON pages, to run in the producer thread
+        convert: Function to convert each page, to run in the producer thread
+        max_pages: Maximum number of pages to keep in the buffer
+        max_bytes: Maximum total size of pages to keep in the buffer
+    """
+
+    def __init__(
+        self,
+        pages: Iterator[List[ResponseResult]],
+        convert: Optional[Callable[[List[ResponseResult]], List]] = None,
+        max_pages: int = 2,
+        max_bytes: Optional[int] = None,
+    ):
+        self.pages = pages
+        self.convert = convert
+        self.max_pages = max(max_pages, 1)
+        self.max_bytes = max_bytes
+        self.stats = PipelineStats()
+        self._buffer: Deque[Tuple[List, int]] = deque()
+        self._condition = Condition()
+        self._done = False
+        self._stopped = False
+        self._error: Optional[Exception] = None
+
+    def __iter__(self) -> Iterator[List]:
+        Thread(target=self._produce, daemon=True).start()
+        try:
+            while True:
+                with self._condition:
+                    start = monotonic()
+                    self._condition.wait_for(lambda: self._buffer or self._done)
+                    self.stats.consumer_stall_time += monotonic() - start
+                    if not self._buffer:
+                        break
+                    page, size = self._buffer.popleft()
+                    self.stats.pages_consumed += 1
+                    self.stats.queue_depth -= 1
+                    self.stats.queued_bytes -= size
+                    self._condition.notify_all()
+                yield page
+            if self._error:
+                raise self._error
+        # Stop the producer if the consumer stops early
+        finally:
+            with self._condition:
+                self._stopped = True
+                self._condition.notify_all()
+
+    def _produce(self):
+        """Fetch pages and add them to the buffer, waiting while the buffer is full"""
+        try:
+            for page in self.pages:
+                size = len(json.dumps(page, default=str)) if self.max_bytes else 0
+                if self.convert:
+                    page = self.convert(page)
+                with self._condition:
+                    start = monotonic()
+                    while not (self._stopped or self._has_space(size)):
+                        self._condition.wait()
+                    self.stats.producer_stall_time += monotonic() - start
+                    if self._stopped:
+                        return
+                    self._buffer.append((page, size))
+                    self._update_stats(size)
+                    self._condition.notify_all()
+        except Exception as e:
+            self._error = e
+        finally:
+            with self._condition:
+                self._done = True
+                self._condition.notify_all()
+
+    def _has_space(self, size: int) -> bool:
+        """Check if a page of the given size can be added to the buffer"""
+        if not self._buffer:
+            return True
+        if len(self._buffer) >= self.max_pages:
+            return False
+        return not self.max_bytes or self.stats.queued_bytes + size <= self.max_bytes
+
+    def _update_stats(self, size: int):
+        stats = self.stats
+        stats.pages_fetched += 1
+        stats.queue_depth += 1
+        stats.queued_bytes += size
+        stats.max_queue_depth = max(stats.max_queue_depth, stats.queue_depth)
+        stats.max_queued_bytes = max(stats.max_queued_bytes, stats.queued_bytes)
+
+
+def _cancel_all(futures: Iterable[Future]):
+    """Cancel any pending futures that haven't started running yet"""
+    for future in futures:
+        future.cancel()
+
+
+def _iter_threaded(iterators: List[Iterator], maxsize: int = 0) -> Iterator:
+    """Consume each iterator from a separate background thread, and yield items from all of them as
+    soon as they are available. At most ``maxsize`` items are kept in a queue, and exceptions are
+    re-raised in the calling thread. The threads are stopped if the caller stops iterating early.
+    """
+    items: Queue = Queue(maxsize=maxsize)
+    stop = Event()
+    for iterator in iterators:
+        Thread(target=_consume, args=(iterator, items, stop), daemon=True).start()
+
+    n_running = len(iterators)
+    try:
+        while n_running:
+            item = items.get()
+            if item is _DONE:
+                n_running -= 1
+            elif isinstance(item, Exception):
+                raise item
+            else:
+                yield item
+    finally:
+        stop.set()
+
+
+def _consume(iterator: Iterator, items: Queue, stop: Event):
+    """Put all items from an iterator into a queue, followed by either an exception or ``_DONE``"""
+    try:
+        for item in iterator:
+            if not _put(items, item, stop):
+                return
+    except Exception as e:
+        _put(items, e, stop)
+    _put(items, _DONE, stop)
+
+
+def _put(items: Queue, item: Any, stop: Event) -> bool:
+    """Put an item into a queue, waiting for space unless ``stop`` is set"""
+    while not stop.is_set():
+        try:
+            items.put(item, timeout=0.1)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def _group_by_count(items: List, counts: List[int], n_groups: int) -> List[List]:
+    """Split items into at most ``n_groups`` runs of consecutive items with similar total counts.
+    Items with a count of 0 are skipped.
+    """
+    target = sum(counts) / n_groups
+    groups: List[List] = []
+    group: List = []
+    group_count = 0
+    for item, count in zip(items, counts):
+        if not count:
+            continue
+        # Start a new group if this item would put the current group over the target count
+        if group and group_count + count > target and len(groups) < n_groups - 1:
+            groups.append(group)
+            group, group_count = [], 0
+        group.append(item)
+        group_count += count
+    if group:
+        groups.append(group)
+    return groups
+
+
 def _chunkify(iterable: Iterable, max_size: int) -> Iterator[List]:
     """Split an iterable into chunks of a max size"""
     iterable = list(iterable)
@@ -298,6 +956,8 @@ class AutocompletePaginator(Paginator):
     to other autocomplete endpoints, but so far is only needed for places.
     """
 
+    prefetch_page_numbers = False
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.request_kwargs.pop('order_by', None)
@@ -339,11 +999,8 @@ class JsonPaginatorMixin(MixinBase):
     ):
         super().__init__(request_function, None, *request_args, **kwargs)  # type: ignore
 
-    def __iter__(self) -> Iterator[ResponseResult]:
-        """Iterate over paginated results, and skip conversion to model objects"""
-        while not self.exhausted:
-            for result in self._next_page():
-                yield result
+    def _convert_page(self, results: List[ResponseResult]) -> List[ResponseResult]:  # type: ignore
+        return results
 
     def all(self) -> JsonResponse:  # type: ignore
         results = super().all()
@@ -377,6 +1034,31 @@ def paginate_all(request_function: Callable, *args, method: str = 'page', **kwar
     return paginator(request_function, *args, **kwargs).all()
 
 
+def iter_all(
+    request_function: Callable, *args, method: str = 'page', **kwargs
+) -> Iterator[ResponseResult]:
+    """Iterate over all results of a multi-page request, one page at a time. Unlike ``page='all'``,
+    previous pages are not kept in memory, so memory usage stays the same regardless of the total
+    number of results.
+
+    This can be used with any paginated API function, and any conversions that function makes to its
+    response (for example, parsing timestamps) will be applied to each page as it is received.
+
+    Example:
+
+        >>> from pyinaturalist import get_observations, iter_all
+        >>> for obs in iter_all(get_observations, method='id', place_id=6803):
+        ...     save_to_db(obs)
+
+    Args:
+        request_function: API request function to paginate
+        method: Pagination method: either ``'page'`` (by page number) or ``'id'`` (by ID range)
+        kwargs: Request parameters. Explicit pagination parameters will be overridden.
+    """
+    paginator = JsonIDRangePaginator if method == 'id' else JsonPaginator
+    yield from paginator(request_function, *args, **kwargs)
+
+
 class WrapperPaginator(Paginator):
     """Paginator class that wraps results that have already been fetched."""
 
@@ -388,6 +1070,9 @@ class WrapperPaginator(Paginator):
     def count(self) -> int:
         return len(self.results)
 
-    def next_page(self):
+    def _next_page(self):
         self.exhausted = True
         return self.results
+
+    def _convert_page(self, results):
+        return results
@@ -7,7 +7,7 @@ params.
 """
 
 import re
-from datetime import date, datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from inspect import signature
 from logging import getLogger
 from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
@@ -17,6 +17,7 @@ from dateutil.relativedelta import relativedelta
 
 from pyinaturalist.constants import *  # noqa: F401, F403  # Imports for backwards-compatibility
 from pyinaturalist.constants import (
+    BOOLEAN_PARAMS,
     DATETIME_PARAMS,
     MULTIPLE_CHOICE_PARAMS,
     RANK_EQUIVALENTS,
@@ -61,6 +62,13 @@ RANK_PARAMS = [
     'observation_hrank',
 ]
 
+# Multi-value params where the order of values matters, and shouldn't be changed by
+# canonicalize_list_params()
+ORDERED_LIST_PARAMS = ['fields', 'order_by']
+
+# Params that accept comma-separated IDs, in addition to ID(s) in a list
+ID_PARAM_PATTERN = re.compile(r'^(.+_)?ids?$')
+
 MULTIPLE_CHOICE_ERROR_MSG = (
     'Parameter "{}" must have one of the following values: {}\n\tValue provided: {}'
 )
@@ -96,6 +104,7 @@ def preprocess_request_params(
     params = convert_datetime_params(params)
     params = convert_observation_field_filters(params)
     if convert_lists:
+        params = canonicalize_list_params(params)
         params = convert_list_params(params)
     params = strip_empty_values(params)
     params, _ = split_common_params(params)
@@ -110,6 +119,30 @@ def convert_bool_params(params: RequestParams) -> RequestParams:
     return params
 
 
+def canonicalize_list_params(params: RequestParams) -> RequestParams:
+    """Convert equivalent request params into the same values, so that logically identical requests
+    have the same URL (and share the same cache entry). Specifically:
+
+    * Multi-value params are sorted and deduplicated, except for :py:data:`ORDERED_LIST_PARAMS`
+    * Comma-separated ID strings are split into lists, e.g. ``taxon_id='2,1'`` -> ``[1, 2]``
+    * Boolean strings for :py:data:`.BOOLEAN_PARAMS` are lowercased, e.g. ``'True'`` -> ``'true'``
+    """
+    for k, v in params.items():
+        if isinstance(v, str) and ',' in v and ID_PARAM_PATTERN.match(k):
+            v = ensure_list(v, split_str_list=True)
+        if isinstance(v, (list, tuple)) and k not in ORDERED_LIST_PARAMS:
+            params[k] = _sort_list(v)
+        elif k in BOOLEAN_PARAMS and isinstance(v, str) and v.lower() in ['true', 'false']:
+            params[k] = v.lower()
+    return params
+
+
+def _sort_list(values: Iterable) -> List[str]:
+    """Sort and deduplicate list values, with numeric values (like IDs) sorted numerically"""
+    unique_values = {str(v).strip() for v in values if v is not None} - {''}
+    return sorted(unique_values, key=lambda v: (0, int(v), '') if v.isdigit() else (1, 0, v))
+
+
 def convert_url_ids(url: str, ids: Optional[MultiInt] = None, allow_str_ids: bool = False) -> str:
     """If one or more resources are requested by ID, validate and update the request URL
     accordingly"""
@@ -148,11 +181,16 @@ def convert_datetime_params(params: RequestParams) -> RequestParams:
     API behavior note: params that take date but not time info will accept a full timestamp and
     just ignore the time, so it's safe to parse both date and datetime strings into timestamps
 
+    Date objects for these params are converted to timestamps at midnight, the same as an
+    equivalent date string
+
     Raises:
         :py:exc:`dateutil.parser._parser.ParserError` if a date/datetime format is invalid
     """
     for k, v in params.items():
-        if isinstance(v, (date, datetime)) or (isinstance(v, str) and k in DATETIME_PARAMS):
+        if k in DATETIME_PARAMS and type(v) is date:
+            params[k] = convert_isoformat(datetime.combine(v, time()))
+        elif isinstance(v, (date, datetime)) or (isinstance(v, str) and k in DATETIME_PARAMS):
             params[k] = convert_isoformat(v)
     return params
 
@@ -260,8 +298,10 @@ def normalize_rank(rank: str) -> str:
 
 
 def normalize_rank_params(params: RequestParams) -> RequestParams:
-    """Normalize any taxonomic ranks in request params"""
+    """Normalize any taxonomic ranks in request params, including comma-separated strings"""
     for k in RANK_PARAMS:
+        if isinstance(params.get(k), str) and ',' in params[k]:
+            params[k] = ensure_list(params[k], split_str_list=True)
         if isinstance(params.get(k), (tuple, list)):
             params[k] = [normalize_rank(r) for r in params[k]]
         elif params.get(k):
@@ -1,24 +1,34 @@
 """Session class and related functions for preparing and sending API requests"""
 
+import asyncio
 import json
 import threading
 from collections import defaultdict
+from contextvars import ContextVar
+from functools import partial, wraps
 from json import JSONDecodeError
 from logging import getLogger
 from os import getenv
-from typing import Dict, Optional, Type
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type
 
 import pyrate_limiter
 from requests import PreparedRequest, Request, Response, Session
 from requests.adapters import HTTPAdapter
-from requests.utils import default_user_agent
+from requests.structures import CaseInsensitiveDict
+from requests.utils import default_user_agent, get_encoding_from_headers
 from requests_cache import (
     AnyRequest,
+    CachedHTTPResponse,
+    CachedRequest,
     CachedResponse,
     CacheMixin,
     ExpirationPatterns,
     ExpirationTime,
+    OriginalResponse,
 )
+from requests_cache.backends.base import DictStorage
+from requests_cache.policy import CacheActions, set_request_headers
+from requests_cache.session import get_504_response
 from requests_ratelimiter import (
     AbstractBucket,
     BucketFullException,
@@ -27,15 +37,27 @@ from requests_ratelimiter import (
     RequestRate,
     SQLiteBucket,
 )
+from urllib3.response import HTTPHeaderDict  # type: ignore
 from urllib3.util import Retry
 
 import pyinaturalist
+from pyinaturalist.cache import (
+    AccessLogStorage,
+    CacheBackend,
+    CachePruner,
+    CacheStats,
+    CompressionDict,
+    MemoryTierStorage,
+    compressed_serializer,
+    init_cache_backend,
+)
 from pyinaturalist.constants import (
     CACHE_EXPIRATION,
-    CACHE_FILE,
+    CACHE_PRUNE_INTERVAL,
     CONNECT_TIMEOUT,
     DEFAULT_LOCK_PATH,
     MAX_DELAY,
+    MEMORY_CACHE_MAX_BYTES,
     RATELIMIT_FILE,
     REQUEST_BURST_RATE,
     REQUEST_RETRIES,
@@ -68,6 +90,11 @@ REFRESH_LIMITER = Limiter(
 logger = getLogger('pyinaturalist')
 thread_local = threading.local()
 
+# Responses already fetched for the async request function running in the current task
+_prefetched_responses: ContextVar[Optional[Dict[Tuple, Response]]] = ContextVar(
+    '_prefetched_responses', default=None
+)
+
 
 class ClientSession(CacheMixin, LimiterMixin, Session):
     """Custom session class used for sending API requests. Combines the following features and
@@ -81,10 +108,18 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
 
     def __init__(
         self,
-        cache_file: FileOrPath = CACHE_FILE,
+        cache_file: Optional[FileOrPath] = None,
+        cache_backend: CacheBackend = 'sqlite',
         cache_control: bool = True,
         expire_after: Optional[ExpirationTime] = None,
         urls_expire_after: Optional[ExpirationPatterns] = None,
+        memory_cache_entries: int = 0,
+        memory_cache_bytes: int = MEMORY_CACHE_MAX_BYTES,
+        cache_compression: Optional[str] = None,
+        compression_dict: Optional[CompressionDict] = None,
+        max_cache_size: Optional[int] = None,
+        cache_eviction: str = 'lru',
+        prune_interval: Optional[float] = None,
         per_second: float = REQUESTS_PER_SECOND,
         per_minute: float = REQUESTS_PER_MINUTE,
         per_day: float = REQUESTS_PER_DAY,
@@ -99,13 +134,32 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
         """Get a Session object, optionally with custom settings for caching and rate-limiting.
 
         Args:
-            cache_file: Cache file path to use; defaults to the system default cache directory
+            cache_file: Cache file path (or directory, for the ``filesystem`` backend) to use;
+                defaults to the system default cache directory
+            cache_backend: Cache backend to use: ``sqlite``, ``sqlite_wal``, ``filesystem``,
+                ``memory``, ``redis``, or a requests-cache backend instance. See
+                :py:func:`.init_cache_backend` for details.
             cache_control: Use server-provided Cache-Control headers to set cache expiration when
                 possible (instead of ``expire_after`` or ``urls_expire_after``)
             expire_after: How long to keep cached API requests; for advanced options, see
                 `requests-cache: Expiration <https://requests-cache.readthedocs.io/en/stable/user_guide/expiration.html>`_
             urls_expire_after Glob patterns for per-URL cache expiration; See
                 `requests-cache: URL Patterns <https://requests-cache.readthedocs.io/en/stable/user_guide/expiration.html#url-patterns>`_
+            memory_cache_entries: Max number of cached responses to also keep in memory, in front of
+                the persistent cache. Disabled by default.
+            memory_cache_bytes: Max total size of cached responses to keep in memory
+            cache_compression: Compress responses in the persistent cache with ``zstd`` (requires
+                ``zstandard``) or ``gzip``
+            compression_dict: A zstd dictionary to use for compression, as bytes or a file path (see
+                :py:func:`.train_compression_dict`)
+            max_cache_size: Max total size of responses in the persistent cache, in bytes (SQLite
+                backends only). Expired responses are removed first, and then responses are evicted
+                in the order set by ``cache_eviction``.
+            cache_eviction: Which responses to evict first when over ``max_cache_size``: ``lru`` for
+                least recently used, or ``expires`` for soonest to expire
+            prune_interval: Seconds between removing expired and evicted responses in a background
+                thread. Defaults to 10 minutes if ``max_cache_size`` is set; otherwise, expired
+                responses are only removed when replaced.
             per_second: Max requests per second
             per_minute: Max requests per minute
             per_day: Max requests per day
@@ -131,10 +185,19 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
         if lock_path := kwargs.pop('lock_path', None):
             bucket_kwargs['lock_path'] = lock_path
 
+        # Stats are shared by compression, the in-memory cache tier, and pruning, if any are enabled
+        prune = bool(max_cache_size or prune_interval)
+        self._cache_stats = CacheStats() if cache_compression or prune else None
+        if cache_compression:
+            kwargs['serializer'] = compressed_serializer(
+                cache_compression, dictionary=compression_dict, stats=self._cache_stats
+            )
+        cache = init_cache_backend(cache_backend, cache_file, **kwargs)
+
         super().__init__(  # type: ignore  # false positive
             # Cache settings
-            cache_name=cache_file,
-            backend='sqlite',
+            cache_name=cache.cache_name,
+            backend=cache,
             cache_control=cache_control,
             expire_after=expire_after,
             urls_expire_after=url_patterns,
@@ -152,6 +215,31 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
             **kwargs,
         )
 
+        # Keep recently used responses in memory, to skip reading and deserializing them from the
+        # persistent cache (unless the persistent cache is already in memory)
+        if memory_cache_entries > 0 and not isinstance(self.cache.responses, DictStorage):
+            self.cache.responses = MemoryTierStorage(
+                self.cache.responses,
+                max_entries=memory_cache_entries,
+                max_bytes=memory_cache_bytes,
+                stats=self._cache_stats,
+            )
+            self._cache_stats = self.cache.responses.stats
+
+        # Periodically remove expired responses and evict responses over the max cache size
+        self.cache_pruner: Optional[CachePruner] = None
+        if prune:
+            if cache_eviction == 'lru':
+                self.cache.responses = AccessLogStorage(self.cache.responses)
+            self.cache_pruner = CachePruner(
+                self.cache,
+                max_size=max_cache_size,
+                eviction=cache_eviction,
+                interval=prune_interval or CACHE_PRUNE_INTERVAL,
+                stats=self._cache_stats,
+            )
+            self.cache_pruner.start()
+
         # Retry settings
         self.retries = Retry(
             total=max_retries, backoff_factor=backoff_factor, status_forcelist=RETRY_STATUSES
@@ -168,6 +256,19 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
         ]
         self.headers['User-Agent'] = ' '.join(user_agent_details).strip()
 
+    @property
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Cache hit and miss counts for the in-memory and persistent cache tiers, and compression
+        stats for the persistent cache, if either the in-memory cache or compression is enabled
+        """
+        return self._cache_stats
+
+    def close(self):
+        """Stop background cache pruning (if enabled), and close all adapters and the cache"""
+        if self.cache_pruner is not None:
+            self.cache_pruner.stop()
+        super().close()
+
     def prepare_inat_request(
         self,
         method: str,
@@ -303,12 +404,8 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
         **Note:** :py:meth:`requests.Session.send` accepts separate timeout values for connect and
         read timeouts. The ``timeout`` argument will be used as the read timeout.
         """
-        if not isinstance(request, PreparedRequest):
-            request = super().prepare_request(request)
-        logger.info(format_request(request, dry_run))
-
-        # Make a mock request, if specified
-        if dry_run or is_dry_run_enabled(request.method):
+        request, dry_run = self._prepare_send(request, dry_run)
+        if dry_run:
             return MockResponse(request)
 
         # Otherwise, send the request
@@ -347,26 +444,398 @@ class ClientSession(CacheMixin, LimiterMixin, Session):
         if not response.headers.get('Content-Type', '').startswith('application/json'):
             return response
 
-        # Attempt to decode the response content as JSON
+        # If the response is invalid, wait before sending the request again
+        retries = self._decode_json(response, retries)
+        if retries is None:
+            return response
+
+        retries.sleep()
+        kwargs['force_refresh'] = True
+        kwargs['retries'] = retries
+        return self.send(request, **kwargs)
+
+    def _prepare_send(
+        self, request: AnyRequest, dry_run: bool = False
+    ) -> Tuple[PreparedRequest, bool]:
+        """Prepare a request (if it isn't already) and log it
+
+        Returns:
+            Prepared request, and whether it should be a dry run instead of a real request
+        """
+        if isinstance(request, Request):
+            request = self.prepare_request(request)
+        elif isinstance(request, CachedRequest):
+            request = request.prepare()
+        logger.info(format_request(request, dry_run))
+        return request, dry_run or is_dry_run_enabled(request.method or '')
+
+    def _decode_json(self, response: Response, retries: Optional[Retry] = None) -> Optional[Retry]:
+        """Attempt to decode the response content as JSON, and save the decoded JSON on the response
+        object to avoid decoding twice.
+
+        Returns:
+            ``None`` if the response is valid; otherwise updated retry state
+        """
         try:
             response_json = response.json()
-        # Update retry state and wait before sending the request again
+        # Update retry state
         except JSONDecodeError as e:
             logger.info('Invalid JSON response; retrying...')
             retries = retries or self.retries
-            retries = retries.increment(
+            return retries.increment(
                 response.request.method,
                 response.request.url,
                 error=e,
             )
-            retries.sleep()
-            kwargs['force_refresh'] = True
-            kwargs['retries'] = retries
-            return self.send(request, **kwargs)
-        # Save decoded JSON on response object, to avoid decoding twice
         else:
             response.json = lambda **kwargs: response_json  # type: ignore
-            return response
+            return None
+
+
+class AsyncClientSession(ClientSession):
+    """Session class with additional methods for sending non-blocking requests from an asyncio event
+    loop. Requires installing `aiohttp <https://docs.aiohttp.org>`_.
+
+    All async requests share the same cache, rate limiter, retry settings, and dry-run behavior as
+    :py:class:`.ClientSession`, and all of its synchronous methods are still available. This makes it
+    possible to have many concurrent requests in flight without using a separate thread for each.
+
+    Async requests can only be sent from one event loop at a time. To use the same session from a
+    different event loop, first close it with :py:meth:`.aclose` (or use ``async with``).
+
+    Example:
+        >>> async with AsyncClientSession() as session:
+        ...     response = await session.arequest('GET', f'{API_V1}/observations', id=[1, 2])
+    """
+
+    def __init__(self, *args, connection_limit: int = 100, **kwargs):
+        """
+        Args:
+            connection_limit: Maximum number of simultaneous connections for async requests
+            kwargs: Keyword arguments for :py:class:`.ClientSession`
+        """
+        super().__init__(*args, **kwargs)
+        self.connection_limit = connection_limit
+        self._async_session: Any = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying async session and any open connections"""
+        if self._async_session is not None:
+            await self._async_session.close()
+            self._async_session = None
+            self._async_loop = None
+
+    async def arequest(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict] = None,
+        json: Optional[Dict] = None,
+        access_token: Optional[str] = None,
+        allow_redirects: bool = False,
+        allow_str_ids: bool = False,
+        dry_run: bool = False,
+        expire_after: Optional[ExpirationTime] = None,
+        files: Optional[FileOrPath] = None,
+        ids: Optional[MultiInt] = None,
+        only_if_cached: bool = False,
+        raise_for_status: bool = True,
+        refresh: bool = False,
+        timeout: Optional[int] = None,
+        verify: bool = True,
+        **params: RequestParams,
+    ) -> Response:
+        """Async version of :py:meth:`.ClientSession.request`. Accepts the same arguments, except
+        for ``stream``.
+
+        Returns:
+            API response
+        """
+        request = self.prepare_inat_request(
+            method=method,
+            url=url,
+            access_token=access_token,
+            allow_str_ids=allow_str_ids,
+            files=files,
+            headers=headers,
+            ids=ids,
+            json=json,
+            params=params,
+        )
+
+        response = await self.asend(
+            request,
+            dry_run=dry_run,
+            expire_after=expire_after,
+            only_if_cached=only_if_cached,
+            refresh=refresh,
+            timeout=timeout,
+            allow_redirects=allow_redirects,
+            verify=verify,
+        )
+
+        # Raise an exception if the request failed (after retries are exceeded)
+        if raise_for_status:
+            response.raise_for_status()
+        return response
+
+    async def aget(self, url: str, **kwargs) -> Response:
+        """Async version of :py:meth:`requests.Session.get`"""
+        return await self.arequest('GET', url, **kwargs)
+
+    def wrap_async(self, request_function: Callable) -> Callable[..., Awaitable]:
+        """Get an async version of a synchronous request function that uses this session. Any
+        requests it makes will be sent from the current event loop with :py:meth:`.asend`, and the
+        rest of the function (for example, converting response data) will run as usual.
+
+        This works by calling the function again after each response is received, until all of its
+        requests have a response.
+
+        Example:
+            >>> from pyinaturalist import get_taxa
+            >>> aget_taxa = session.wrap_async(get_taxa)
+            >>> response = await aget_taxa(q='vespi', session=session)
+        """
+
+        @wraps(request_function)
+        async def arequest_function(*args, **kwargs):
+            responses: Dict[Tuple, Response] = {}
+            token = _prefetched_responses.set(responses)
+            try:
+                while True:
+                    try:
+                        return request_function(*args, **kwargs)
+                    except _PendingRequest as pending:
+                        responses[pending.key] = await self.asend(pending.request, **pending.kwargs)
+            finally:
+                _prefetched_responses.reset(token)
+
+        return arequest_function
+
+    def send(self, request: AnyRequest, **kwargs) -> Response:  # type: ignore
+        """Send a request with caching, rate-limiting, and retries. When called from a function
+        wrapped by :py:meth:`.wrap_async`, a response fetched by a non-blocking request is returned
+        instead.
+        """
+        responses = _prefetched_responses.get()
+        if responses is None:
+            return super().send(request, **kwargs)
+
+        if isinstance(request, Request):
+            request = self.prepare_request(request)
+        elif isinstance(request, CachedRequest):
+            request = request.prepare()
+        key = (request.method, request.url, request.body)
+        if key not in responses:
+            raise _PendingRequest(key, request, kwargs)
+        return responses[key]
+
+    async def asend(
+        self,
+        request: AnyRequest,
+        dry_run: bool = False,
+        expire_after: Optional[ExpirationTime] = None,
+        only_if_cached: bool = False,
+        refresh: bool = False,
+        force_refresh: bool = False,
+        retries: Optional[Retry] = None,
+        timeout: Optional[int] = None,
+        **kwargs,
+    ) -> Response:
+        """Async version of :py:meth:`.ClientSession.send`: send a request with caching,
+        rate-limiting, and retries
+        """
+        request, dry_run = self._prepare_send(request, dry_run)
+        if dry_run:
+            return MockResponse(request)
+
+        # Determine cache actions based on settings and headers, and attempt to get a cached response
+        request.headers = set_request_headers(
+            request.headers, expire_after, only_if_cached, refresh, force_refresh
+        )
+        actions = CacheActions.from_request(self.cache.create_key(request), request, self.settings)
+        cached_response: Optional[CachedResponse] = None
+        if not actions.skip_read:
+            cached_response = await _run_in_thread(self.cache.get_response, actions.cache_key)
+        actions.update_from_cached_response(cached_response, self.cache.create_key)
+
+        if actions.error_504:
+            return get_504_response(request)
+        elif not (actions.send_request or actions.resend_request or actions.resend_async):
+            logger.debug(format_response(cached_response))  # type: ignore
+            return cached_response  # type: ignore
+
+        response = await self._asend_and_cache(
+            request, actions, cached_response, retries, timeout, **kwargs
+        )
+
+        # Check for invalid JSON, and if needed, wait before sending the request again
+        retries = self._decode_json(response, retries)
+        if retries is not None:
+            await asyncio.sleep(retries.get_backoff_time())
+            return await self.asend(
+                request, force_refresh=True, retries=retries, timeout=timeout, **kwargs
+            )
+
+        logger.debug(format_response(response))
+        return response
+
+    async def _asend_and_cache(
+        self,
+        request: PreparedRequest,
+        actions: CacheActions,
+        cached_response: Optional[CachedResponse] = None,
+        retries: Optional[Retry] = None,
+        timeout: Optional[int] = None,
+        **kwargs,
+    ) -> Response:
+        """Send a request and cache the response, unless disabled by settings or headers. If the
+        request fails, fall back to a stale cached response, if possible.
+        """
+        request = actions.update_request(request)
+        try:
+            response = await self._asend_with_retries(request, retries, timeout, **kwargs)
+        except Exception:
+            if cached_response is not None and actions.is_usable(cached_response, error=True):
+                logger.warning(f'Request for URL {request.url} failed; using cached response')
+                return cached_response
+            raise
+
+        actions.update_from_response(response)
+        if not actions.skip_write:
+            await _run_in_thread(
+                self.cache.save_response, response, actions.cache_key, actions.expires
+            )
+        elif cached_response is not None and response.status_code == 304:
+            return actions.update_revalidated_response(response, cached_response)
+        return OriginalResponse.wrap_response(response, actions)
+
+    async def _asend_with_retries(
+        self,
+        request: PreparedRequest,
+        retries: Optional[Retry] = None,
+        timeout: Optional[int] = None,
+        **kwargs,
+    ) -> Response:
+        """Send a request with rate-limiting, and apply retry settings to connection errors and
+        retryable status codes (so behavior is consistent with ``urllib3.ConnectionPool.urlopen()``)
+        """
+        from aiohttp import ClientError
+
+        retries = retries or self.retries
+        while True:
+            try:
+                async with self.limiter.ratelimit(
+                    self._bucket_name(request),
+                    delay=True,
+                    max_delay=self.max_delay,  # type: ignore
+                ):
+                    response = await self._asend(request, timeout, **kwargs)
+            except (ClientError, asyncio.TimeoutError) as e:
+                retries = retries.increment(request.method, request.url, error=e)
+            else:
+                if response.status_code in self.limit_statuses:
+                    self._fill_bucket(request)
+                if not retries.is_retry(request.method or 'GET', response.status_code):
+                    return response
+                retries = retries.increment(
+                    request.method,
+                    request.url,
+                    response=response.raw,  # type: ignore
+                )
+            logger.info(f'Request for URL {request.url} failed; retrying...')
+            await asyncio.sleep(retries.get_backoff_time())
+
+    async def _asend(
+        self,
+        request: PreparedRequest,
+        timeout: Optional[int] = None,
+        allow_redirects: bool = False,
+        verify: bool = True,
+        **kwargs,
+    ) -> Response:
+        """Send a single request with aiohttp, and convert the result into a
+        :py:class:`requests.Response`, so it can be cached and used the same as a synchronous response
+        """
+        from aiohttp import ClientTimeout
+        from yarl import URL
+
+        aiohttp_response = await self._get_async_session().request(
+            request.method or 'GET',
+            URL(str(request.url), encoded=True),
+            data=request.body,
+            headers=dict(request.headers),
+            allow_redirects=allow_redirects,
+            ssl=None if verify else False,
+            timeout=ClientTimeout(sock_connect=CONNECT_TIMEOUT, sock_read=timeout or self.timeout),
+        )
+        async with aiohttp_response:
+            content = await aiohttp_response.read()
+
+        # Response content has already been decoded, so remove any encoding headers
+        headers: CaseInsensitiveDict = CaseInsensitiveDict(aiohttp_response.headers)
+        headers.pop('Content-Encoding', None)
+
+        response = Response()
+        response.status_code = aiohttp_response.status
+        response.reason = aiohttp_response.reason or ''
+        response.headers = headers
+        response.url = str(aiohttp_response.url)
+        response.encoding = get_encoding_from_headers(headers)
+        response.request = request
+        response.raw = CachedHTTPResponse(
+            headers=HTTPHeaderDict(headers),
+            reason=response.reason,
+            status=response.status_code,
+            request_url=response.url,
+        )
+        response.raw.reset(content)
+        response._content = content
+        return response
+
+    def _get_async_session(self):
+        """Get or create an aiohttp session bound to the current event loop. An aiohttp session
+        and its connections can't be used from a different event loop, so the session must be
+        closed with :py:meth:`.aclose` before this session is used from another event loop.
+
+        Raises:
+            :py:exc:`RuntimeError` if an open session is bound to a different event loop
+        """
+        from aiohttp import ClientSession as AiohttpSession
+        from aiohttp import TCPConnector
+
+        loop = asyncio.get_running_loop()
+        if self._async_session is not None and self._async_loop is not loop:
+            raise RuntimeError(
+                'AsyncClientSession is already in use by a different event loop. Close it with '
+                '`await session.aclose()` (or use `async with session:`) in that event loop first.'
+            )
+        if self._async_session is None:
+            self._async_session = AiohttpSession(
+                connector=TCPConnector(limit=self.connection_limit),
+                auto_decompress=True,
+            )
+            self._async_loop = loop
+        return self._async_session
+
+
+class _PendingRequest(Exception):
+    """Raised by :py:meth:`.AsyncClientSession.send` from a function wrapped by
+    :py:meth:`.AsyncClientSession.wrap_async`, for a request that doesn't have a response yet
+    """
+
+    def __init__(self, key: Tuple, request: PreparedRequest, kwargs: Dict):
+        super().__init__(request.url)
+        self.key = key
+        self.request = request
+        self.kwargs = kwargs
 
 
 class FileLockSQLiteBucket(pyrate_limiter.FileLockSQLiteBucket):
@@ -386,6 +855,11 @@ class FileLockSQLiteBucket(pyrate_limiter.FileLockSQLiteBucket):
         self._lock = FileLock(lock_path)
 
 
+async def _run_in_thread(func: Callable, *args):
+    """Run a blocking function (like a cache read or write) in the event loop's default executor"""
+    return await asyncio.get_running_loop().run_in_executor(None, partial(func, *args))
+
+
 def delete(url: str, session: Optional[ClientSession] = None, **kwargs) -> Response:
     """Wrapper around :py:func:`requests.delete` with additional options specific to iNat API requests"""
     session = session or get_local_session()
@@ -0,0 +1,251 @@
+"""Incremental sync of observation records into a local SQLite database"""
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from logging import getLogger
+from pathlib import Path
+from typing import Iterator, List, Optional, Union
+
+from pyinaturalist.constants import (
+    API_V1,
+    DATA_DIR,
+    JsonResponse,
+    PathOrStr,
+    RequestParams,
+    ResponseResult,
+)
+from pyinaturalist.converters import convert_isoformat, try_datetime
+from pyinaturalist.paginator import JsonIDRangePaginator
+from pyinaturalist.request_params import COMMON_PARAMS
+from pyinaturalist.session import get
+
+OBSERVATION_STORE_FILE = DATA_DIR / 'observations.db'
+PAGINATION_PARAMS = ['page', 'per_page', 'order', 'order_by', 'id_above', 'count_only', 'reverse']
+# Overlap between syncs, to allow for records that are saved out of order on the server
+UPDATED_SINCE_OVERLAP = timedelta(minutes=5)
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class SyncResult:
+    """Summary of changes from a single :py:meth:`.ObservationStore.sync` run"""
+
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    updated_since: Optional[str] = None
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+
+
+class ObservationStore:
+    """A local SQLite database of observation records, which can be kept up to date by fetching only
+    observations that have changed since the last sync.
+
+    Each query is tracked separately, with a high-water mark for ``updated_since``. This is taken
+    from the latest ``updated_at`` timestamp of the synced observations (minus a small overlap), so
+    it only depends on the server's clock, not the local one. Observations are fetched in order of
+    ID, and progress is saved after each page, so an interrupted sync can resume where it left off.
+    The high-water mark is only moved forward once a sync completes.
+
+    Example:
+
+        >>> from pyinaturalist import ObservationStore
+        >>> store = ObservationStore('~/data/observations.db')
+        >>> result = store.sync(place_id=6803, taxon_id=47790)
+        >>> print(f'{result.inserted} new, {result.updated} updated')
+        >>> observations = list(store)
+
+    Args:
+        path: Path to the SQLite database file
+    """
+
+    def __init__(self, path: PathOrStr = OBSERVATION_STORE_FILE):
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS observations '
+                '(id INTEGER PRIMARY KEY, updated_at TEXT, json TEXT)'
+            )
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS sync_state '
+                '(query TEXT PRIMARY KEY, updated_since TEXT, '
+                'sync_since TEXT, max_updated_at TEXT, id_above INTEGER)'
+            )
+
+    def __contains__(self, observation_id: int) -> bool:
+        return self.get(observation_id) is not None
+
+    def __iter__(self) -> Iterator[ResponseResult]:
+        """Iterate over all stored observations, in order of ID"""
+        with self._connection() as conn:
+            for (obs_json,) in conn.execute('SELECT json FROM observations ORDER BY id'):
+                yield json.loads(obs_json)
+
+    def __len__(self) -> int:
+        with self._connection() as conn:
+            return conn.execute('SELECT COUNT(*) FROM observations').fetchone()[0]
+
+    def get(self, observation_id: int) -> Optional[ResponseResult]:
+        """Get a stored observation by ID"""
+        with self._connection() as conn:
+            row = conn.execute(
+                'SELECT json FROM observations WHERE id = ?', (observation_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def get_updated_since(self, **params) -> Optional[str]:
+        """Get the high-water mark for a query: the latest ``updated_at`` timestamp from its last
+        completed sync, minus :py:data:`UPDATED_SINCE_OVERLAP`
+        """
+        with self._connection() as conn:
+            row = conn.execute(
+                'SELECT updated_since FROM sync_state WHERE query = ?', (_get_query_key(params),)
+            ).fetchone()
+        return row[0] if row else None
+
+    def sync(self, updated_since: Union[date, datetime, str, None] = None, **params) -> SyncResult:
+        """Fetch all observations matching the given search parameters that have been created or
+        updated since the last sync, and merge them into the local database by ID.
+
+        Args:
+            updated_since: Fetch observations updated since this time, instead of since the last
+                sync. The high-water mark is then set from the results, as usual.
+            params: Observation search parameters; accepts the same parameters as
+                :py:func:`~pyinaturalist.v1.observations.get_observations`
+
+        Returns:
+            Counts of inserted, updated, and unchanged observations
+        """
+        query = _get_query_key(params)
+        last_updated_since, sync_since, max_updated_at, id_above = self._get_sync_state(query)
+        updated_since = convert_isoformat(updated_since) if updated_since else last_updated_since
+
+        # Resume an interrupted sync, unless it was for a different time range
+        if id_above and sync_since == updated_since:
+            logger.info(f'Resuming sync from observation ID {id_above}')
+        else:
+            max_updated_at, id_above = None, None
+        self._set_sync_state(query, last_updated_since, updated_since, max_updated_at, id_above)
+
+        params = {k: v for k, v in params.items() if k != 'page'}
+        paginator = JsonIDRangePaginator(
+            get, f'{API_V1}/observations', updated_since=updated_since, **params
+        )
+        paginator.id_above = id_above
+
+        result = SyncResult(updated_since=updated_since)
+        while not paginator.exhausted:
+            results = paginator.next_page()
+            max_updated_at = _get_max_updated_at(results, max_updated_at)
+            with self._connection() as conn:
+                self._merge(conn, results, result)
+                conn.execute(
+                    'UPDATE sync_state SET max_updated_at = ?, id_above = ? WHERE query = ?',
+                    (max_updated_at, paginator.id_above, query),
+                )
+
+        # If there were no results, keep the previous high-water mark
+        if max_updated_at:
+            updated_since = _get_high_water_mark(max_updated_at)
+        self._set_sync_state(query, updated_since, None, None, None)
+        logger.info(
+            f'Synced {result.total} observations: {result.inserted} inserted, '
+            f'{result.updated} updated'
+        )
+        return result
+
+    def _merge(self, conn: sqlite3.Connection, results: List[JsonResponse], result: SyncResult):
+        """Insert or update observation records, and add to the counts in ``result``"""
+        if not results:
+            return
+        ids = [obs['id'] for obs in results]
+        placeholders = ','.join('?' * len(ids))
+        existing = dict(
+            conn.execute(
+                f'SELECT id, updated_at FROM observations WHERE id IN ({placeholders})', ids
+            ).fetchall()
+        )
+
+        for obs in results:
+            if obs['id'] not in existing:
+                result.inserted += 1
+            elif existing[obs['id']] != obs.get('updated_at'):
+                result.updated += 1
+            else:
+                result.unchanged += 1
+        conn.executemany(
+            'INSERT OR REPLACE INTO observations (id, updated_at, json) VALUES (?, ?, ?)',
+            [(obs['id'], obs.get('updated_at'), json.dumps(obs)) for obs in results],
+        )
+
+    def _get_sync_state(self, query: str):
+        with self._connection() as conn:
+            row = conn.execute(
+                'SELECT updated_since, sync_since, max_updated_at, id_above FROM sync_state '
+                'WHERE query = ?',
+                (query,),
+            ).fetchone()
+        return row or (None, None, None, None)
+
+    def _set_sync_state(
+        self,
+        query: str,
+        updated_since: Optional[str],
+        sync_since: Optional[str],
+        max_updated_at: Optional[str],
+        id_above: Optional[int],
+    ):
+        with self._connection() as conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?, ?)',
+                (query, updated_since, sync_since, max_updated_at, id_above),
+            )
+
+    @contextmanager
+    def _connection(self) -> Iterator[sqlite3.Connection]:
+        """Get a database connection, and commit any changes when done"""
+        conn = sqlite3.connect(self.path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+
+def _get_query_key(params: RequestParams) -> str:
+    """Get a string that identifies a set of search parameters, ignoring parameter order,
+    pagination, and request options that don't affect which observations are returned
+    """
+    ignore = [*COMMON_PARAMS, *PAGINATION_PARAMS, 'updated_since']
+    params = {k: v for k, v in params.items() if k not in ignore and v is not None}
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+def _get_max_updated_at(
+    results: List[JsonResponse], max_updated_at: Optional[str]
+) -> Optional[str]:
+    """Get the latest ``updated_at`` timestamp from a page of results and a previous maximum, as a
+    UTC timestamp string
+    """
+    timestamps = [try_datetime(obs.get('updated_at')) for obs in results]
+    timestamps.append(try_datetime(max_updated_at))
+    valid = [_to_utc(ts) for ts in timestamps if ts is not None]
+    return max(valid).isoformat() if valid else None
+
+
+def _get_high_water_mark(max_updated_at: str) -> str:
+    """Get the ``updated_since`` value for the next sync from the latest ``updated_at`` timestamp"""
+    return (_to_utc(try_datetime(max_updated_at)) - UPDATED_SINCE_OVERLAP).isoformat()  # type: ignore
+
+
+def _to_utc(value: datetime) -> datetime:
+    """Convert a datetime to UTC, and assume UTC for timestamps without a timezone"""
+    return value.astimezone(timezone.utc) if value.tzinfo else value.replace(tzinfo=timezone.utc)
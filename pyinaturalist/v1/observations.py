@@ -15,8 +15,7 @@ from pyinaturalist.constants import (
     ResponseResult,
 )
 from pyinaturalist.converters import (
-    convert_all_coordinates,
-    convert_all_timestamps,
+    convert_all_results,
     convert_generic_timestamps,
     convert_histogram,
     convert_observation_histogram,
@@ -34,7 +33,7 @@ logger = getLogger(__name__)
 
 
 @document_request_params(
-    *docs._get_observations, docs._pagination, docs._only_id, docs._access_token
+    *docs._get_observations, docs._pagination, docs._only_id, docs._shards, docs._access_token
 )
 def get_observations(**params) -> JsonResponse:
     """Search observations
@@ -85,13 +84,21 @@ def get_observations(**params) -> JsonResponse:
     """
     params = validate_multiple_choice_param(params, 'order_by', V1_OBS_ORDER_BY_PROPERTIES)
 
+    shards = params.pop('shards', None) or 1
+    shard_interval = params.pop('shard_interval', None)
     if params.get('page') == 'all':
-        observations = paginate_all(get, f'{API_V1}/observations', method='id', **params)
+        observations = paginate_all(
+            get,
+            f'{API_V1}/observations',
+            method='id',
+            shards=shards,
+            shard_interval=shard_interval,
+            **params,
+        )
     else:
         observations = get(f'{API_V1}/observations', **params).json()
 
-    observations['results'] = convert_all_coordinates(observations['results'])
-    observations['results'] = convert_all_timestamps(observations['results'])
+    observations['results'] = convert_all_results(observations['results'])
     return observations
 
 
@@ -129,8 +136,7 @@ def get_observations_by_id(
     observations = get(
         f'{API_V1}/observations', ids=observation_id, access_token=access_token, **params
     ).json()
-    observations['results'] = convert_all_coordinates(observations['results'])
-    observations['results'] = convert_all_timestamps(observations['results'])
+    observations['results'] = convert_all_results(observations['results'])
     return observations
 
 
@@ -1,5 +1,5 @@
 from pyinaturalist.constants import API_V1, ListResponse
-from pyinaturalist.converters import convert_all_coordinates, convert_all_timestamps
+from pyinaturalist.converters import convert_all_results
 from pyinaturalist.docs import document_request_params
 from pyinaturalist.docs import templates as docs
 from pyinaturalist.session import get
@@ -24,7 +24,6 @@ def get_posts(**params) -> ListResponse:
     response = get(f'{API_V1}/posts', **params)
 
     posts = response.json()
-    posts = convert_all_coordinates(posts)
-    posts = convert_all_timestamps(posts)
+    posts = convert_all_results(posts)
 
     return posts
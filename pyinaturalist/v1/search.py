@@ -1,5 +1,5 @@
 from pyinaturalist.constants import API_V1, JsonResponse
-from pyinaturalist.converters import convert_all_coordinates, convert_all_timestamps
+from pyinaturalist.converters import convert_all_results
 from pyinaturalist.docs import document_request_params
 from pyinaturalist.docs import templates as docs
 from pyinaturalist.session import get
@@ -32,6 +32,5 @@ def search(q: str, **params) -> JsonResponse:
     """
     response = get(f'{API_V1}/search', q=q, **params)
     search_results = response.json()
-    search_results['results'] = convert_all_timestamps(search_results['results'])
-    search_results['results'] = convert_all_coordinates(search_results['results'])
+    search_results['results'] = convert_all_results(search_results['results'])
     return search_results
@@ -2,7 +2,7 @@ from copy import deepcopy
 from logging import getLogger
 
 from pyinaturalist.constants import API_V2, V2_OBS_ORDER_BY_PROPERTIES, JsonResponse, RequestParams
-from pyinaturalist.converters import convert_all_coordinates, convert_all_timestamps
+from pyinaturalist.converters import convert_all_results
 from pyinaturalist.docs import document_request_params
 from pyinaturalist.docs import templates as docs
 from pyinaturalist.paginator import paginate_all
@@ -101,8 +101,7 @@ def get_observations(**params) -> JsonResponse:
     else:
         observations = _get_post_observations(params)
 
-    observations['results'] = convert_all_coordinates(observations['results'])
-    observations['results'] = convert_all_timestamps(observations['results'])
+    observations['results'] = convert_all_results(observations['results'])
     return observations
 
 
@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+"""Benchmark cache hit latency and concurrent write throughput for each cache backend, and
+compression ratio and decode cost for each compression format, using a page of observations from
+``test/sample_data`` as the response body
+
+Usage example:
+```
+python scripts/benchmark_cache.py --iterations 500 --writes 50 --threads 8
+python scripts/benchmark_cache.py --redis-url redis://localhost:6379
+```
+
+Without ``--redis-url``, the Redis backend is tested against an in-process stand-in server
+(``fakeredis``), if installed. This measures overhead on the client side only, without network latency.
+"""
+
+import json
+from argparse import ArgumentParser
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Dict
+
+from requests import Request
+from requests_cache import BaseCache, CachedRequest, CachedResponse
+
+from pyinaturalist.cache import (
+    CACHE_BACKENDS,
+    CacheStats,
+    MemoryTierStorage,
+    compressed_serializer,
+    init_cache_backend,
+    train_compression_dict,
+)
+from pyinaturalist.constants import SAMPLE_DATA_DIR
+from pyinaturalist.models import load_json
+
+PAGE_SIZE = 30  # Default page size for API v1
+URL = 'https://api.inaturalist.org/v1/observations'
+
+
+def make_response(body: bytes, page: int = 1) -> CachedResponse:
+    """Make a cached response for a page of observation results"""
+    request = Request('GET', URL, params={'page': page}).prepare()
+    return CachedResponse(
+        status_code=200,
+        content=body,
+        headers={'Content-Type': 'application/json'},
+        request=CachedRequest.from_request(request),
+        url=request.url,
+    )
+
+
+def get_page_body() -> bytes:
+    results = load_json(f'{SAMPLE_DATA_DIR}/get_observations_node_page1.json')
+    page = [results[i % len(results)] for i in range(PAGE_SIZE)]
+    return json.dumps({'total_results': PAGE_SIZE, 'results': page}).encode()
+
+
+def init_backend(name: str, tmp_dir: str, redis_url: str = '') -> BaseCache:
+    kwargs: Dict = {}
+    if name == 'redis':
+        if redis_url:
+            from redis import Redis
+
+            kwargs['connection'] = Redis.from_url(redis_url)
+        else:
+            from fakeredis import FakeRedis
+
+            kwargs['connection'] = FakeRedis()
+    cache = init_cache_backend(name, f'{tmp_dir}/{name}', **kwargs)
+    cache.clear()
+    return cache
+
+
+def benchmark_hits(cache: BaseCache, body: bytes, iterations: int, memory_tier: bool) -> float:
+    """Get the average time to read a cached response, in milliseconds"""
+    if memory_tier:
+        cache.responses = MemoryTierStorage(cache.responses)
+    cache.save_response(make_response(body), 'key')
+
+    start = perf_counter()
+    for _ in range(iterations):
+        cache.get_response('key')
+    return (perf_counter() - start) * 1000 / iterations
+
+
+def benchmark_writes(cache: BaseCache, body: bytes, iterations: int, threads: int) -> float:
+    """Get the number of responses written per second with multiple concurrent writers"""
+
+    def write(thread_idx: int):
+        for i in range(iterations):
+            cache.save_response(make_response(body), f'key_{thread_idx}_{i}')
+
+    start = perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(write, range(threads)))
+    return (iterations * threads) / (perf_counter() - start)
+
+
+def benchmark_compression(tmp_dir: str, body: bytes, iterations: int):
+    """Compare compression ratio, decompression time, and SQLite cache hit latency for each
+    compression format, with a zstd dictionary trained on all sample responses
+    """
+    samples = [make_response(p.read_bytes()) for p in Path(SAMPLE_DATA_DIR).glob('*.json')]
+    dictionary = train_compression_dict(samples)
+    print(f'{"Compression":<12} {"Ratio":>7} {"Decompress (ms)":>16} {"Hit (ms)":>10}')
+
+    for label, compression, kwargs in [
+        ('none', None, {}),
+        ('gzip', 'gzip', {}),
+        ('zstd', 'zstd', {}),
+        ('zstd + dict', 'zstd', {'dictionary': dictionary}),
+    ]:
+        stats = CacheStats()
+        if compression:
+            kwargs['serializer'] = compressed_serializer(compression, stats=stats, **kwargs)
+            kwargs.pop('dictionary', None)
+        cache = init_cache_backend('sqlite', f'{tmp_dir}/{label}.db', **kwargs)
+        hit_ms = benchmark_hits(cache, body, iterations, False)
+        # Get compression ratio from distinct sample responses, since the benchmark page repeats the
+        # same results. Small responses benefit the most from a dictionary.
+        stats.uncompressed_bytes = stats.compressed_bytes = 0
+        for i, response in enumerate(samples):
+            cache.save_response(response, f'sample_{i}')
+        ratio = f'{stats.compression_ratio:.1f}' if compression else '-'
+        print(f'{label:<12} {ratio:>7} {stats.avg_decompress_ms:>16.3f} {hit_ms:>10.3f}')
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=200, help='Reads or writes per test')
+    parser.add_argument('--writes', type=int, default=25, help='Writes per thread')
+    parser.add_argument('--threads', type=int, default=4, help='Number of concurrent writers')
+    parser.add_argument('--redis-url', default='', help='Redis server to test, if any')
+    args = parser.parse_args()
+
+    body = get_page_body()
+    print(f'Response size: {len(body) / 1024:.0f} KiB')
+    print(f'{"Backend":<12} {"Hit (ms)":>10} {"Memory hit (ms)":>16} {"Writes/s":>10}')
+
+    with TemporaryDirectory() as tmp_dir:
+        for name in CACHE_BACKENDS:
+            try:
+                hit_ms = benchmark_hits(
+                    init_backend(name, tmp_dir, args.redis_url), body, args.iterations, False
+                )
+                memory_hit_ms = benchmark_hits(
+                    init_backend(name, tmp_dir, args.redis_url), body, args.iterations, True
+                )
+                writes = benchmark_writes(
+                    init_backend(name, tmp_dir, args.redis_url), body, args.writes, args.threads
+                )
+            except ImportError as e:
+                print(f'{name:<12} skipped ({e})')
+                continue
+            print(f'{name:<12} {hit_ms:>10.3f} {memory_hit_ms:>16.3f} {writes:>10,.0f}')
+
+        print()
+        benchmark_compression(tmp_dir, body, args.iterations)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+"""Measure memory usage of model objects created from sample API responses in ``test/sample_data``,
+in bytes per object, to help track memory regressions
+
+Usage example:
+```
+python scripts/benchmark_memory.py --pages 10
+```
+"""
+
+import gc
+import json
+import tracemalloc
+from argparse import ArgumentParser
+
+from pyinaturalist.constants import SAMPLE_DATA_DIR
+from pyinaturalist.models import BaseModel, Observation, Taxon, get_lazy_properties, load_json
+
+PAGE_SIZE = 200
+FIXTURES = [
+    (Observation, 'get_observations_node_page1.json'),
+    (Observation, 'get_observations_by_id.json'),
+    (Observation, 'get_observation_with_ofvs.json'),
+    (Observation, 'get_observations_v2_full.json'),
+    (Taxon, 'get_taxa.json'),
+    (Taxon, 'get_taxa_by_id.json'),
+    (Taxon, 'get_taxa_autocomplete.json'),
+]
+
+
+def get_page_json(filename: str) -> str:
+    """Make a page of results by repeating results from a sample response"""
+    results = load_json(f'{SAMPLE_DATA_DIR}/{filename}')
+    return json.dumps([results[i % len(results)] for i in range(PAGE_SIZE)])
+
+
+def load_nested(obj: BaseModel):
+    """Recursively convert all lazy-loaded properties of a model object that have a value"""
+    for prop in get_lazy_properties(type(obj)).values():
+        if not getattr(obj, prop.temp_attr):
+            continue
+        value = prop.__get__(obj, type(obj))
+        for nested_obj in value if isinstance(value, list) else [value]:
+            if isinstance(nested_obj, BaseModel):
+                load_nested(nested_obj)
+
+
+def measure(model, filename: str, n_pages: int, access_nested: bool = False):
+    """Measure memory used by model objects, including any JSON they still refer to. Each page is
+    decoded separately (instead of copied), so strings are not shared between pages, the same as with
+    real API responses.
+    """
+    page_json = get_page_json(filename)
+    gc.collect()
+    tracemalloc.start()
+
+    objs = []
+    for _ in range(n_pages):
+        page_objs = model.from_json_list(json.loads(page_json))
+        if access_nested:
+            for obj in page_objs:
+                load_nested(obj)
+        objs.extend(page_objs)
+
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    label = f'{model.__name__} ({filename})' + (' + nested' if access_nested else '')
+    print(
+        f'{label:<65} {len(objs):>7,} objects  {current / len(objs):>9,.0f} bytes/object  '
+        f'{peak / 1024**2:>7.2f} MiB peak'
+    )
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pages', type=int, default=5, help='Pages of results per fixture')
+    args = parser.parse_args()
+
+    for model, filename in FIXTURES:
+        measure(model, filename, args.pages)
+        measure(model, filename, args.pages, access_nested=True)
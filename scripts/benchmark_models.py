@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""Benchmark model construction and export from sample API responses
+
+Usage example:
+```
+python scripts/benchmark_models.py --iterations 200
+```
+"""
+
+from argparse import ArgumentParser
+from copy import deepcopy
+from time import perf_counter
+
+from pyinaturalist.constants import SAMPLE_DATA_DIR
+from pyinaturalist.converters import convert_all_results
+from pyinaturalist.export import to_record_batch
+from pyinaturalist.models import IdentityMap, Observation, Taxon, load_json
+
+PAGE_SIZE = 200
+
+
+def get_page(filename: str) -> list:
+    """Make a full page of results by repeating results from a sample response"""
+    results = load_json(f'{SAMPLE_DATA_DIR}/{filename}')
+    return [deepcopy(results[i % len(results)]) for i in range(PAGE_SIZE)]
+
+
+def benchmark(
+    model, page: list, iterations: int, access_nested: bool = False, identity_map: bool = False
+):
+    """Time converting a page of results into model objects, and optionally accessing nested
+    (lazy-loaded) objects
+    """
+    # Use fresh copies of each page, since deduplication modifies results in place
+    pages = [deepcopy(page) for _ in range(iterations)] if identity_map else [page] * iterations
+    shared = IdentityMap()
+
+    start = perf_counter()
+    for page in pages:
+        if identity_map:
+            page = shared.dedupe(page, model)
+        objs = model.from_json_list(page)
+        if access_nested:
+            for obj in objs:
+                obj.taxon, obj.user, obj.photos, obj.identifications  # noqa: B018
+                for ident in obj.identifications:
+                    ident.taxon, ident.user  # noqa: B018
+    elapsed = perf_counter() - start
+
+    records_per_sec = (PAGE_SIZE * iterations) / elapsed
+    label = model.__name__
+    label += ' + nested' if access_nested else ''
+    label += ' + identity map' if identity_map else ''
+    print(f'{label:<40} {elapsed:>8.3f}s  {records_per_sec:>10,.0f} records/s')
+
+
+def benchmark_serialization(model, page: list, iterations: int):
+    """Time converting model objects (with nested objects loaded) back into dicts and JSON"""
+    objs = model.from_json_list(page)
+    for obj in objs:
+        obj.taxon, obj.user, obj.photos, obj.identifications  # noqa: B018
+
+    for label, func in [
+        ('to_dict', lambda obj: obj.to_dict()),
+        ('to_json', lambda obj: obj.to_json()),
+    ]:
+        start = perf_counter()
+        for _ in range(iterations):
+            for obj in objs:
+                func(obj)
+        elapsed = perf_counter() - start
+
+        records_per_sec = (PAGE_SIZE * iterations) / elapsed
+        label = f'{model.__name__}.{label}'
+        print(f'{label:<40} {elapsed:>8.3f}s  {records_per_sec:>10,.0f} records/s')
+
+
+def benchmark_export(model, page: list, iterations: int):
+    """Time converting a page of results into an Arrow record batch, as done by ``to_parquet()``.
+    Timestamps are converted first, as done by API request functions.
+    """
+    page = convert_all_results(deepcopy(page))
+    start = perf_counter()
+    for _ in range(iterations):
+        to_record_batch(page, model)
+    elapsed = perf_counter() - start
+
+    records_per_sec = (PAGE_SIZE * iterations) / elapsed
+    label = f'{model.__name__} to Arrow'
+    print(f'{label:<40} {elapsed:>8.3f}s  {records_per_sec:>10,.0f} records/s')
+
+
+if __name__ == '__main__':
+    parser = ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--iterations', type=int, default=100, help='Pages to convert per model')
+    args = parser.parse_args()
+
+    observations = get_page('get_observations_node_page1.json')
+    taxa = get_page('get_taxa.json')
+    benchmark(Observation, observations, args.iterations)
+    benchmark(Observation, observations, args.iterations, access_nested=True)
+    benchmark(Observation, observations, args.iterations, access_nested=True, identity_map=True)
+    benchmark(Taxon, taxa, args.iterations)
+    benchmark_serialization(Observation, observations, args.iterations)
+    benchmark_export(Observation, observations, args.iterations)
+    benchmark_export(Taxon, taxa, args.iterations)
@@ -1,15 +1,20 @@
 # ruff: noqa: F403, F405
+import json
+from copy import deepcopy
 from datetime import datetime
 from io import BytesIO
 from unittest.mock import patch
 
+import pytest
 from dateutil.tz import tzutc
+from requests import Request
 
 from pyinaturalist.client import iNatClient
 from pyinaturalist.constants import API_V1
 from pyinaturalist.models import (
     Annotation,
     ConservationStatus,
+    IdentityMap,
     LifeList,
     ListedTaxon,
     Observation,
@@ -19,6 +24,8 @@ from pyinaturalist.models import (
     TaxonSummary,
     User,
 )
+from pyinaturalist.session import AsyncClientSession, MockResponse
+from pyinaturalist.sync import ObservationStore
 from test.sample_data import *
 
 
@@ -92,6 +99,63 @@ def test_search(requests_mock):
     assert results[0].created_at == datetime(2020, 8, 27, 18, 0, 51, tzinfo=tzutc())
 
 
+def test_search__identity_map(requests_mock):
+    page = deepcopy(SAMPLE_DATA['get_observations_node_page1'])
+    observation = page['results'][0]
+    page['results'] = [observation, {**deepcopy(observation), 'id': observation['id'] + 1}]
+    requests_mock.get(f'{API_V1}/observations', json=page, status_code=200)
+
+    client = iNatClient(identity_map=True)
+    results = client.observations.search(place_id=1).all()
+    assert results[0].taxon is results[1].taxon
+    assert results[0].user is results[1].user
+
+    # By default, each paginator should have its own identity map
+    more_results = client.observations.search(place_id=1).all()
+    assert more_results[0].taxon is not results[0].taxon
+
+    # Objects should be shared across paginators from a client with a shared identity map
+    identity_map = IdentityMap()
+    client = iNatClient(identity_map=identity_map)
+    results = client.observations.search(place_id=1).all()
+    more_results = client.observations.search(place_id=1).all()
+    assert more_results[0].taxon is results[0].taxon
+    assert len(identity_map) > 0
+
+
+@pytest.mark.asyncio
+@patch.object(AsyncClientSession, '_asend_and_cache')
+async def test_search__async(mock_send):
+    request = Request('GET', f'{API_V1}/observations').prepare()
+    mock_send.return_value = MockResponse(
+        request,
+        headers={'Content-Type': 'application/json'},
+        content=json.dumps(SAMPLE_DATA['get_observations_node_page1']).encode(),
+    )
+    client = iNatClient(session=AsyncClientSession())
+    results = await client.observations.search(taxon_name='Danaus plexippus')
+
+    assert client.is_async is True
+    assert isinstance(results[0], Observation)
+    assert results[0].id == 57754375
+    assert mock_send.await_count == 1
+
+
+def test_search__iter_json(requests_mock):
+    requests_mock.get(
+        f'{API_V1}/observations',
+        json=SAMPLE_DATA['get_observation_with_ofvs'],
+        status_code=200,
+    )
+    client = iNatClient()
+    with patch.object(client.annotations, 'lookup') as mock_lookup:
+        results = list(client.observations.search().iter_json())
+
+    assert results[0]['id'] == SAMPLE_DATA['get_observation_with_ofvs']['results'][0]['id']
+    assert isinstance(results[0]['annotations'][0], dict)
+    mock_lookup.assert_not_called()
+
+
 def test_search__with_ofvs(requests_mock):
     requests_mock.get(
         f'{API_V1}/observations',
@@ -130,6 +194,20 @@ def test_search__with_annotations(requests_mock):
     assert annotation.controlled_value.label == 'Adult'
 
 
+def test_sync(requests_mock, tmp_path):
+    requests_mock.get(
+        f'{API_V1}/observations',
+        json=SAMPLE_DATA['get_observations_node_page1'],
+        status_code=200,
+    )
+    store = ObservationStore(tmp_path / 'observations.db')
+    result = iNatClient().observations.sync(store, taxon_name='Danaus plexippus')
+
+    assert result.inserted == 1
+    assert 57754375 in store
+    assert store.get_updated_since(taxon_name='Danaus plexippus') is not None
+
+
 def test_histogram(requests_mock):
     requests_mock.get(
         f'{API_V1}/observations/histogram',
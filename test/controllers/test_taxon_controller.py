@@ -1,8 +1,14 @@
+import json
 from copy import deepcopy
+from unittest.mock import patch
+
+import pytest
+from requests import Request
 
 from pyinaturalist.client import iNatClient
 from pyinaturalist.constants import API_V1
 from pyinaturalist.models import Taxon
+from pyinaturalist.session import AsyncClientSession, MockResponse
 from test.sample_data import SAMPLE_DATA
 
 
@@ -56,6 +62,25 @@ def test_search(requests_mock):
     assert results[0].id == 70118
 
 
+@pytest.mark.asyncio
+@patch.object(AsyncClientSession, '_asend_and_cache')
+async def test_search__async(mock_send):
+    """With an async session, requests should be sent from the event loop instead of a thread"""
+    request = Request('GET', f'{API_V1}/taxa').prepare()
+    mock_send.return_value = MockResponse(
+        request,
+        headers={'Content-Type': 'application/json'},
+        content=json.dumps(SAMPLE_DATA['get_taxa']).encode(),
+    )
+    client = iNatClient(session=AsyncClientSession())
+    paginator = client.taxa.search(q='vespi')
+    results = await paginator
+
+    assert paginator.async_request_function is not None
+    assert len(results) == 30 and isinstance(results[0], Taxon)
+    assert mock_send.await_count == 1
+
+
 def test_taxon__populate(requests_mock):
     full_taxon = deepcopy(SAMPLE_DATA['get_taxa_by_id'])
     full_taxon['results'][0]['conservation_status'] = {'authority': 'IUCN', 'status': 'LC'}
@@ -0,0 +1,412 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from time import sleep
+
+import pytest
+from requests_cache import BaseCache, CachedResponse
+from requests_cache.backends.base import DictStorage
+from requests_cache.backends.filesystem import FileCache
+from requests_cache.backends.sqlite import SQLiteCache
+from requests_cache.serializers import pickle_serializer
+
+from pyinaturalist.cache import (
+    COMPRESSION_FORMATS,
+    AccessLogStorage,
+    CachePruner,
+    CacheStats,
+    MemoryTierStorage,
+    compressed_serializer,
+    init_cache_backend,
+    train_compression_dict,
+)
+from pyinaturalist.constants import CACHE_FILE, SAMPLE_DATA_DIR
+from pyinaturalist.session import ClientSession
+
+TEST_URL = 'https://api.inaturalist.org/v1/taxa'
+SAMPLE_JSON = Path(SAMPLE_DATA_DIR, 'get_taxa.json').read_bytes()
+
+
+def _make_response(content: bytes = b'{"results": []}', **kwargs) -> CachedResponse:
+    headers = {'Content-Type': 'application/json'}
+    return CachedResponse(status_code=200, content=content, headers=headers, **kwargs)
+
+
+@pytest.fixture
+def storage():
+    return MemoryTierStorage(DictStorage(), max_entries=3, max_bytes=100)
+
+
+def test_memory_tier__hits_and_misses(storage):
+    storage.backend['key_1'] = _make_response()
+    response_1 = storage['key_1']
+    response_2 = storage['key_1']
+    assert response_1.content == response_2.content == b'{"results": []}'
+    with pytest.raises(KeyError):
+        storage['key_2']
+
+    stats = storage.stats
+    assert stats.memory_hits == 1
+    assert stats.memory_misses == 2
+    assert stats.backend_hits == 1
+    assert stats.backend_misses == 1
+    assert stats.memory_entries == 1
+    assert stats.memory_bytes == 15
+    assert stats.hit_ratio == 2 / 3
+
+
+def test_memory_tier__returns_copies(storage):
+    """Changes to a returned response should not affect the cached response"""
+    storage['key_1'] = _make_response()
+    response_1 = storage['key_1']
+    response_1.headers['X-Test'] = 'value'
+    response_1.json = lambda: {}
+    assert response_1.raw.read() == b'{"results": []}'
+
+    response_2 = storage['key_1']
+    assert 'X-Test' not in response_2.headers
+    assert response_2.json() == {'results': []}
+    assert response_2.raw.read() == b'{"results": []}'
+
+
+def test_memory_tier__evict_by_entries(storage):
+    for i in range(4):
+        storage[f'key_{i}'] = _make_response()
+    storage['key_1']  # Mark key_1 as recently used, so key_2 is evicted next
+
+    storage['key_4'] = _make_response()
+    assert list(storage._responses) == ['key_3', 'key_1', 'key_4']
+    assert storage.stats.memory_entries == 3
+    assert storage.stats.memory_evictions == 2
+    # Evicted responses are still available from the backend
+    assert len(storage) == 5
+    assert storage['key_0'].content == b'{"results": []}'
+    assert storage.stats.backend_hits == 1
+
+
+def test_memory_tier__evict_by_bytes(storage):
+    storage['key_1'] = _make_response(b'x' * 60)
+    storage['key_2'] = _make_response(b'x' * 30)
+    storage['key_3'] = _make_response(b'x' * 30)
+    assert list(storage._responses) == ['key_2', 'key_3']
+    assert storage.stats.memory_bytes == 60
+
+    # Responses larger than the limit are only stored in the backend
+    storage['key_4'] = _make_response(b'x' * 101)
+    assert 'key_4' not in storage._responses
+    assert 'key_4' in storage
+
+
+def test_memory_tier__invalidation(storage):
+    storage['key_1'] = _make_response(b'old')
+    storage['key_1'] = _make_response(b'new')
+    assert storage['key_1'].content == b'new'
+    assert storage.stats.memory_bytes == 3
+
+    storage['key_2'] = _make_response()
+    storage['key_3'] = _make_response()
+    del storage['key_1']
+    assert 'key_1' not in storage
+    storage.bulk_delete(['key_2'])
+    assert 'key_2' not in storage
+
+    storage.clear()
+    assert len(storage) == 0
+    assert storage.stats.memory_entries == storage.stats.memory_bytes == 0
+
+
+def test_memory_tier__bulk_read():
+    """Iterating over all responses should read from the backend, without adding responses to the
+    memory tier or counting hits
+    """
+    backend = DictStorage()
+    for i in range(5):
+        backend[f'key_{i}'] = _make_response()
+    storage = MemoryTierStorage(backend, max_entries=3)
+
+    assert len(list(storage.values())) == 5
+    assert [k for k, _ in storage.items()] == [f'key_{i}' for i in range(5)]
+    assert storage.stats.memory_entries == 0
+    assert storage.stats.hits == storage.stats.memory_misses == 0
+
+
+def test_memory_tier__expired():
+    """Expired responses in the memory tier should be treated the same as in the backend"""
+    storage = MemoryTierStorage(DictStorage())
+    storage['key_1'] = _make_response(expires=datetime.utcnow() - timedelta(seconds=1))
+    assert storage['key_1'].is_expired is True
+
+
+def test_memory_tier__sqlite(tmp_path):
+    cache = SQLiteCache(tmp_path / 'cache.db')
+    cache.responses = MemoryTierStorage(cache.responses)
+    cache.responses['key_1'] = _make_response()
+    cache.responses.clear_memory()
+
+    assert cache.responses.db_path == tmp_path / 'cache.db'
+    assert cache.get_response('key_1').content == b'{"results": []}'
+    assert cache.get_response('key_1').content == b'{"results": []}'
+    assert cache.responses.stats.backend_hits == 1
+    assert cache.responses.stats.memory_hits == 1
+
+    cache.delete('key_1')
+    assert cache.get_response('key_1') is None
+
+
+def test_session__memory_cache(tmp_path):
+    session = ClientSession(cache_file=tmp_path / 'cache.db', memory_cache_entries=10)
+    assert isinstance(session.cache.responses, MemoryTierStorage)
+    assert session.cache.responses.max_entries == 10
+    assert session.cache_stats.memory_hits == 0
+
+
+def test_session__memory_cache_disabled(tmp_path):
+    session = ClientSession(cache_file=tmp_path / 'cache.db')
+    assert not isinstance(session.cache.responses, MemoryTierStorage)
+    assert session.cache_stats is None
+
+
+@pytest.mark.parametrize(
+    'backend, expected_cls',
+    [
+        ('sqlite', SQLiteCache),
+        ('sqlite_wal', SQLiteCache),
+        ('filesystem', FileCache),
+        ('memory', BaseCache),
+    ],
+)
+def test_init_cache_backend(tmp_path, backend, expected_cls):
+    cache = init_cache_backend(backend, tmp_path / 'cache')
+    assert type(cache) is expected_cls
+
+
+def test_init_cache_backend__sqlite():
+    cache = init_cache_backend('sqlite')
+    assert str(cache.responses.db_path) == CACHE_FILE
+    with cache.responses.connection() as conn:
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] != 'wal'
+
+
+def test_init_cache_backend__sqlite_wal(tmp_path):
+    cache = init_cache_backend('sqlite_wal', tmp_path / 'cache.db')
+    with cache.responses.connection() as conn:
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+
+def test_init_cache_backend__instance():
+    cache = BaseCache()
+    assert init_cache_backend(cache) is cache
+
+
+def test_init_cache_backend__invalid():
+    with pytest.raises(ValueError):
+        init_cache_backend('mongodb')
+
+
+@pytest.mark.parametrize('backend', ['sqlite', 'sqlite_wal', 'filesystem', 'memory'])
+def test_session__cache_backend(requests_mock, tmp_path, backend):
+    requests_mock.get(TEST_URL, json={'results': []})
+    session = ClientSession(cache_file=tmp_path / 'cache', cache_backend=backend)
+    assert session.get(TEST_URL).from_cache is False
+
+    response = session.get(TEST_URL)
+    assert response.from_cache is True
+    assert response.json() == {'results': []}
+    assert requests_mock.call_count == 1
+
+
+def test_session__cache_backend__memory():
+    """The in-memory tier should be skipped if the backend is already in memory"""
+    session = ClientSession(cache_backend='memory', memory_cache_entries=10)
+    assert isinstance(session.cache.responses, DictStorage)
+    assert session.cache_stats is None
+
+
+def test_session__cache_backend__redis(requests_mock):
+    """Test the Redis backend with an in-process stand-in server, shared by two sessions"""
+    fakeredis = pytest.importorskip('fakeredis')
+    server = fakeredis.FakeServer()
+    requests_mock.get(TEST_URL, json={'results': []})
+    session_1 = ClientSession(cache_backend='redis', connection=fakeredis.FakeRedis(server=server))
+    session_2 = ClientSession(
+        cache_backend='redis',
+        connection=fakeredis.FakeRedis(server=server),
+        memory_cache_entries=10,
+    )
+    assert session_1.cache.responses.namespace == 'pyinaturalist'
+
+    assert session_1.get(TEST_URL).from_cache is False
+    assert session_2.get(TEST_URL).from_cache is True
+    assert session_2.cache_stats.backend_hits == 1
+    assert requests_mock.call_count == 1
+
+
+@pytest.mark.parametrize('compression', ['zstd', 'gzip'])
+def test_compressed_serializer(compression):
+    if compression == 'zstd':
+        pytest.importorskip('zstandard')
+    stats = CacheStats()
+    serializer = compressed_serializer(compression, stats=stats)
+    response = _make_response(SAMPLE_JSON)
+
+    serialized = serializer.dumps(response)
+    assert serialized.startswith(COMPRESSION_FORMATS[compression])
+    assert serializer.loads(serialized).content == SAMPLE_JSON
+
+    assert stats.compressed_bytes == len(serialized)
+    assert stats.compression_ratio > 5
+    assert stats.decompressions == 1
+    assert stats.avg_decompress_ms > 0
+
+
+def test_compressed_serializer__uncompressed():
+    """Responses written before compression was enabled should still be readable"""
+    serializer = compressed_serializer('gzip')
+    serialized = pickle_serializer.dumps(_make_response(SAMPLE_JSON))
+    assert serializer.loads(serialized).content == SAMPLE_JSON
+
+
+def test_compressed_serializer__invalid():
+    with pytest.raises(ValueError):
+        compressed_serializer('lzma')
+    with pytest.raises(ValueError):
+        compressed_serializer('gzip', dictionary=b'dict')
+
+
+def test_train_compression_dict(tmp_path):
+    pytest.importorskip('zstandard')
+    responses = [_make_response(path.read_bytes()) for path in Path(SAMPLE_DATA_DIR).glob('*.json')]
+    dict_path = tmp_path / 'inat.dict'
+    dict_path.write_bytes(train_compression_dict(responses, dict_size=16 * 1024))
+
+    stats_1, stats_2 = CacheStats(), CacheStats()
+    response = _make_response(b'{"results": [{"id": 1, "name": "Aves", "rank": "class"}]}')
+    compressed_serializer(stats=stats_1).dumps(response)
+    serializer = compressed_serializer(dictionary=dict_path, stats=stats_2)
+    assert serializer.loads(serializer.dumps(response)).content == response.content
+    assert stats_2.compressed_bytes < stats_1.compressed_bytes
+
+
+def test_session__cache_compression(requests_mock, tmp_path):
+    requests_mock.get(TEST_URL, content=SAMPLE_JSON, headers={'Content-Type': 'application/json'})
+    session = ClientSession(cache_file=tmp_path / 'cache.db', cache_compression='gzip')
+    session.get(TEST_URL)
+
+    response = session.get(TEST_URL)
+    assert response.from_cache is True
+    assert response.content == SAMPLE_JSON
+    assert session.cache_stats.compression_ratio > 5
+    assert session.cache_stats.decompressions == 1
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path):
+    cache = SQLiteCache(tmp_path / 'cache.db')
+    cache.responses = AccessLogStorage(MemoryTierStorage(cache.responses))
+    return cache
+
+
+def _expires(days: int) -> datetime:
+    return datetime.utcnow() + timedelta(days=days)
+
+
+def _get_row_size(cache: SQLiteCache) -> int:
+    """Get the size of a serialized response in the database (assuming all are the same size)"""
+    with cache.responses.connection() as con:
+        query = f'SELECT MAX(LENGTH(value)) FROM {cache.responses.table_name}'
+        return con.execute(query).fetchone()[0]
+
+
+def test_cache_pruner__expired(sqlite_cache):
+    sqlite_cache.responses['expired'] = _make_response(expires=_expires(-1))
+    sqlite_cache.responses['valid'] = _make_response(expires=_expires(1))
+    sqlite_cache.responses['no_expiration'] = _make_response()
+
+    pruner = CachePruner(sqlite_cache)
+    assert pruner.prune() == 1
+    assert set(sqlite_cache.responses.keys()) == {'valid', 'no_expiration'}
+    # The response should also be removed from the in-memory tier
+    assert 'expired' not in sqlite_cache.responses
+    assert pruner.stats.expired_removed == 1
+    assert pruner.stats.evictions == 0
+
+
+def test_cache_pruner__lru(sqlite_cache):
+    for i in range(5):
+        sqlite_cache.responses[f'key_{i}'] = _make_response(b'x' * 100)
+        sleep(0.001)
+    sqlite_cache.responses['key_0']  # Mark key_0 as recently used
+
+    max_size = _get_row_size(sqlite_cache) * 3
+    pruner = CachePruner(sqlite_cache, max_size=max_size, eviction='lru')
+    assert pruner.prune() == 2
+    assert set(sqlite_cache.responses.keys()) == {'key_0', 'key_3', 'key_4'}
+    assert pruner.stats.evictions == 2
+    assert pruner.stats.backend_bytes == max_size
+
+    # Access times should be saved to the database, and removed for deleted responses
+    with sqlite_cache.responses.connection() as con:
+        keys = [row[0] for row in con.execute(f'SELECT key FROM {pruner.access_table_name}')]
+    assert set(keys) == {'key_0', 'key_3', 'key_4'}
+
+
+def test_cache_pruner__expires(sqlite_cache):
+    sqlite_cache.responses['no_expiration'] = _make_response(b'x' * 100)
+    sqlite_cache.responses['expires_30d'] = _make_response(b'x' * 100, expires=_expires(30))
+    sqlite_cache.responses['expires_7d'] = _make_response(b'x' * 100, expires=_expires(7))
+    sqlite_cache.responses['expires_1d'] = _make_response(b'x' * 100, expires=_expires(1))
+
+    max_size = int(_get_row_size(sqlite_cache) * 2.5)
+    pruner = CachePruner(sqlite_cache, max_size=max_size, eviction='expires')
+    assert pruner.prune() == 2
+    assert set(sqlite_cache.responses.keys()) == {'no_expiration', 'expires_30d'}
+
+
+def test_cache_pruner__incremental_vacuum(sqlite_cache):
+    for i in range(20):
+        sqlite_cache.responses[f'key_{i}'] = _make_response(b'x' * 10000, expires=_expires(-1))
+    pruner = CachePruner(sqlite_cache, vacuum_pages=2)
+    pruner._init_db()
+    with sqlite_cache.responses.connection() as con:
+        assert con.execute('PRAGMA auto_vacuum').fetchone()[0] == 2
+
+    def get_free_pages():
+        with sqlite_cache.responses.connection() as con:
+            return con.execute('PRAGMA freelist_count').fetchone()[0]
+
+    # Free pages should be released gradually, up to the specified number of pages per run
+    pruner.prune()
+    n_free_pages = get_free_pages()
+    assert n_free_pages > 0
+    pruner.prune()
+    assert 0 < get_free_pages() < n_free_pages
+    pruner.vacuum_pages = 1000
+    pruner.prune()
+    assert get_free_pages() == 0
+
+
+def test_cache_pruner__background(sqlite_cache):
+    sqlite_cache.responses['expired'] = _make_response(expires=_expires(-1))
+    pruner = CachePruner(sqlite_cache, interval=0.01)
+    pruner.start()
+    sleep(0.2)
+    pruner.stop()
+    assert 'expired' not in sqlite_cache.responses
+    assert pruner._thread is None
+
+
+def test_cache_pruner__invalid():
+    with pytest.raises(ValueError):
+        CachePruner(BaseCache())
+    with pytest.raises(ValueError):
+        CachePruner(SQLiteCache(use_memory=True), eviction='random')
+
+
+def test_session__max_cache_size(tmp_path):
+    session = ClientSession(cache_file=tmp_path / 'cache.db', max_cache_size=1000)
+    assert isinstance(session.cache.responses, AccessLogStorage)
+    assert session.cache_pruner.max_size == 1000
+    assert session.cache_pruner._thread.is_alive()
+    assert session.cache_stats is session.cache_pruner.stats
+
+    session.close()
+    assert session.cache_pruner._thread is None
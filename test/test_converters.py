@@ -5,9 +5,10 @@ from tempfile import NamedTemporaryFile
 from unittest.mock import MagicMock
 
 import pytest
-from dateutil.tz import tzoffset
+from dateutil.tz import tzoffset, tzutc
 
 from pyinaturalist.converters import (
+    convert_all_results,
     convert_lat_long,
     convert_observation_histogram,
     convert_observation_timestamps,
@@ -17,6 +18,7 @@ from pyinaturalist.converters import (
     format_file_size,
     format_license,
     safe_split,
+    try_datetime,
 )
 from test.conftest import load_sample_data
 
@@ -39,6 +41,42 @@ def test_convert_lat_long(input, expected_output):
     assert convert_lat_long(input) == expected_output
 
 
+def test_convert_all_results():
+    results = [
+        {
+            'created_at': '2020-09-01T00:00:00Z',
+            'time_observed_at': '2020-08-01T00:00:00Z',
+            'location': '12.3,45.6',
+        },
+        {'record': {'updated_at': '2020-09-01T00:00:00Z', 'location': '12.3,45.6'}},
+    ]
+    converted = convert_all_results(results)
+
+    # Results should be converted in place
+    assert converted is results
+    assert results[0]['created_at'] == datetime(2020, 9, 1, tzinfo=tzutc())
+    assert results[0]['observed_on'] == datetime(2020, 8, 1, tzinfo=tzutc())
+    assert 'time_observed_at' not in results[0]
+    assert results[0]['location'] == [12.3, 45.6]
+    assert results[1]['record']['updated_at'] == datetime(2020, 9, 1, tzinfo=tzutc())
+    assert results[1]['record']['location'] == [12.3, 45.6]
+
+
+def test_convert_all_results__copy():
+    results = [
+        {'created_at': '2020-09-01T00:00:00Z', 'location': '12.3,45.6'},
+        {'record': {'updated_at': '2020-09-01T00:00:00Z'}},
+    ]
+    converted = convert_all_results(results, copy=True)
+
+    assert converted[0]['created_at'] == datetime(2020, 9, 1, tzinfo=tzutc())
+    assert converted[1]['record']['updated_at'] == datetime(2020, 9, 1, tzinfo=tzutc())
+    assert results == [
+        {'created_at': '2020-09-01T00:00:00Z', 'location': '12.3,45.6'},
+        {'record': {'updated_at': '2020-09-01T00:00:00Z'}},
+    ]
+
+
 def test_ensure_file_obj__obj():
     file_obj = ensure_file_obj(BytesIO(b'test content'))
     assert file_obj.read() == b'test content'
@@ -172,3 +210,40 @@ def test_format_license():
 @pytest.mark.parametrize('input, expected_output', [(None, []), ('a | b', ['a', 'b'])])
 def test_safe_split(input, expected_output):
     assert safe_split(input) == expected_output
+
+
+@pytest.mark.parametrize(
+    'timestamp, expected_datetime',
+    [
+        ('2020-08-27', datetime(2020, 8, 27)),
+        ('2020-08-27T18:00', datetime(2020, 8, 27, 18, 0)),
+        (
+            '2020-08-27T18:00:51-05:00',
+            datetime(2020, 8, 27, 18, 0, 51, tzinfo=tzoffset(None, -18000)),
+        ),
+        (
+            '2020-08-27 18:00:51 -0500',
+            datetime(2020, 8, 27, 18, 0, 51, tzinfo=tzoffset(None, -18000)),
+        ),
+        ('2021-05-10T09:40:24.717Z', datetime(2021, 5, 10, 9, 40, 24, 717000, tzinfo=tzutc())),
+        ('2020-08-27T18:00:51+00:00', datetime(2020, 8, 27, 18, 0, 51, tzinfo=tzutc())),
+        ('  2020-08-27  ', datetime(2020, 8, 27)),
+        # Non-ISO 8601 strings handled by dateutil
+        ('Aug 27, 2020 6:00 PM', datetime(2020, 8, 27, 18, 0)),
+        ('2020/08/27', datetime(2020, 8, 27)),
+        # Invalid values
+        ('2020-02-30', None),
+        ('not a date', None),
+        ('', None),
+        (None, None),
+    ],
+)
+def test_try_datetime(timestamp, expected_datetime):
+    dt = try_datetime(timestamp)
+    assert dt == expected_datetime
+    if dt:
+        assert dt.tzinfo == expected_datetime.tzinfo
+
+
+def test_try_datetime__cached_dates():
+    assert try_datetime('2020-08-27') is try_datetime('2020-08-27')
@@ -0,0 +1,173 @@
+from copy import deepcopy
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from pyinaturalist.client import iNatClient
+from pyinaturalist.constants import API_V1
+from pyinaturalist.export import get_arrow_schema, to_arrow, write_parquet
+from pyinaturalist.models import (
+    Observation,
+    Observations,
+    Photo,
+    Project,
+    Taxon,
+    TaxonCount,
+    TaxonCounts,
+)
+from pyinaturalist.models.base import ModelSchema
+from test.sample_data import SAMPLE_DATA, j_observation_1, j_observation_2, j_taxon_1
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+
+def test_get_arrow_schema():
+    schema = get_arrow_schema(Observation)
+    assert schema.field('id').type == pa.int64()
+    assert schema.field('captive').type == pa.bool_()
+    assert schema.field('quality_grade').type == pa.string()
+    assert schema.field('created_at').type == pa.timestamp('us', tz='UTC')
+    assert schema.field('location').type == pa.list_(pa.float64(), 2)
+    assert schema.field('tags').type == pa.list_(pa.string())
+    assert schema.field('preferences').type == pa.string()
+
+    # Nested models should be stored as structs, but only one level deep
+    taxon_type = schema.field('taxon').type
+    assert pa.types.is_struct(taxon_type)
+    assert taxon_type.field('ancestor_ids').type == pa.list_(pa.int64())
+    assert 'ancestors' not in [taxon_type.field(i).name for i in range(taxon_type.num_fields)]
+    assert pa.types.is_struct(schema.field('photos').type.value_type)
+
+
+def test_to_arrow__json():
+    table = to_arrow([j_observation_1, j_observation_2], Observation)
+    assert table.num_rows == 2
+    assert table.schema == get_arrow_schema(Observation)
+    assert table.column('id').to_pylist() == [16227955, 57754375]
+    assert table.column('location').to_pylist()[0] == [50.646894, 4.360086]
+    assert table.column('license_code').to_pylist() == ['CC0', 'CC-BY-NC']
+    assert table.column('taxon').to_pylist()[0]['name'] == j_observation_1['taxon']['name']
+    assert table.column('created_at').to_pylist()[1] == datetime(
+        2020, 8, 27, 18, 0, 51, tzinfo=timezone.utc
+    )
+
+
+@pytest.mark.parametrize(
+    'sample_data',
+    [
+        'get_observation',
+        'get_observations_node_page1',
+        'get_observation_with_ofvs',
+        'get_observations_v2_full',
+    ],
+)
+def test_to_arrow__objects(sample_data):
+    """Results from model objects should be the same as from JSON, regardless of whether lazy-loaded
+    properties have been accessed yet
+    """
+    results = deepcopy(SAMPLE_DATA[sample_data]['results'])
+    json_table = to_arrow(results, Observation)
+    assert to_arrow(Observation.from_json_list(results), Observation).equals(json_table)
+
+    observations = Observation.from_json_list(results)
+    for obs in observations:
+        obs.taxon, obs.user, obs.identifications, obs.photos  # noqa: B018
+    assert to_arrow(observations, Observation).equals(json_table)
+
+
+@pytest.mark.parametrize(
+    'model, results',
+    [
+        (
+            Observation,
+            [
+                {'id': 1, 'observed_on': '2020-01-01', 'time_observed_at': '2020-01-01T10:00:00Z'},
+                {'identifications': [{'id': 1}, {'id': 2}]},
+            ],
+        ),
+        (Photo, [{'id': 1, 'license_code': 'cc_by'}, {'id': 2, 'photo': {'id': 3}}]),
+        (
+            Taxon,
+            [
+                {'id': 1, 'rank': 'Sub-Species', 'ancestry': '48460/1/2'},
+                {'id': 2, 'iconic_taxon_id': 3, 'ancestors': [{'id': 5, 'rank': 'genus'}]},
+            ],
+        ),
+        (Taxon, SAMPLE_DATA['get_taxa']['results']),
+        (TaxonCount, SAMPLE_DATA['get_observation_species_counts']['results']),
+        (Project, SAMPLE_DATA['get_projects']['results']),
+    ],
+)
+def test_to_arrow__model_init_values(model, results):
+    """Values that models modify while initializing should be the same when read directly from JSON"""
+    json_table = to_arrow(deepcopy(results), model)
+    assert to_arrow(model.from_json_list(deepcopy(results)), model).equals(json_table)
+
+
+@pytest.mark.parametrize('sample_data', ['get_observations_node_page1', 'get_observations_v2_full'])
+def test_to_arrow__no_model_objects(sample_data):
+    """JSON results should be converted directly, without creating any model objects"""
+    results = SAMPLE_DATA[sample_data]['results']
+    with patch.object(ModelSchema, 'construct', side_effect=AssertionError('Created model object')):
+        table = to_arrow(results, Observation)
+    assert table.num_rows == len(results)
+
+
+def test_to_arrow__empty_values():
+    """Empty values and timestamps set by model defaults should be stored as nulls"""
+    result = {'id': 1, 'description': '', 'preferences': {}, 'tags': [], 'user': {'id': 2}}
+    for results in [[result], Observation.from_json_list([result])]:
+        row = to_arrow(results, Observation).to_pylist()[0]
+        assert row['description'] is None
+        assert row['preferences'] is None
+        assert row['tags'] is None
+        assert row['created_at'] is None
+        assert row['user']['created_at'] is None
+
+
+def test_collection_to_arrow():
+    table = Observations.from_json_list([j_observation_1, j_observation_2]).to_arrow()
+    assert table.column('id').to_pylist() == [16227955, 57754375]
+
+    table = TaxonCounts.from_json(SAMPLE_DATA['get_observation_species_counts']).to_arrow()
+    assert table.schema.field('count').type == pa.int64()
+
+
+def test_collection_to_parquet(tmp_path):
+    path = tmp_path / 'observations.parquet'
+    Observations.from_json_list([j_observation_1, j_observation_2]).to_parquet(path)
+    table = pq.read_table(path)
+    assert table.column('id').to_pylist() == [16227955, 57754375]
+
+
+def test_write_parquet(tmp_path):
+    """Each page should be written as a separate row group"""
+    path = tmp_path / 'taxa.parquet'
+    n_rows = write_parquet([[j_taxon_1], [], [j_taxon_1, j_taxon_1]], path, Taxon)
+    assert n_rows == 3
+
+    parquet_file = pq.ParquetFile(path)
+    assert parquet_file.metadata.num_rows == 3
+    assert parquet_file.metadata.num_row_groups == 2
+
+
+def test_paginator_to_parquet(requests_mock, tmp_path):
+    requests_mock.get(
+        f'{API_V1}/observations',
+        [
+            {'json': SAMPLE_DATA['get_observations_node_page1'], 'status_code': 200},
+            {'json': SAMPLE_DATA['get_observations_node_page2'], 'status_code': 200},
+        ],
+    )
+    path = tmp_path / 'observations.parquet'
+    n_rows = iNatClient().observations.search(place_id=1, per_page=1).to_parquet(path)
+    assert n_rows == 2
+
+    table = pq.read_table(path)
+    assert table.column('id').to_pylist() == [57754375, 57707611]
+    # Timestamps should already be converted by the API request function
+    assert table.column('observed_on').to_pylist()[0] == datetime(
+        2020, 8, 27, 8, 57, 22, tzinfo=timezone.utc
+    )
@@ -10,6 +10,7 @@
 * Formatting in the model's __str__ method
 """
 
+import json
 from copy import deepcopy
 from datetime import date, datetime
 
@@ -30,6 +31,7 @@ from pyinaturalist.constants import (
     UNRANKED,
 )
 from pyinaturalist.models import *
+from pyinaturalist.models.base import get_schema
 from test.conftest import sample_data_path
 from test.sample_data import *
 
@@ -43,6 +45,177 @@ def test_from_json():
     assert Observation.from_json(obs) is obs
 
 
+def test_from_json__invalid_keys():
+    obs = Observation.from_json({**j_observation_1, 'invalid_key': 1, 'description': None})
+    assert obs.id == 16227955
+    assert obs.description is None
+    assert not hasattr(obs, 'invalid_key')
+
+
+def test_get_schema():
+    schema = get_schema(Observation)
+    assert get_schema(Observation) is schema
+    assert {'id', 'taxon', 'time_observed_at'} <= schema.init_keys
+    assert 'is_nested' not in schema.init_keys
+
+    obs = schema.construct(id=1, taxon={'id': 2})
+    assert isinstance(obs, Observation)
+    assert obs.taxon.id == 2
+
+
+def test_lazy_property__empty_list():
+    """Missing list values should not be allocated until accessed, but otherwise behave the same as
+    empty lists
+    """
+    taxon = Taxon(id=1)
+    assert taxon._children is None
+    assert taxon == Taxon(id=1, children=[])
+    assert taxon.to_dict()['children'] == []
+
+    taxon.children.append(Taxon(id=2))
+    assert len(taxon.children) == 1
+
+
+def test_field__intern():
+    """String values of fields with options (or intern=True) should be interned, so identical values
+    from separately decoded responses share the same object
+    """
+    obs_1 = Observation.from_json(json.loads(json.dumps(j_observation_1)))
+    obs_2 = Observation.from_json(json.loads(json.dumps(j_observation_1)))
+    assert obs_1.quality_grade == 'research'
+    assert obs_1.quality_grade is obs_2.quality_grade
+    assert obs_1.license_code is obs_2.license_code
+    assert obs_1.taxon.rank is obs_2.taxon.rank
+    assert obs_1.taxon.iconic_taxon_name is obs_2.taxon.iconic_taxon_name
+
+    # Normalized values should also be interned
+    taxon = Taxon(rank=''.join(['SPEC', 'IES']))
+    assert taxon.rank is Taxon(rank='species').rank
+
+
+def test_identity_map():
+    results = [deepcopy(j_observation_1), deepcopy(j_observation_1)]
+    results[1]['id'] = 1
+    identity_map = IdentityMap()
+    obs_1, obs_2 = Observation.from_json_list(identity_map.dedupe(results, Observation))
+
+    assert obs_1.taxon is obs_2.taxon
+    assert obs_1.user is obs_2.user
+    assert obs_1.taxon.id == j_observation_1['taxon']['id']
+
+    # Nested objects within lists should also be shared, but not the list items themselves
+    assert obs_1.identifications[1].taxon is obs_1.taxon
+    assert obs_1.identifications[0].user is obs_1.user
+    assert obs_1.identifications[0] is not obs_2.identifications[0]
+
+    # 14 unique taxa (including identification taxon ancestors) + 3 unique users
+    assert len(identity_map) == 17
+    identity_map.clear()
+    assert len(identity_map) == 0
+
+
+def test_identity_map__nested_lists():
+    taxon_1, taxon_2 = deepcopy(j_taxon_1), deepcopy(j_taxon_1)
+    taxon_2['id'] = 1
+    identity_map = IdentityMap()
+    taxon_1, taxon_2 = Taxon.from_json_list(identity_map.dedupe([taxon_1, taxon_2], Taxon))
+
+    assert len(taxon_1.ancestors) == len(j_taxon_1['ancestors'])
+    assert all(a is b for a, b in zip(taxon_1.ancestors, taxon_2.ancestors))
+    assert all(a is b for a, b in zip(taxon_1.children, taxon_2.children))
+
+
+def test_identity_map__max_size():
+    """The least recently used objects should be removed once the size limit is reached"""
+    identity_map = IdentityMap(max_size=2)
+    taxon_1 = identity_map.get({'id': 1}, Taxon)
+    identity_map.get({'id': 2}, Taxon)
+    assert identity_map.get({'id': 1}, Taxon) is taxon_1
+
+    identity_map.get({'id': 3}, Taxon)
+    assert len(identity_map) == 2
+    assert identity_map.get({'id': 1}, Taxon) is taxon_1
+    assert len(identity_map._sizes) == 2
+
+    # Taxon 2 was least recently used, so a new object should be created for it
+    taxon_2 = identity_map.get({'id': 2, 'name': 'Vespa'}, Taxon)
+    assert taxon_2.name == 'Vespa'
+    assert (Taxon, 3) not in identity_map._objects
+
+
+# Partial records (like identification taxa) appearing before full records shouldn't lose any data
+@pytest.mark.parametrize(
+    'sample_data',
+    ['get_observations_v2_full', 'get_observations_node_page1', 'get_observation_with_ofvs'],
+)
+def test_identity_map__partial_records(sample_data):
+    results = SAMPLE_DATA[sample_data]['results']
+    expected = Observation.from_json_list(deepcopy(results))
+    observations = Observation.from_json_list(IdentityMap().dedupe(deepcopy(results), Observation))
+
+    for obs, expected_obs in zip(observations, expected):
+        assert obs.taxon.name == expected_obs.taxon.name
+        assert obs.taxon.rank == expected_obs.taxon.rank
+        assert obs.taxon.ancestor_ids == expected_obs.taxon.ancestor_ids
+        assert obs.taxon.wikipedia_summary == expected_obs.taxon.wikipedia_summary
+        assert obs.taxon.preferred_common_name == expected_obs.taxon.preferred_common_name
+
+
+def test_identity_map__partial_record_first():
+    taxon = {'id': 48662, 'name': 'Danaus plexippus', 'rank': 'species', 'ancestor_ids': [1, 48662]}
+    results = [
+        {'id': 1, 'taxon': {'id': 48662}},
+        {'id': 2, 'taxon': deepcopy(taxon)},
+    ]
+    obs_1, obs_2 = Observation.from_json_list(IdentityMap().dedupe(results, Observation))
+
+    assert obs_1.taxon is obs_2.taxon
+    assert obs_1.taxon.name == 'Danaus plexippus'
+    assert obs_1.taxon.rank == 'species'
+    assert obs_1.taxon.ancestor_ids == [1, 48662]
+
+
+@pytest.mark.parametrize(
+    'fields',
+    [
+        {'quality_grade': True, 'taxon': {'name': True, 'rank': True}, 'user': True},
+        ['quality_grade', 'taxon.name', 'taxon.rank', 'user'],
+        'quality_grade,taxon.name,taxon.rank,user',
+    ],
+)
+def test_projection(fields):
+    projection = get_projection(Observation, fields)
+    assert get_projection(Observation, fields) is projection
+    assert projection.projected_fields == ('quality_grade', 'taxon', 'user')
+
+    obs = projection.from_json(j_observation_v2)
+    assert not hasattr(obs, '__dict__')
+    assert obs.id == j_observation_v2['id']
+    assert obs.quality_grade == j_observation_v2['quality_grade']
+    assert obs.taxon.name == j_observation_v2['taxon']['name']
+    assert obs.taxon.projected_fields == ('name', 'rank')
+    assert obs.user.login == j_observation_v2['user']['login']
+    assert obs.username == j_observation_v2['user']['login']
+    assert obs.to_dict()['taxon'] == {
+        'id': j_observation_v2['taxon']['id'],
+        'uuid': None,
+        'name': j_observation_v2['taxon']['name'],
+        'rank': j_observation_v2['taxon']['rank'],
+    }
+
+    # Unselected attributes and properties should raise an error
+    with pytest.raises(AttributeError, match='not included in the selected fields'):
+        obs.observed_on  # noqa: B018
+    with pytest.raises(AttributeError, match='not included in the selected fields'):
+        obs.taxon.ancestors  # noqa: B018
+    with pytest.raises(AttributeError, match='no attribute'):
+        obs.nonexistent_attribute  # noqa: B018
+
+
+def test_projection__all_fields():
+    assert get_projection(Observation, 'all') is Observation
+
+
 def test_from_json_file():
     obs_list = Observation.from_json_file(sample_data_path('get_observations_node_page1.json'))
     assert isinstance(obs_list, list)
@@ -84,6 +257,27 @@ def test_copy_collection():
     assert obs_list_1[0].taxon.id != obs_list_2[0].taxon.id
 
 
+def test_collection__list_methods():
+    obs_list = Observations.from_json([j_observation_1, j_observation_2])
+    assert not hasattr(obs_list, '__dict__')
+
+    # Slices and concatenation should return the same collection type
+    assert isinstance(obs_list[:1], Observations) and len(obs_list[:1]) == 1
+    assert isinstance(obs_list + obs_list, Observations) and len(obs_list + obs_list) == 4
+    assert len(obs_list.data + obs_list) == 4
+    assert [obs.id for obs in reversed(obs_list)] == [obs_list[1].id, obs_list[0].id]
+
+    obs_list.append(obs_list[0])
+    obs_list.sort(key=lambda obs: obs.id)
+    assert len(obs_list) == 3 and obs_list[0] in obs_list
+    del obs_list[0]
+    assert len(obs_list) == 2
+
+    # Other attributes should be kept in slices
+    life_list = LifeList.from_json(j_life_list_1, user_id=1)
+    assert life_list[:2].user_id == 1
+
+
 def test_deduplicate():
     obs_list = Observations.from_json([j_observation_1, j_observation_1, j_observation_2])
     assert len(obs_list) == 3
@@ -106,6 +300,49 @@ def test_to_dict__specific_keys():
     assert obs_dict['taxon']['id'] == j_observation_1['taxon']['id']
 
 
+def test_to_dict__nested():
+    """Nested objects should be converted to dicts, including within lists, and lazy-loaded properties
+    that haven't been accessed yet should be returned as-is, without converting them
+    """
+    obs = Observation.from_json(j_observation_1)
+    obs.identifications[0].taxon  # noqa: B018
+    obs_dict = obs.to_dict()
+    assert obs_dict['taxon']['id'] == j_observation_1['taxon']['id']
+    assert isinstance(obs._taxon, dict)
+
+    ident_dict = obs_dict['identifications'][0]
+    assert ident_dict['taxon']['id'] == j_observation_1['identifications'][0]['taxon']['id']
+    assert '_taxon' not in ident_dict and '_user' not in ident_dict
+    assert ident_dict['taxon']['children'] == []
+
+
+def test_to_dict__copy():
+    """Containers in dict output should be copies, so modifying them doesn't modify the object"""
+    obs = Observation.from_json(j_observation_1)
+    obs_dict = obs.to_dict()
+    obs_dict['tags'].append('new tag')
+    obs_dict['identifications'].clear()
+    assert 'new tag' not in obs.tags
+    assert len(obs.identifications) > 0
+
+
+@pytest.mark.parametrize('use_orjson', [True, False])
+def test_to_json(use_orjson, monkeypatch):
+    if not use_orjson:
+        monkeypatch.setattr('pyinaturalist.models.base.orjson', None)
+    obs = Observation.from_json(j_observation_1)
+    obs_json = json.loads(obs.to_json())
+    assert obs_json['id'] == j_observation_1['id']
+    assert obs_json['created_at'] == obs.created_at.isoformat()
+    assert obs_json['location'] == list(obs.location)
+    assert Observation.from_json(obs_json).created_at == obs.created_at
+
+    obs_list = Observations.from_json([j_observation_1, j_observation_2])
+    obs_list_json = json.loads(obs_list.to_json(keys=['id']))
+    assert obs_list_json == [{'id': j_observation_1['id']}, {'id': j_observation_2['id']}]
+    assert '\n' in obs_list.to_json(indent=2)
+
+
 @define
 class ExampleModel(BaseModel):
     key: str = field(default=None)
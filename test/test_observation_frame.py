@@ -0,0 +1,156 @@
+from copy import deepcopy
+from datetime import datetime, timezone
+
+import pytest
+
+from pyinaturalist.models import Observation, ObservationFrame
+from test.sample_data import j_observation_1, j_observation_2
+
+np = pytest.importorskip('numpy')
+
+
+def _get_observations():
+    """Get observation results with a few different values to filter and group by"""
+    obs_1, obs_2, obs_3 = (
+        deepcopy(j_observation_1),
+        deepcopy(j_observation_2),
+        deepcopy(j_observation_1),
+    )
+    obs_3['id'] = 3
+    obs_3['quality_grade'] = 'needs_id'
+    obs_3['location'] = '10.0,20.0'
+    obs_3['time_observed_at'] = '2021-02-03T04:05:06+02:00'
+    obs_3['taxon'] = None
+    return [obs_1, obs_2, obs_3]
+
+
+def test_from_json_list():
+    observations = _get_observations()
+    frame = ObservationFrame.from_json_list(observations)
+    assert len(frame) == 3
+    assert frame['id'].dtype == np.int64
+    assert frame['id'].tolist() == [obs['id'] for obs in observations]
+    assert frame['taxon_id'].tolist()[2] == -1
+    assert frame['latitude'][2] == 10.0 and frame['longitude'][2] == 20.0
+    assert frame['quality_grade'].tolist() == [
+        observations[0]['quality_grade'],
+        observations[1]['quality_grade'],
+        'needs_id',
+    ]
+    # Timestamps should be converted to UTC
+    assert frame['observed_on'][2] == np.datetime64('2021-02-03T02:05:06')
+
+
+def test_from_pages():
+    observations = _get_observations()
+    frame = ObservationFrame.from_pages([observations[:2], [], observations[2:]])
+    assert frame['id'].tolist() == [obs['id'] for obs in observations]
+
+    # String codes should be shared across pages
+    assert len(set(frame['quality_grade'])) == len(frame._categories['quality_grade'])
+
+
+def test_from_json_list__empty():
+    frame = ObservationFrame.from_json_list([])
+    assert len(frame) == 0
+    assert frame.value_counts('taxon_id') == {}
+    assert frame.histogram() == {}
+
+
+def test_getitem():
+    frame = ObservationFrame.from_json_list(_get_observations())
+    assert len(frame[1:]) == 2
+    assert len(frame[[0, 2]]) == 2
+    assert len(frame[frame['id'] == 3]) == 1
+    assert isinstance(frame[0], Observation)
+    with pytest.raises(KeyError):
+        frame['invalid']
+
+
+def test_get_observation():
+    observations = _get_observations()
+    frame = ObservationFrame.from_json_list(observations)
+    obs = frame.get_observation(0)
+    assert obs.id == observations[0]['id']
+    assert obs.taxon.id == observations[0]['taxon']['id']
+    assert obs.taxon.name == observations[0]['taxon']['name']
+    assert obs.user.login == observations[0]['user']['login']
+    assert obs.quality_grade == observations[0]['quality_grade']
+    assert obs.observed_on.tzinfo == timezone.utc
+    assert frame.get_observation(2).taxon is None
+
+    # With keep_json, full records should be available, including after filtering
+    frame = ObservationFrame.from_json_list(observations, keep_json=True)
+    obs = frame[1:][0]
+    assert obs.id == observations[1]['id']
+    assert len(obs.photos) == len(observations[1]['photos'])
+
+
+def test_filter():
+    frame = ObservationFrame.from_json_list(_get_observations())
+    assert frame.filter(quality_grade='needs_id')['id'].tolist() == [3]
+    assert frame.filter(quality_grade='research')['id'].tolist() == [16227955, 57754375]
+    assert len(frame.filter(quality_grade=['needs_id', 'research'])) == 3
+    assert len(frame.filter(quality_grade='nonexistent')) == 0
+    assert frame.filter(taxon_id=None)['id'].tolist() == [3]
+    assert frame.filter(frame['id'] > 3, quality_grade='needs_id')['id'].tolist() == []
+
+
+def test_filter__mask_unchanged():
+    frame = ObservationFrame.from_json_list(_get_observations())
+    mask = np.array([True, True, True])
+    assert frame.filter(mask, quality_grade='needs_id')['id'].tolist() == [3]
+    assert mask.tolist() == [True, True, True]
+
+
+def test_captive__nullable():
+    observations = _get_observations()
+    observations[0]['captive'] = True
+    observations[1]['captive'] = False
+    observations[2].pop('captive', None)
+    frame = ObservationFrame.from_json_list(observations)
+
+    assert frame['captive'].tolist() == [True, False, None]
+    assert frame.get_observation(2).captive is None
+    assert frame.filter(captive=None)['id'].tolist() == [3]
+    assert frame.filter(captive=False)['id'].tolist() == [observations[1]['id']]
+    assert frame.value_counts('captive') == {None: 1, False: 1, True: 1}
+
+
+def test_filter_bbox():
+    frame = ObservationFrame.from_json_list(_get_observations())
+    filtered = frame.filter_bbox(nelat=11, nelng=21, swlat=9, swlng=19)
+    assert filtered['id'].tolist() == [3]
+
+
+def test_filter_dates():
+    frame = ObservationFrame.from_json_list(_get_observations())
+    assert frame.filter_dates(d1='2021-01-01')['id'].tolist() == [3]
+    assert 3 not in frame.filter_dates(d2=datetime(2021, 1, 1, tzinfo=timezone.utc))['id']
+
+
+def test_group_by():
+    observations = _get_observations()
+    frame = ObservationFrame.from_json_list(observations)
+    groups = frame.group_by('taxon_id')
+    assert groups[None]['id'].tolist() == [3]
+    for taxon_id, group in groups.items():
+        assert all(group['taxon_id'] == (-1 if taxon_id is None else taxon_id))
+    assert sum(len(group) for group in groups.values()) == 3
+
+
+def test_histogram():
+    frame = ObservationFrame.from_json_list(_get_observations())
+    histogram = frame.histogram('month')
+    assert histogram[datetime(2021, 2, 1)] == 1
+    assert sum(histogram.values()) == 3
+    with pytest.raises(ValueError):
+        frame.histogram('fortnight')
+
+
+def test_value_counts():
+    frame = ObservationFrame.from_json_list(_get_observations())
+    counts = frame.value_counts('quality_grade')
+    assert sum(counts.values()) == 3
+    assert list(counts.values()) == sorted(counts.values(), reverse=True)
+    assert counts == {'research': 2, 'needs_id': 1}
@@ -1,12 +1,23 @@
+import json
 from asyncio import get_event_loop
 from copy import deepcopy
+from datetime import date, datetime
+from time import sleep
+from typing import Iterator
 from unittest.mock import patch
 
 import pytest
+from dateutil.parser import parse as parse_date
 
 from pyinaturalist.constants import API_V1
 from pyinaturalist.models import Observation
-from pyinaturalist.paginator import Paginator, WrapperPaginator
+from pyinaturalist.paginator import (
+    IDPaginator,
+    IDRangePaginator,
+    Paginator,
+    WrapperPaginator,
+    iter_all,
+)
 from pyinaturalist.v1 import get_observations
 from test.sample_data import SAMPLE_DATA
 
@@ -113,6 +124,112 @@ async def test_async_all(requests_mock):
     assert len(observations) == 2
 
 
+@pytest.mark.asyncio
+async def test_async_iter__async_request_function():
+    """With an async request function, requests should be sent natively instead of from a thread"""
+    pages = [
+        SAMPLE_DATA['get_observations_node_page1'],
+        SAMPLE_DATA['get_observations_node_page2'],
+    ]
+
+    async def aget_observations(**kwargs):
+        return pages[kwargs['page'] - 1]
+
+    paginator = Paginator(
+        get_observations,
+        Observation,
+        per_page=1,
+        async_request_function=aget_observations,
+    )
+    with patch('pyinaturalist.paginator.ThreadPoolExecutor') as mock_executor:
+        observations = await paginator
+    assert [obs.id for obs in observations] == [57754375, 57707611]
+    mock_executor.assert_not_called()
+
+
+def test_iter_pages():
+    paginator = Paginator(_get_mock_observations(25), Observation, per_page=10)
+    pages = list(paginator.iter_pages())
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert isinstance(pages[0][0], Observation)
+
+
+def test_iter_pages__raw():
+    paginator = Paginator(_get_mock_observations(25), Observation, per_page=10)
+    pages = list(paginator.iter_pages(raw=True))
+    assert [len(page) for page in pages] == [10, 10, 5]
+    assert pages[0][0] == {'id': 1}
+
+
+def test_iter_json():
+    paginator = IDRangePaginator(_get_mock_observations(25), Observation, per_page=10)
+    results = list(paginator.iter_json())
+    assert results == [{'id': i} for i in range(1, 26)]
+
+
+def test_pipeline():
+    paginator = Paginator(_get_mock_observations(95), Observation, per_page=10)
+    pipeline = paginator.pipeline(max_pages=2)
+
+    # While processing the first page, the producer should fill the buffer and then wait
+    pages = iter(pipeline)
+    first_page = next(pages)
+    sleep(0.2)
+    assert pipeline.stats.queue_depth == 2
+    pages = [first_page, *pages]
+
+    assert [obs.id for page in pages for obs in page] == list(range(1, 96))
+    assert pipeline.stats.pages_fetched == pipeline.stats.pages_consumed == 10
+    assert pipeline.stats.queue_depth == 0
+    assert pipeline.stats.max_queue_depth == 2
+    assert pipeline.stats.producer_stall_time > 0
+
+
+def test_pipeline__max_bytes():
+    paginator = Paginator(_get_mock_observations(95), Observation, per_page=10)
+    page_size = len(json.dumps([{'id': i} for i in range(10, 20)]))
+    pipeline = paginator.pipeline(max_pages=5, max_bytes=page_size * 2, raw=True)
+
+    pages = iter(pipeline)
+    first_page = next(pages)
+    sleep(0.2)
+    pages = [first_page, *pages]
+
+    assert pages[0] == [{'id': i} for i in range(1, 11)]
+    assert pipeline.stats.pages_consumed == 10
+    assert pipeline.stats.max_queue_depth == 2
+    assert pipeline.stats.max_queued_bytes <= page_size * 2
+
+
+def test_pipeline__error():
+    request_function = _get_failing_request_function(_get_mock_observations(95), 3)
+    paginator = Paginator(request_function, Observation, per_page=10)
+
+    pages = []
+    with pytest.raises(ConnectionError):
+        for page in paginator.pipeline():
+            pages.append(page)
+    assert len(pages) == 3
+
+
+def test_iter_all(requests_mock):
+    requests_mock.get(
+        f'{API_V1}/observations',
+        [
+            {'json': SAMPLE_DATA['get_observations_node_page1'], 'status_code': 200},
+            {'json': SAMPLE_DATA['get_observations_node_page2'], 'status_code': 200},
+        ],
+    )
+
+    results = iter_all(get_observations, method='id', id=[57754375, 57707611], per_page=1)
+    assert isinstance(results, Iterator)
+    results = list(results)
+    assert [obs['id'] for obs in results] == [57754375, 57707611]
+    # Response conversions should be applied to each page
+    assert isinstance(results[0]['created_at'], datetime)
+    assert requests_mock.request_history[1].qs['id_above'] == ['57754375']
+
+
 def test_count(requests_mock):
     requests_mock.get(
         f'{API_V1}/observations?per_page=0', json={'results': [], 'total_results': 50}
@@ -150,3 +267,246 @@ def test_wrapper_paginator():
     assert len(paged_results) == paginator.count() == 10
     assert paginator.exhausted is True
     assert paginator.all() == []
+
+
+def _get_mock_observations(total_results: int):
+    """Get a mock request function that returns pages of observation results, by either page number
+    or ID range
+    """
+    all_results = [{'id': i} for i in range(1, total_results + 1)]
+
+    def get_observations(page=1, per_page=10, id_above=None, id_below=None, order='asc', **kwargs):
+        results = all_results[::-1] if order == 'desc' else all_results
+        if id_below is not None:
+            results = [r for r in results if r['id'] < id_below]
+        if id_above is not None:
+            results = [r for r in results if r['id'] > id_above][:per_page]
+        else:
+            results = results[(page - 1) * per_page : page * per_page]
+        return {'results': results, 'total_results': total_results}
+
+    return get_observations
+
+
+@pytest.mark.parametrize('prefetch', [1, 3])
+def test_prefetch__page_numbers(prefetch):
+    paginator = Paginator(_get_mock_observations(95), Observation, per_page=10, prefetch=prefetch)
+    observations = paginator.all()
+    assert [obs.id for obs in observations] == list(range(1, 96))
+    assert paginator.exhausted is True
+    assert paginator.results_fetched == 95
+
+
+def test_prefetch__page_numbers__with_limit():
+    paginator = Paginator(_get_mock_observations(95), Observation, per_page=10, prefetch=3)
+    observations = paginator.limit(25)
+    assert [obs.id for obs in observations] == list(range(1, 26))
+    assert paginator.results_fetched == 25
+
+
+@pytest.mark.parametrize('prefetch', [1, 3])
+def test_prefetch__id_range(prefetch):
+    paginator = IDRangePaginator(
+        _get_mock_observations(95), Observation, per_page=10, prefetch=prefetch
+    )
+    observations = paginator.all()
+    assert [obs.id for obs in observations] == list(range(1, 96))
+    assert paginator.id_above == 90
+
+
+def test_prefetch__id_range__error():
+    """An error raised from the background thread should be raised to the caller"""
+
+    def get_observations(id_above=None, **kwargs):
+        if id_above:
+            raise ValueError('Request failed')
+        return {'results': [{'id': 1}, {'id': 2}], 'total_results': 4}
+
+    paginator = IDRangePaginator(get_observations, Observation, per_page=2, prefetch=2)
+    with pytest.raises(ValueError):
+        paginator.all()
+
+
+@pytest.mark.parametrize('shards', [2, 4, 200])
+def test_shards(shards):
+    paginator = IDRangePaginator(
+        _get_mock_observations(95), Observation, per_page=10, shards=shards
+    )
+    observations = paginator.all()
+    assert sorted(obs.id for obs in observations) == list(range(1, 96))
+    assert paginator.exhausted is True
+    assert paginator.results_fetched == paginator.total_results == 95
+
+
+def test_shards__with_limit():
+    paginator = IDRangePaginator(_get_mock_observations(95), Observation, per_page=10, shards=4)
+    observations = paginator.limit(25)
+    assert len(observations) == len({obs.id for obs in observations}) == 25
+    assert paginator.results_fetched == 25
+
+
+def test_shards__no_results():
+    paginator = IDRangePaginator(_get_mock_observations(0), Observation, shards=4)
+    assert paginator.all() == []
+    assert paginator.total_results == 0
+
+
+def test_shards__v1(requests_mock):
+    get_mock_observations = _get_mock_observations(45)
+
+    def get_page(request, context):
+        params = {k: v[0] for k, v in request.qs.items()}
+        for key in ['per_page', 'id_above', 'id_below']:
+            if key in params:
+                params[key] = int(params[key])
+        return get_mock_observations(**params)
+
+    requests_mock.get(f'{API_V1}/observations', json=get_page, status_code=200)
+    observations = get_observations(page='all', per_page=10, shards=3)
+    assert sorted(obs['id'] for obs in observations['results']) == list(range(1, 46))
+    assert observations['total_results'] == 45
+    assert all('shards' not in request.qs for request in requests_mock.request_history)
+
+
+def _get_mock_observations_by_date():
+    """Get a mock request function for observations in Jan-Jun 2020, with most in March"""
+    days = [date(2020, 1, 15), date(2020, 2, 10)] + [date(2020, 3, 1)] * 20 + [date(2020, 6, 30)]
+    all_results = [{'id': i, 'observed_on': day} for i, day in enumerate(days, start=1)]
+
+    def get_observations(d1, d2, per_page=10, id_above=None, **kwargs):
+        d1, d2 = parse_date(str(d1)).date(), parse_date(str(d2)).date()
+        results = [r for r in all_results if d1 <= r['observed_on'] <= d2]
+        total_results = len(results)
+        results = [r for r in results if r['id'] > (id_above or 0)][:per_page]
+        return {'results': results, 'total_results': total_results}
+
+    return get_observations
+
+
+def test_shard_interval():
+    paginator = IDRangePaginator(
+        _get_mock_observations_by_date(),
+        Observation,
+        d1='2020-01-01',
+        d2='2020-06-30',
+        shards=3,
+        shard_interval='month',
+    )
+    shards = paginator._get_shards()
+    # Months with no results should be skipped, and March should be in its own window
+    assert [(shard.request_kwargs['d1'], shard.request_kwargs['d2']) for shard in shards] == [
+        (datetime(2020, 1, 1), datetime(2020, 2, 29, 23, 59)),
+        (datetime(2020, 3, 1), datetime(2020, 3, 31, 23, 59)),
+        (datetime(2020, 6, 1), '2020-06-30'),
+    ]
+    assert paginator.total_results == 23
+
+    observations = paginator.all()
+    assert sorted(obs.id for obs in observations) == list(range(1, 24))
+
+
+def test_shard_interval__missing_dates():
+    with pytest.raises(ValueError):
+        IDRangePaginator(
+            _get_mock_observations_by_date(), Observation, d1='2020-01-01', shard_interval='month'
+        )
+
+
+def test_shard_interval__missing_shards():
+    with pytest.raises(ValueError):
+        IDRangePaginator(
+            _get_mock_observations_by_date(),
+            Observation,
+            d1='2020-01-01',
+            d2='2020-06-30',
+            shard_interval='month',
+        )
+
+
+def _get_failing_request_function(request_function, n_requests: int):
+    """Wrap a mock request function to raise an error after a number of successful requests"""
+    requests_sent = []
+
+    def failing_request_function(**kwargs):
+        if len(requests_sent) >= n_requests:
+            raise ConnectionError('Request failed')
+        requests_sent.append(kwargs)
+        return request_function(**kwargs)
+
+    return failing_request_function
+
+
+@pytest.mark.parametrize('paginator_cls', [Paginator, IDRangePaginator])
+def test_checkpoint(paginator_cls, tmp_path):
+    checkpoint = tmp_path / 'checkpoint.json'
+    request_function = _get_failing_request_function(_get_mock_observations(95), 3)
+    paginator = paginator_cls(request_function, Observation, per_page=10, checkpoint=checkpoint)
+
+    # Consume results until the request fails
+    fetched_ids = []
+    with pytest.raises(ConnectionError):
+        for obs in paginator:
+            fetched_ids.append(obs.id)
+    assert fetched_ids == list(range(1, 31))
+    assert checkpoint.is_file()
+
+    # A new paginator for the same request should pick up where the last one left off
+    paginator = paginator_cls(
+        _get_mock_observations(95), Observation, per_page=10, checkpoint=checkpoint
+    )
+    fetched_ids.extend(obs.id for obs in paginator)
+    assert fetched_ids == list(range(1, 96))
+    assert paginator.results_fetched == paginator.total_results == 95
+    assert not checkpoint.exists()
+
+
+def test_checkpoint__different_request(tmp_path):
+    checkpoint = tmp_path / 'checkpoint.json'
+    request_function = _get_failing_request_function(_get_mock_observations(95), 3)
+    paginator = IDRangePaginator(
+        request_function, Observation, per_page=10, checkpoint=checkpoint, taxon_id=1
+    )
+    with pytest.raises(ConnectionError):
+        paginator.all()
+
+    paginator = IDRangePaginator(
+        _get_mock_observations(95), Observation, per_page=10, checkpoint=checkpoint, taxon_id=2
+    )
+    assert len(paginator.all()) == 95
+
+
+def test_checkpoint__with_shards(tmp_path):
+    paginator = IDRangePaginator(
+        _get_mock_observations(95), Observation, shards=2, checkpoint=tmp_path / 'checkpoint.json'
+    )
+    with pytest.raises(ValueError):
+        paginator.all()
+
+
+def _get_observations_by_id(observation_ids, **kwargs):
+    # Delay responses for earlier IDs, so concurrent requests complete out of order
+    sleep(0.05 if observation_ids[0] == 1 else 0)
+    return {'results': [{'id': i} for i in observation_ids]}
+
+
+def test_id_paginator__workers():
+    paginator = IDPaginator(
+        _get_observations_by_id, Observation, ids=range(1, 11), ids_per_request=2, workers=3
+    )
+    observations = paginator.all()
+    assert [obs.id for obs in observations] == list(range(1, 11))
+    assert paginator.results_fetched == 10
+
+
+def test_id_paginator__workers__unordered():
+    paginator = IDPaginator(
+        _get_observations_by_id,
+        Observation,
+        ids=range(1, 11),
+        ids_per_request=2,
+        workers=3,
+        ordered=False,
+    )
+    observation_ids = [obs.id for obs in paginator.all()]
+    assert sorted(observation_ids) == list(range(1, 11))
+    assert observation_ids[0] != 1
@@ -5,6 +5,7 @@ import pytest
 from dateutil.tz import gettz
 
 from pyinaturalist.request_params import (
+    canonicalize_list_params,
     convert_bool_params,
     convert_datetime_params,
     convert_list_params,
@@ -39,6 +40,28 @@ def test_convert_bool_params():
     assert params['only_id'] == 'true'
 
 
+def test_canonicalize_list_params():
+    params = {
+        'taxon_id': [3, '1', 20, 3],
+        'place_id': '20, 3,1',
+        'rank': ['species', 'genus'],
+        'order_by': ['votes', 'id'],
+        'only_id': 'True',
+        'q': 'a,b',
+    }
+    assert canonicalize_list_params(params) == {
+        'taxon_id': ['1', '3', '20'],
+        'place_id': ['1', '3', '20'],
+        'rank': ['genus', 'species'],
+        'order_by': ['votes', 'id'],
+        'only_id': 'true',
+        'q': 'a,b',
+    }
+
+    # Free-text params should not be changed, even if they look like booleans or lists
+    assert canonicalize_list_params({'q': 'True'}) == {'q': 'True'}
+
+
 # Test some recognized date(time) formats, with and without TZ info, in date and non-date params
 @pytest.mark.parametrize(
     'param, value, expected',
@@ -48,6 +71,7 @@ def test_convert_bool_params():
         ('created_on', '2010-10-10 10:10:10-05:00', '2010-10-10T10:10:10-05:00'),
         ('created_on', 'Jan 1 2000', '2000-01-01T00:00:00-08:00'),
         ('d1', '19970716', '1997-07-16T00:00:00-07:00'),
+        ('d1', date(1997, 7, 16), '1997-07-16T00:00:00-07:00'),
         ('q', date(1954, 2, 5), '1954-02-05'),
         ('q', datetime(1954, 2, 5), '1954-02-05T00:00:00-08:00'),
         ('q', 'not a datetime', 'not a datetime'),
@@ -224,6 +248,11 @@ def test_normalize_rank_params():
     assert normalize_rank_params(params) == expected
 
 
+def test_normalize_rank_params__str_list():
+    params = {'rank': 'Sub-Species, spp'}
+    assert normalize_rank_params(params) == {'rank': ['subspecies', 'species']}
+
+
 def test_validate_multiple_choice_param():
     params = {
         'param1': 'valid_str',
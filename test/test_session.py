@@ -1,3 +1,6 @@
+import asyncio
+import threading
+from datetime import date, datetime
 from io import BytesIO
 from time import sleep
 from unittest.mock import patch
@@ -5,12 +8,12 @@ from unittest.mock import patch
 import pytest
 import urllib3.util.retry
 from requests import Request, Session
-from requests_ratelimiter import Limiter, RequestRate
+from requests_ratelimiter import Limiter, MemoryListBucket, RequestRate
 from urllib3.exceptions import MaxRetryError
 
-from pyinaturalist.constants import CACHE_EXPIRATION, REQUEST_TIMEOUT
+from pyinaturalist.constants import CACHE_EXPIRATION, CACHE_FILE, REQUEST_TIMEOUT
 from pyinaturalist.session import (
-    CACHE_FILE,
+    AsyncClientSession,
     ClientSession,
     FileLockSQLiteBucket,
     MockResponse,
@@ -228,6 +231,40 @@ def test_get_local_session():
     assert isinstance(session_1, ClientSession)
 
 
+# Logically identical requests should have the same cache key, regardless of value order or format
+@pytest.mark.parametrize(
+    'params_1, params_2',
+    [
+        ({'taxon_id': [1, 2]}, {'taxon_id': [2, 1]}),
+        ({'taxon_id': [1, 2]}, {'taxon_id': '2,1'}),
+        ({'taxon_id': [1, 2]}, {'taxon_id': (2, 1, 1)}),
+        ({'user_id': ['b', 'a'], 'q': 'x'}, {'q': 'x', 'user_id': 'a, b'}),
+        ({'captive': True}, {'captive': 'true'}),
+        ({'captive': 'True'}, {'captive': 'true'}),
+        ({'rank': ['spp', 'Genus']}, {'rank': ['genus', 'species']}),
+        ({'rank': 'genus,subspecies'}, {'rank': ['ssp', 'genus']}),
+        ({'d1': date(2020, 1, 1)}, {'d1': '2020-01-01'}),
+        ({'d1': 'Jan 1 2020'}, {'d1': '20200101'}),
+        ({'created_d1': datetime(2020, 1, 1)}, {'created_d1': '2020-01-01T00:00:00'}),
+    ],
+)
+def test_cache_key__equivalent_params(params_1, params_2):
+    session = ClientSession(cache_backend='memory')
+    request_1 = session.prepare_inat_request('GET', 'https://url', params=params_1).prepare()
+    request_2 = session.prepare_inat_request('GET', 'https://url', params=params_2).prepare()
+
+    assert session.cache.create_key(request_1) == session.cache.create_key(request_2)
+
+
+def test_cache_key__ordered_params():
+    session = ClientSession(cache_backend='memory')
+    request_1 = session.prepare_inat_request('GET', 'https://url', params={'taxon_id': [2, 1]})
+    request_2 = session.prepare_inat_request('GET', 'https://url', params={'order_by': 'votes,id'})
+
+    assert request_1.params == {'taxon_id': '1,2'}
+    assert request_2.params == {'order_by': 'votes,id'}
+
+
 @pytest.mark.enable_client_session
 def test_clear_cache():
     session = get_local_session()
@@ -261,3 +298,183 @@ def test_get_refresh_params():
     assert get_refresh_params('test') == {'refresh': True, 'v': 2}
     sleep(2)
     assert get_refresh_params('test') == {'refresh': True}
+
+
+@pytest.fixture
+def async_session(tmp_path):
+    """An AsyncClientSession with a temporary cache and no rate-limiting delays"""
+    session = AsyncClientSession(
+        cache_file=tmp_path / 'cache.db',
+        bucket_class=MemoryListBucket,
+        backoff_factor=0,
+    )
+    return session
+
+
+def _make_app(responses):
+    """Make an aiohttp app that returns the given responses in order, for any path. Also returns a
+    list of received requests.
+    """
+    from aiohttp import web
+
+    requests_received = []
+
+    async def handler(request):
+        response = responses[min(len(requests_received), len(responses) - 1)]
+        requests_received.append(request)
+        return web.Response(content_type='application/json', **response)
+
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', handler)
+    return app, requests_received
+
+
+@pytest.mark.asyncio
+@pytest.mark.enable_client_session
+async def test_async_session__arequest(async_session):
+    from aiohttp.test_utils import TestServer
+
+    app, requests_received = _make_app([{'text': '{"results": ["response object"]}'}])
+    async with TestServer(app) as server, async_session:
+        url = str(server.make_url('/observations'))
+        response = await async_session.arequest('GET', url, id=[1, 2])
+        assert response.json() == {'results': ['response object']}
+        assert response.request.url == f'{url}?id=1%2C2'
+        assert response.from_cache is False
+
+        # The second request should be cached, and shared with the synchronous session methods
+        response = await async_session.arequest('GET', url, id=[1, 2])
+        assert response.from_cache is True
+        assert async_session.get(url, id=[1, 2]).from_cache is True
+        assert len(requests_received) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.enable_client_session
+async def test_async_session__retry_status(async_session):
+    from aiohttp.test_utils import TestServer
+
+    app, requests_received = _make_app(
+        [{'status': 503}, {'status': 502}, {'text': '{"results": []}'}]
+    )
+    async with TestServer(app) as server, async_session:
+        response = await async_session.aget(str(server.make_url('/observations')))
+        assert response.json() == {'results': []}
+        assert len(requests_received) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.enable_client_session
+async def test_async_session__retry_failure(async_session):
+    from aiohttp.test_utils import TestServer
+
+    app, requests_received = _make_app([{'status': 503}])
+    async with TestServer(app) as server, async_session:
+        with pytest.raises(MaxRetryError):
+            await async_session.aget(str(server.make_url('/observations')))
+        assert len(requests_received) == async_session.retries.total + 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.enable_client_session
+async def test_async_session__validate_json__retry_success(async_session):
+    from aiohttp.test_utils import TestServer
+
+    app, requests_received = _make_app(
+        [{'text': '{"results": "invalid respo'}, {'text': '{"results": "valid"}'}]
+    )
+    async with TestServer(app) as server, async_session:
+        response = await async_session.aget(str(server.make_url('/observations')))
+        assert response.json() == {'results': 'valid'}
+        assert len(requests_received) == 2
+
+
+def test_async_session__multiple_event_loops():
+    """An open aiohttp session shouldn't be reused (or orphaned) by a different event loop, but a new
+    one can be created after closing it
+    """
+    session = AsyncClientSession()
+
+    async def get_async_session():
+        return session._get_async_session()
+
+    async def get_and_close_async_session():
+        aiohttp_session = session._get_async_session()
+        await session.aclose()
+        return aiohttp_session
+
+    loop = asyncio.new_event_loop()
+    try:
+        aiohttp_session = loop.run_until_complete(get_async_session())
+        with pytest.raises(RuntimeError):
+            asyncio.run(get_async_session())
+        assert session._async_session is aiohttp_session
+
+        loop.run_until_complete(session.aclose())
+        assert aiohttp_session.closed
+    finally:
+        loop.close()
+
+    assert asyncio.run(get_and_close_async_session()) is not aiohttp_session
+
+
+@pytest.mark.asyncio
+@pytest.mark.enable_client_session
+async def test_async_session__wrap_async(async_session):
+    """A wrapped request function should send all of its requests from the event loop, and return
+    its usual result
+    """
+    from aiohttp.test_utils import TestServer
+
+    app, requests_received = _make_app([{'text': '{"id": 1}'}, {'text': '{"id": 2}'}])
+
+    def get_both(url, session):
+        response_1 = session.get(f'{url}/1').json()
+        response_2 = session.get(f'{url}/2').json()
+        return [response_1['id'], response_2['id']]
+
+    async with TestServer(app) as server, async_session:
+        url = str(server.make_url('/observations'))
+        aget_both = async_session.wrap_async(get_both)
+        with patch('requests.adapters.HTTPAdapter.send') as mock_send:
+            assert await aget_both(url, async_session) == [1, 2]
+        mock_send.assert_not_called()
+        assert len(requests_received) == 2
+
+        # Outside of the wrapped function, synchronous requests are sent as usual
+        assert async_session.get(f'{url}/1').from_cache is True
+
+
+@pytest.mark.asyncio
+@patch.object(AsyncClientSession, '_asend')
+async def test_async_session__cache_io_in_thread(mock_send):
+    """Cache reads and writes should not block the event loop"""
+    threads = set()
+    mock_send.return_value = MockResponse(
+        Request('GET', 'http://url').prepare(),
+        headers={'Content-Type': 'application/json'},
+        content=b'{}',
+    )
+    session = AsyncClientSession()
+    get_response, save_response = session.cache.get_response, session.cache.save_response
+
+    def record_thread(func):
+        def wrapper(*args, **kwargs):
+            threads.add(threading.get_ident())
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    with patch.object(session.cache, 'get_response', record_thread(get_response)), patch.object(
+        session.cache, 'save_response', record_thread(save_response)
+    ):
+        await session.aget('http://url')
+    assert threads and threading.get_ident() not in threads
+
+
+@pytest.mark.asyncio
+@patch.object(AsyncClientSession, '_asend')
+async def test_async_session__dry_run(mock_send):
+    response = await AsyncClientSession().arequest('GET', 'http://url', dry_run=True)
+    assert response.reason == 'DRY_RUN'
+    mock_send.assert_not_called()
@@ -0,0 +1,164 @@
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+from requests import HTTPError
+
+from pyinaturalist.constants import API_V1
+from pyinaturalist.sync import ObservationStore
+
+
+def _mock_observations(requests_mock, observations, fail_after=None):
+    """Mock GET /observations with filtering by updated_since and pagination by id_above"""
+
+    def get_observations(request, context):
+        if fail_after is not None and len(requests_mock.request_history) > fail_after:
+            context.status_code = 400
+            return {}
+        params = {k: v[0] for k, v in request.qs.items()}
+        results = sorted(
+            [obs for obs in observations if obs['updated_at'] > params.get('updated_since', '')],
+            key=lambda obs: obs['id'],
+        )
+        total_results = len(results)
+        id_above = int(params.get('id_above', 0))
+        results = [obs for obs in results if obs['id'] > id_above][: int(params['per_page'])]
+        return {'results': results, 'total_results': total_results}
+
+    requests_mock.get(f'{API_V1}/observations', json=get_observations, status_code=200)
+
+
+def _get_observations(ids, updated_at='2020-01-01t00:00:00+00:00'):
+    return [{'id': i, 'updated_at': updated_at} for i in ids]
+
+
+def test_sync(requests_mock, tmp_path):
+    store = ObservationStore(tmp_path / 'observations.db')
+    _mock_observations(requests_mock, _get_observations(range(1, 6)))
+
+    result = store.sync(place_id=1, per_page=2)
+    assert (result.inserted, result.updated, result.unchanged) == (5, 0, 0)
+    assert result.updated_since is None
+    assert len(store) == 5 and 3 in store
+    assert [obs['id'] for obs in store] == [1, 2, 3, 4, 5]
+    assert 'updated_since' not in requests_mock.request_history[0].qs
+
+    # Only changed records should be requested on the next sync
+    updated_since = store.get_updated_since(place_id=1)
+    assert updated_since == '2019-12-31T23:55:00+00:00'
+    changed = _get_observations([2, 6], updated_at='2999-01-01t00:00:00+00:00')
+    _mock_observations(requests_mock, _get_observations([1, 3, 4, 5]) + changed)
+
+    result = store.sync(place_id=1, per_page=2)
+    assert (result.inserted, result.updated, result.unchanged) == (1, 1, 4)
+    assert result.updated_since == updated_since
+    assert requests_mock.last_request.qs['updated_since'] == [updated_since.lower()]
+    assert len(store) == 6
+    assert store.get(2)['updated_at'] == '2999-01-01t00:00:00+00:00'
+
+
+def test_sync__separate_queries(requests_mock, tmp_path):
+    store = ObservationStore(tmp_path / 'observations.db')
+    _mock_observations(requests_mock, _get_observations(range(1, 6)))
+
+    store.sync(place_id=1)
+    assert store.get_updated_since(place_id=1) is not None
+    assert store.get_updated_since(place_id=2) is None
+
+
+def test_sync__resume(requests_mock, tmp_path):
+    store = ObservationStore(tmp_path / 'observations.db')
+    _mock_observations(requests_mock, _get_observations(range(1, 6)), fail_after=2)
+    with pytest.raises(HTTPError):
+        store.sync(place_id=1, per_page=2)
+    assert len(store) == 4
+    assert store.get_updated_since(place_id=1) is None
+
+    # The next sync should continue after the last saved page
+    requests_mock.reset()
+    _mock_observations(requests_mock, _get_observations(range(1, 6)))
+    result = store.sync(place_id=1, per_page=2)
+    assert result.inserted == 1
+    assert requests_mock.request_history[0].qs['id_above'] == ['4']
+    assert store.get_updated_since(place_id=1) is not None
+
+
+def test_sync__clock_skew(requests_mock, tmp_path):
+    """The high-water mark should come from server timestamps, so records updated on the server
+    after a sync are still fetched, regardless of the local clock
+    """
+    store = ObservationStore(tmp_path / 'observations.db')
+    _mock_observations(requests_mock, _get_observations(range(1, 4)))
+    local_time = datetime(2999, 1, 1, tzinfo=timezone.utc)
+    with patch('pyinaturalist.sync.datetime') as mock_datetime:
+        mock_datetime.now.return_value = local_time
+        store.sync(place_id=1)
+    assert store.get_updated_since(place_id=1) == '2019-12-31T23:55:00+00:00'
+
+    # Updated on the server after the first sync, but with a time long before the local clock
+    changed = _get_observations([2], updated_at='2020-01-01t00:01:00+00:00')
+    _mock_observations(requests_mock, _get_observations([1, 3]) + changed)
+    result = store.sync(place_id=1)
+    assert result.updated == 1
+    assert store.get(2)['updated_at'] == '2020-01-01t00:01:00+00:00'
+    assert store.get_updated_since(place_id=1) == '2019-12-31T23:56:00+00:00'
+
+
+def test_sync__timezones(requests_mock, tmp_path):
+    """Timestamps with different UTC offsets should be compared as absolute times"""
+    store = ObservationStore(tmp_path / 'observations.db')
+    observations = _get_observations([1], updated_at='2020-01-01T12:00:00+00:00')
+    observations += _get_observations([2], updated_at='2020-01-01T08:00:00-08:00')
+    _mock_observations(requests_mock, observations)
+
+    store.sync(place_id=1)
+    assert store.get_updated_since(place_id=1) == '2020-01-01T15:55:00+00:00'
+
+
+def test_sync__no_results(requests_mock, tmp_path):
+    store = ObservationStore(tmp_path / 'observations.db')
+    _mock_observations(requests_mock, _get_observations(range(1, 4)))
+    store.sync(place_id=1)
+    updated_since = store.get_updated_since(place_id=1)
+
+    result = store.sync(place_id=1)
+    assert result.total == 3  # Records within the overlap window are fetched again
+    assert result.unchanged == 3
+    assert store.get_updated_since(place_id=1) == updated_since
+
+    _mock_observations(requests_mock, [])
+    store.sync(place_id=1)
+    assert store.get_updated_since(place_id=1) == updated_since
+
+
+def test_sync__explicit_updated_since(requests_mock, tmp_path):
+    store = ObservationStore(tmp_path / 'observations.db')
+    observations = _get_observations([1, 2]) + _get_observations(
+        [3, 4], updated_at='2021-01-01t00:00:00+00:00'
+    )
+    _mock_observations(requests_mock, observations)
+
+    result = store.sync(place_id=1, updated_since='2020-06-01T00:00:00+00:00')
+    assert result.inserted == 2 and 1 not in store
+    assert result.updated_since == '2020-06-01T00:00:00+00:00'
+    assert requests_mock.last_request.qs['updated_since'] == ['2020-06-01t00:00:00+00:00']
+    assert store.get_updated_since(place_id=1) == '2020-12-31T23:55:00+00:00'
+
+    # An earlier time overrides the stored high-water mark
+    result = store.sync(place_id=1, updated_since=datetime(2019, 1, 1, tzinfo=timezone.utc))
+    assert (result.inserted, result.unchanged) == (2, 2)
+    assert len(store) == 4
+
+
+def test_sync__resume_with_different_updated_since(requests_mock, tmp_path):
+    """An interrupted sync should start over if the next one is for a different time range"""
+    store = ObservationStore(tmp_path / 'observations.db')
+    _mock_observations(requests_mock, _get_observations(range(1, 6)), fail_after=2)
+    with pytest.raises(HTTPError):
+        store.sync(place_id=1, per_page=2)
+
+    requests_mock.reset()
+    _mock_observations(requests_mock, _get_observations(range(1, 6)))
+    result = store.sync(place_id=1, per_page=2, updated_since='2019-01-01T00:00:00+00:00')
+    assert (result.inserted, result.unchanged) == (1, 4)
+    assert 'id_above' not in requests_mock.request_history[0].qs
@@ -20,7 +20,7 @@ CLASS_THOUGH_PHYLUM = ['class', 'superclass', 'subphylum', 'phylum']
 
 
 def test_get_taxa(requests_mock):
-    params = {'q': 'vespi', 'rank': 'genus,subgenus,species'}
+    params = {'q': 'vespi', 'rank': 'genus,species,subgenus'}
     requests_mock.get(
         f'{API_V1}/taxa?{urlencode(params)}',
         json=load_sample_data('get_taxa.json'),